@@ -2,29 +2,65 @@ from reportlab.lib.pagesizes import A4, landscape
 from reportlab.lib import colors
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.platypus import (
-    SimpleDocTemplate, Paragraph, Table, TableStyle, Spacer, Image, PageBreak,
+    SimpleDocTemplate, Paragraph, Spacer, Image, PageBreak,
     PageTemplate, Frame, NextPageTemplate, BaseDocTemplate
 )
-from reportlab.graphics.shapes import Drawing, Line, Rect, Path, String
+from reportlab.graphics.shapes import Drawing, Group, Line, Rect, Path, PolyLine, String
 from reportlab.lib.units import mm
 from reportlab.pdfbase.pdfmetrics import stringWidth
+import io
 import os
 import sys
 import json
-import matplotlib.pyplot as plt  
-import matplotlib
+import logging
+import hashlib
+import traceback
+from datetime import datetime
+from functools import lru_cache
+from types import MappingProxyType
 import numpy as np
 
-# Set matplotlib to use non-interactive backend
-matplotlib.use('Agg')
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+# ECG paper colours (parsed once - HexColor re-parses the string on every call)
+_BG_COLOR = colors.HexColor("#ffe6e6")          # Light pink background
+_MINOR_GRID_COLOR = colors.HexColor("#ffd1d1")  # Minor (1mm) grid
+_MAJOR_GRID_COLOR = colors.HexColor("#ffb3b3")  # Major (5mm) grid
+_ECG_BLACK = colors.HexColor("#000000")         # Waveforms, notches, text
+_CONCLUSION_HEADER_COLOR = colors.HexColor("#2c3e50")
+
+# Lead PNG (matplotlib) grid style - shared by the drawing code and the grid PNG cache key
+_LEAD_PNG_BG_COLOR = "#ffe6e6"
+_LEAD_PNG_MINOR_GRID = MappingProxyType({'colors': "#ffd1d1", 'linewidth': 0.6, 'alpha': 0.8})
+_LEAD_PNG_MAJOR_GRID = MappingProxyType({'colors': "#ffb3b3", 'linewidth': 1.0, 'alpha': 0.9})
+_LEAD_PNG_GRID_LINE = MappingProxyType({'linestyles': 'solid', 'clip_on': True})
+_LEAD_PNG_MINOR_DIVISIONS = (60, 20)  # (x, y) 1mm boxes
+_LEAD_PNG_MAJOR_DIVISIONS = (12, 4)   # (x, y) 5mm boxes
+_LEAD_GRID_PNG_SIZE = (6, 2)          # inches
+_LEAD_GRID_PNG_DPI = 200
+_LEAD_GRID_PNG_PAD = 0.05
+
+logger = logging.getLogger(__name__)
+# Verbose save/load diagnostics: set ECG_REPORT_LOG_LEVEL=DEBUG (or INFO) to enable
+_log_level = os.environ.get("ECG_REPORT_LOG_LEVEL")
+if _log_level:
+    logger.setLevel(_log_level.upper())
 
 # ------------------------ Resource path helper for PyInstaller compatibility ------------------------
 
+@lru_cache(maxsize=None)
 def _get_resource_path(relative_path):
     """
     Get resource path that works both in development and when packaged as exe.
     For PyInstaller: resources are in sys._MEIPASS
     For development: resources are relative to project root
+    Memoized per relative_path; the module is re-executed for every report,
+    so the cache only spans one report.
     """
     try:
         # PyInstaller creates a temp folder and stores path in _MEIPASS
@@ -40,6 +76,12 @@ def _get_resource_path(relative_path):
 
 # ==================== ECG DATA SAVE/LOAD FUNCTIONS ====================
 
+def _json_default(obj):
+    """json.dump fallback for NumPy arrays/scalars (orjson handles these natively)"""
+    if isinstance(obj, (np.ndarray, np.generic)):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
 def save_ecg_data_to_file(ecg_test_page, output_file=None):
     """
     Save ECG data from ecg_test_page.data to a JSON file
@@ -49,10 +91,8 @@ def save_ecg_data_to_file(ecg_test_page, output_file=None):
         saved_file = save_ecg_data_to_file(ecg_test_page)
         # Saved to: reports/ecg_data/ecg_data_20241119_143022.json
     """
-    from datetime import datetime
-    
     if not ecg_test_page or not hasattr(ecg_test_page, 'data'):
-        print(" No ECG test page data available to save")
+        logger.warning("No ECG test page data available to save")
         return None
     
     # Create output directory
@@ -82,17 +122,16 @@ def save_ecg_data_to_file(ecg_test_page, output_file=None):
     # Save each lead's data - use FULL buffer (ecg_buffers if available, otherwise data)
     # Priority: Use ecg_buffers (5000 samples) if available, otherwise use data (1000 samples)
     
-    # Debug: Check what attributes ecg_test_page has
-    print(f" DEBUG: ecg_test_page attributes check:")
-    print(f"   has ecg_buffers: {hasattr(ecg_test_page, 'ecg_buffers')}")
-    print(f"   has data: {hasattr(ecg_test_page, 'data')}")
-    print(f"   has ptrs: {hasattr(ecg_test_page, 'ptrs')}")
-    if hasattr(ecg_test_page, 'ecg_buffers'):
-        print(f"   ecg_buffers length: {len(ecg_test_page.ecg_buffers) if ecg_test_page.ecg_buffers else 0}")
-    if hasattr(ecg_test_page, 'data'):
-        print(f"   data length: {len(ecg_test_page.data) if ecg_test_page.data else 0}")
-        if ecg_test_page.data and len(ecg_test_page.data) > 0:
-            print(f"   data[0] length: {len(ecg_test_page.data[0]) if isinstance(ecg_test_page.data[0], (list, np.ndarray)) else 'N/A'}")
+    # Debug: Check what attributes ecg_test_page has (formatted only when DEBUG is enabled)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("ecg_test_page attributes check: has ecg_buffers=%s, has data=%s, has ptrs=%s",
+                     hasattr(ecg_test_page, 'ecg_buffers'), hasattr(ecg_test_page, 'data'), hasattr(ecg_test_page, 'ptrs'))
+        if hasattr(ecg_test_page, 'ecg_buffers'):
+            logger.debug("ecg_buffers length: %d", len(ecg_test_page.ecg_buffers) if ecg_test_page.ecg_buffers else 0)
+        if hasattr(ecg_test_page, 'data'):
+            logger.debug("data length: %d", len(ecg_test_page.data) if ecg_test_page.data else 0)
+            if ecg_test_page.data and len(ecg_test_page.data) > 0:
+                logger.debug("data[0] length: %s", len(ecg_test_page.data[0]) if isinstance(ecg_test_page.data[0], (list, np.ndarray)) else 'N/A')
     
     for i, lead_name in enumerate(lead_names):
         data_to_save = []
@@ -110,57 +149,62 @@ def save_ecg_data_to_file(ecg_test_page, output_file=None):
                     # Get all available data from buffer, starting from ptr
                     if ptr + len(buffer) <= len(buffer):
                         # No wrap needed: get from ptr to end, then from start to ptr
-                        part1 = buffer[ptr:].tolist()
-                        part2 = buffer[:ptr].tolist()
-                        data_to_save = part1 + part2  # Full circular buffer
+                        # (single NumPy copy instead of two tolist() calls + list concat)
+                        data_to_save = np.concatenate((buffer[ptr:], buffer[:ptr]))  # Full circular buffer
                     else:
-                        # Simple case: use all buffer data
-                        data_to_save = buffer.tolist()
+                        # Simple case: use all buffer data (kept as ndarray - serialized natively)
+                        data_to_save = np.ascontiguousarray(buffer)
                 else:
                     # No ptrs: use ALL available data (full buffer)
-                    data_to_save = buffer.tolist()
+                    data_to_save = np.ascontiguousarray(buffer)
         
         # Priority 2: Fallback to ecg_test_page.data (smaller buffer, 1000 samples)
-        if not data_to_save and i < len(ecg_test_page.data):
+        if len(data_to_save) == 0 and i < len(ecg_test_page.data):
             lead_data = ecg_test_page.data[i]
             if isinstance(lead_data, np.ndarray):
                 # Use ALL available data (not just window_size)
-                data_to_save = lead_data.tolist()
+                data_to_save = np.ascontiguousarray(lead_data)
             elif isinstance(lead_data, (list, tuple)):
                 data_to_save = list(lead_data)
         
-        saved_data["leads"][lead_name] = data_to_save if data_to_save else []
+        saved_data["leads"][lead_name] = data_to_save if len(data_to_save) > 0 else []
     
     # Check if we have sufficient data for report generation
-    sample_counts = [len(saved_data["leads"][lead]) for lead in saved_data["leads"] if saved_data["leads"][lead]]
-    if sample_counts:
-        max_samples = max(sample_counts)
-        min_samples = min(sample_counts)
-        print(f" Buffer analysis: Max samples={max_samples}, Min samples={min_samples}")
+    sample_counts = np.fromiter((len(v) for v in saved_data["leads"].values()), dtype=np.int64)
+    sample_counts = sample_counts[sample_counts > 0]
+    if sample_counts.size:
+        max_samples = int(sample_counts.max())
+        min_samples = int(sample_counts.min())
+        logger.debug("Buffer analysis: Max samples=%d, Min samples=%d", max_samples, min_samples)
         
         # Calculate expected samples for 13.2s window at current sampling rate
         sampling_rate = saved_data.get("sampling_rate", 80.0)
         expected_samples_for_13_2s = int(13.2 * sampling_rate)
         
         if max_samples < expected_samples_for_13_2s:
-            print(f" WARNING: Buffer has only {max_samples} samples, need {expected_samples_for_13_2s} for 13.2s window")
-            print(f"   Current time window: {max_samples/sampling_rate:.2f}s")
-            print(f"   Expected time window: 13.2s")
-            print(f"    TIP: Run ECG for at least 15-20 seconds to accumulate sufficient data")
+            logger.warning("Buffer has only %d samples, need %d for 13.2s window (current window: %.2fs). "
+                           "Run ECG for at least 15-20 seconds to accumulate sufficient data",
+                           max_samples, expected_samples_for_13_2s, max_samples / sampling_rate)
     
-    # Save to file
+    # Save to file (compact JSON - orjson serializes the ndarrays without a Python loop)
     try:
-        with open(output_file, 'w') as f:
-            json.dump(saved_data, f, indent=2)
-        print(f"Saved ECG data to: {output_file}")
-        print(f"   Leads saved: {list(saved_data['leads'].keys())}")
-        print(f"   Sampling rate: {saved_data['sampling_rate']} Hz")
-        print(f"   Total data points per lead: {[len(saved_data['leads'][lead]) for lead in saved_data['leads']]}")
+        if ORJSON_AVAILABLE:
+            try:
+                payload = orjson.dumps(saved_data, option=orjson.OPT_SERIALIZE_NUMPY)
+            except TypeError:
+                # Unsupported dtype (e.g. object arrays) - let stdlib json convert it
+                payload = json.dumps(saved_data, default=_json_default).encode('utf-8')
+            with open(output_file, 'wb') as f:
+                f.write(payload)
+        else:
+            with open(output_file, 'w') as f:
+                json.dump(saved_data, f, default=_json_default)
+        logger.info("Saved ECG data to: %s (%d leads, %s Hz)", output_file, len(saved_data['leads']), saved_data['sampling_rate'])
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Total data points per lead: %s", [len(saved_data['leads'][lead]) for lead in saved_data['leads']])
         return output_file
     except Exception as e:
-        print(f" Error saving ECG data: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error saving ECG data: %s", e)
         return None
 
 def load_ecg_data_from_file(file_path):
@@ -176,11 +220,11 @@ def load_ecg_data_from_file(file_path):
         with open(file_path, 'r') as f:
             data = json.load(f)
         
-        # Convert lists back to numpy arrays
+        # Convert lists back to numpy arrays - once, as float32 (what the report pipeline uses)
         if 'leads' in data:
             for lead_name in data['leads']:
                 if isinstance(data['leads'][lead_name], list):
-                    data['leads'][lead_name] = np.array(data['leads'][lead_name])
+                    data['leads'][lead_name] = np.asarray(data['leads'][lead_name], dtype=np.float32)
         
         print(f" Loaded ECG data from: {file_path}")
         print(f"   Leads loaded: {list(data.get('leads', {}).keys())}")
@@ -188,7 +232,6 @@ def load_ecg_data_from_file(file_path):
         return data
     except Exception as e:
         print(f" Error loading ECG data: {e}")
-        import traceback
         traceback.print_exc()
         return None
 
@@ -249,52 +292,80 @@ def calculate_time_window_from_bpm_and_wave_speed(hr_bpm, wave_speed_mm_s, desir
     
     return calculated_time_window, num_samples
 
+@lru_cache(maxsize=8)
+def _qrs_bandpass(fs):
+    """
+    2nd-order 0.5-40 Hz Butterworth band-pass (b, a) used for all R-peak detection
+    Designed once per sampling rate - every lead analysed at that rate reuses it
+    """
+    from scipy.signal import butter
+    nyq = fs / 2.0
+    return butter(2, [max(0.5 / nyq, 0.001), min(40.0 / nyq, 0.99)], btype='band')
+
+def _qrs_filter(samples, fs):
+    """Zero-phase 0.5-40 Hz band-pass of one lead (filtfilt with the cached coefficients)"""
+    from scipy.signal import filtfilt
+    b, a = _qrs_bandpass(fs)
+    return filtfilt(b, a, np.asarray(samples))
+
+def _detect_r_peaks(filtered, fs):
+    """
+    Pan-Tompkins style R-peak indices from a band-passed lead:
+    squared first difference, 150 ms moving average, peaks above mean + 0.5*std, >= 600 ms apart
+    """
+    from scipy.signal import find_peaks
+    squared = np.diff(filtered)
+    np.square(squared, out=squared)  # squared in place - no second temporary
+    win = max(1, int(0.15 * fs))
+    # Moving average as a prefix-sum difference (O(N), no kernel) - same window alignment
+    # as np.convolve(squared, np.ones(win) / win, mode='same'): win//2 samples back, (win-1)//2 ahead
+    csum = np.cumsum(np.concatenate((np.zeros(win // 2 + 1), squared, np.zeros((win - 1) // 2))))
+    env = (csum[win:] - csum[:-win]) / win
+    thr = np.mean(env) + 0.5 * np.std(env)
+    r_peaks, _ = find_peaks(env, height=thr, distance=int(0.6 * fs))
+    return r_peaks
+
 def create_ecg_grid_with_waveform(ecg_data, lead_name, width=6, height=2):
     """
     Create ECG graph with pink grid background and dark ECG waveform
     Returns: matplotlib figure with pink ECG grid background
+    
+    Built as a bare Figure on an Agg canvas (not pyplot): no global figure
+    registry to close, no GUI backend switch, safe to use off the main thread.
+    matplotlib is imported here because only the optional lead PNGs need it.
     """
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    
     # Create figure with pink background
-    fig, ax = plt.subplots(figsize=(width, height), facecolor='#ffe6e6', frameon=True)
+    fig = Figure(figsize=(width, height), facecolor=_LEAD_PNG_BG_COLOR, frameon=True)
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot(111)
     
     # STEP 1: Create pink ECG grid background
     # ECG grid colors (even lighter pink/red like medical ECG paper)
-    light_grid_color = '#ffd1d1'  # Darker minor grid
-    major_grid_color = '#ffb3b3'  # Darker major grid
-    bg_color = '#ffe6e6'  # Very light pink background
+    bg_color = _LEAD_PNG_BG_COLOR  # Very light pink background
     
     # Set both figure and axes background to pink
     fig.patch.set_facecolor(bg_color)  # Figure background pink
     ax.set_facecolor(bg_color)         # Axes background pink
     
-    # STEP 2: Draw pink ECG grid lines
-    # Minor grid lines (1mm equivalent spacing) - LIGHT PINK
-    minor_spacing_x = width / 60  # 60 minor divisions across width
-    minor_spacing_y = height / 20  # 20 minor divisions across height
-    
-    # Draw vertical minor pink grid lines
-    for i in range(61):
-        x_pos = i * minor_spacing_x
-        ax.axvline(x=x_pos, color=light_grid_color, linewidth=0.6, alpha=0.8)
-    
-    # Draw horizontal minor pink grid lines
-    for i in range(21):
-        y_pos = i * minor_spacing_y
-        ax.axhline(y=y_pos, color=light_grid_color, linewidth=0.6, alpha=0.8)
-    
-    # Major grid lines (5mm equivalent spacing) - DARKER PINK
-    major_spacing_x = width / 12  # 12 major divisions across width
-    major_spacing_y = height / 4   # 4 major divisions across height
-    
-    # Draw vertical major pink grid lines
-    for i in range(13):
-        x_pos = i * major_spacing_x
-        ax.axvline(x=x_pos, color=major_grid_color, linewidth=1.0, alpha=0.9)
+    # Fix the axis limits BEFORE adding artists: disables autoscaling, so the
+    # finite grid segments below never trigger a relimit or off-screen tessellation
+    ax.set_xlim(0, width)
+    ax.set_ylim(0, height)
     
-    # Draw horizontal major pink grid lines
-    for i in range(5):
-        y_pos = i * major_spacing_y
-        ax.axhline(y=y_pos, color=major_grid_color, linewidth=1.0, alpha=0.9)
+    # STEP 2: Draw pink ECG grid lines
+    # Array-valued vlines/hlines: one LineCollection per call instead of ~100
+    # axvline/axhline artists (each of which re-runs autoscale_view)
+    # Segments have explicit finite bounds, are solid, and are clipped to the axes box
+    grid_style = _LEAD_PNG_GRID_LINE
+    # Minor grid lines (1mm equivalent spacing) - LIGHT PINK: 60 x 20 divisions
+    # Major grid lines (5mm equivalent spacing) - DARKER PINK: 12 x 4 divisions
+    for (x_divs, y_divs), line_style in ((_LEAD_PNG_MINOR_DIVISIONS, _LEAD_PNG_MINOR_GRID),
+                                         (_LEAD_PNG_MAJOR_DIVISIONS, _LEAD_PNG_MAJOR_GRID)):
+        ax.vlines(np.linspace(0, width, x_divs + 1), 0, height, **line_style, **grid_style)
+        ax.hlines(np.linspace(0, height, y_divs + 1), 0, width, **line_style, **grid_style)
     
     # STEP 3: Plot DARK ECG waveform on top of pink grid
     if ecg_data is not None and len(ecg_data) > 0:
@@ -310,9 +381,7 @@ def create_ecg_grid_with_waveform(ecg_data, lead_name, width=6, height=2):
         ax.plot(t, ecg_normalized, color='#000000', linewidth=2.8, solid_capstyle='round', alpha=0.9)
     # REMOVE ENTIRE else BLOCK - just comment it out or delete lines 78-96
     
-    # STEP 4: Set axis limits to match grid
-    ax.set_xlim(0, width)
-    ax.set_ylim(0, height)
+    # STEP 4: Axis limits were fixed to the grid before drawing (see above)
     
     # STEP 5: Remove axis elements but keep the pink grid background
     for spine in ax.spines.values():
@@ -325,9 +394,319 @@ def create_ecg_grid_with_waveform(ecg_data, lead_name, width=6, height=2):
     
     return fig
 
-from reportlab.graphics.shapes import Drawing, Group, Line, Rect
+def _figure_to_png_bytes(fig, dpi=200, pad_inches=0.05):
+    """
+    Rasterize a figure once on the Agg canvas and encode it with PIL
+    Crops to the tight bounding box (+pad) like savefig(bbox_inches='tight'),
+    but skips savefig's re-layout/metadata pass and uses fast zlib compression
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from PIL import Image
+    
+    fig.set_dpi(dpi)
+    canvas = fig.canvas if isinstance(fig.canvas, FigureCanvasAgg) else FigureCanvasAgg(fig)
+    canvas.draw()
+    rgba = np.asarray(canvas.buffer_rgba())
+    
+    # Tight bbox in inches -> pixel crop (Agg rows run top-down)
+    bbox = fig.get_tightbbox(canvas.get_renderer()).padded(pad_inches)
+    fig_h = rgba.shape[0]
+    x0 = max(0, int(round(bbox.x0 * dpi)))
+    x1 = min(rgba.shape[1], int(round(bbox.x1 * dpi)))
+    y0 = max(0, fig_h - int(round(bbox.y1 * dpi)))
+    y1 = min(fig_h, fig_h - int(round(bbox.y0 * dpi)))
+    
+    png_buffer = io.BytesIO()
+    Image.fromarray(rgba[y0:y1, x0:x1]).save(png_buffer, format='PNG', compress_level=1)
+    return png_buffer.getvalue()
+
+def _lead_grid_cache_key():
+    """
+    Short content hash of everything that determines the lead grid PNG, used as the
+    cached PNG file name: the module-level grid style/size constants the drawing code
+    reads, plus the matplotlib version (rasterisation can change between releases)
+    """
+    try:
+        import matplotlib
+        mpl_version = matplotlib.__version__
+    except ImportError:
+        mpl_version = None
+    spec = (mpl_version, _LEAD_GRID_PNG_SIZE, _LEAD_GRID_PNG_DPI, _LEAD_GRID_PNG_PAD, _LEAD_PNG_BG_COLOR,
+            tuple(_LEAD_PNG_MINOR_GRID.items()), tuple(_LEAD_PNG_MAJOR_GRID.items()),
+            tuple(_LEAD_PNG_GRID_LINE.items()),
+            _LEAD_PNG_MINOR_DIVISIONS, _LEAD_PNG_MAJOR_DIVISIONS)
+    return hashlib.blake2b(repr(spec).encode(), digest_size=8).hexdigest()
+
 from reportlab.graphics.charts.lineplots import LinePlot
-from reportlab.lib.units import mm
+
+# Lead-specific ADC counts per 5mm box at 10mm/mV (divided by wave_gain at draw time)
+_ADC_PER_BOX_CONFIG = MappingProxyType({
+    'I': 5500.0,
+    'II': 4955.0,
+    'III': 5213.0,
+    'aVR': 5353.0,
+    'aVL': 5500.0,
+    'aVF': 5353.0,
+    'V1': 5500.0,
+    'V2': 5500.0,
+    'V3': 5500.0,
+    'V4': 7586.0,
+    'V5': 7586.0,
+    'V6': 8209.0,
+    '-aVR': 5500.0,  # For Cabrera sequence
+})
+
+def _half_sum(x, y, sign):
+    """sign * (x + y) / 2 - the result array is the only allocation (scaled in place)"""
+    out = np.add(x, y)
+    out *= 0.5 * sign
+    return out
+
+def _minus_half(x, y):
+    """y - x / 2 - the result array is the only allocation (added in place)"""
+    out = np.multiply(x, -0.5)
+    out += y
+    return out
+
+# Derived limb leads from baseline-centred Lead I and Lead II - one output array each
+_DERIVED_LEAD_FORMULAS = MappingProxyType({
+    'III': lambda i, ii: np.subtract(ii, i),     # III = II - I
+    'aVR': lambda i, ii: _half_sum(i, ii, -1.0),  # aVR = -(I + II) / 2
+    'aVL': lambda i, ii: _minus_half(ii, i),      # aVL = (I - III) / 2 = I - II/2
+    'aVF': lambda i, ii: _minus_half(i, ii),      # aVF = (II + III) / 2 = II - I/2
+    '-aVR': lambda i, ii: _half_sum(i, ii, 1.0),  # -aVR = (I + II) / 2 (Cabrera)
+})
+
+# Lead orders for the report (selected by the "lead_sequence" setting)
+_LEAD_SEQUENCES = MappingProxyType({
+    "Standard": ("I", "II", "III", "aVR", "aVL", "aVF", "V1", "V2", "V3", "V4", "V5", "V6"),
+    "Cabrera": ("aVL", "I", "-aVR", "II", "aVF", "III", "V1", "V2", "V3", "V4", "V5", "V6"),
+})
+
+# 6:2 page layout - limb leads stacked in column 1, chest leads in column 2
+_COLUMN1_LEADS = ("I", "II", "III", "aVR", "aVL", "aVF")  # First 6 leads - vertical column
+_COLUMN2_LEADS = ("V1", "V2", "V3", "V4", "V5", "V6")     # Last 6 leads - vertical column
+# QTc label is at Y=455, so start leads 60 points below that
+_LEADS_START_Y = 455 - 60 + 17  # 412 (60 points below QTc + 17 points up shift)
+# Standard ECG major box: 5mm = 14.17 points (extra Lead II strip scale)
+_BOX_HEIGHT_POINTS = 5.0 * mm
+
+def _build_lead_meta():
+    """
+    Per-lead layout/data facts, looked up once instead of scanning lead lists:
+    col_idx - row within its column, is_col1 - limb lead column,
+    is_derived - calculated from I and II, live_index - row in ecg_test_page.data
+    -aVR (Cabrera) shares everything with aVR except the sign of the data
+    """
+    meta = {}
+    for col_idx, lead in enumerate(_COLUMN1_LEADS):
+        meta[lead] = MappingProxyType({"col_idx": col_idx, "is_col1": True,
+                                       "is_derived": lead in _DERIVED_LEAD_FORMULAS, "live_index": col_idx})
+    for col_idx, lead in enumerate(_COLUMN2_LEADS):
+        meta[lead] = MappingProxyType({"col_idx": col_idx, "is_col1": False,
+                                       "is_derived": False, "live_index": len(_COLUMN1_LEADS) + col_idx})
+    meta["-aVR"] = meta["aVR"]
+    return MappingProxyType(meta)
+
+_LEAD_META = _build_lead_meta()
+
+def _build_lead_positions(lead_order):
+    """
+    Strip positions for a lead order: tuple of (lead, x, y) tuples
+    Column 1 leads share X=-25, column 2 leads X=400; rows go DOWNWARD 60 points apart
+    -aVR (Cabrera) takes the aVR slot
+    """
+    positions = []
+    for lead in lead_order:
+        meta = _LEAD_META[lead]
+        if meta["is_col1"]:
+            # Shift ALL column1 leads 45 points to the left
+            x_pos = 20 - 45  # -25 (shifted left 45 points)
+        else:
+            x_pos = 400  # ALL column2 leads at same X position (center/right side)
+        y_pos = _LEADS_START_Y - (meta["col_idx"] * 60)  # 412, 352, 292, 232, 172, 112
+        positions.append((lead, x_pos, y_pos))
+    return tuple(positions)
+
+# Positions only depend on the lead order - computed once per sequence at import
+_LEAD_POSITIONS = MappingProxyType({
+    name: _build_lead_positions(order) for name, order in _LEAD_SEQUENCES.items()
+})
+
+def calculate_derived_lead(lead_name, lead_i, lead_ii):
+    """
+    Calculate a derived lead (III, aVR, aVL, aVF, -aVR) from Lead I and Lead II
+    lead_i / lead_ii: baseline-centred numpy arrays of equal length (converted by the caller)
+    Returns: numpy array, or None if lead_name is not a derived lead
+    """
+    formula = _DERIVED_LEAD_FORMULAS.get(lead_name)
+    if formula is None:
+        return None
+    return formula(lead_i, lead_ii)
+
+def calculate_derived_leads(lead_i, lead_ii, lead_names=tuple(_DERIVED_LEAD_FORMULAS)):
+    """
+    Calculate several derived leads from the same centred Lead I / Lead II in one pass
+    (I + II) / 2 is shared by aVR and -aVR, so it is computed once and negated
+    Returns: dict {lead_name: numpy array} for the derived leads in lead_names, in order
+    """
+    wanted = [name for name in lead_names if name in _DERIVED_LEAD_FORMULAS]
+    derived = {}
+    if "aVR" in wanted or "-aVR" in wanted:
+        half_sum = _half_sum(lead_i, lead_ii, 1.0)
+        derived["-aVR"] = half_sum                 # -aVR = (I + II) / 2
+        derived["aVR"] = np.negative(half_sum)     # aVR = -(I + II) / 2
+    for name in wanted:
+        if name not in derived:
+            derived[name] = _DERIVED_LEAD_FORMULAS[name](lead_i, lead_ii)
+    return {name: derived[name] for name in wanted}
+
+@lru_cache(maxsize=8)
+def _build_ecg_grid_group(width, height):
+    """
+    Build the pink ECG grid as two stroked paths (minor + major)
+    Returns: ReportLab Group - each path renders as a single PDF path operator
+    
+    Cached per (width, height) for one report (the module is re-executed per
+    report): every lead strip shares the same Group by reference, so callers
+    must not mutate it.
+    """
+    minor_path = Path(strokeColor=_MINOR_GRID_COLOR, strokeWidth=0.4, fillColor=None)
+    major_path = Path(strokeColor=_MAJOR_GRID_COLOR, strokeWidth=0.8, fillColor=None)
+
+    # Minor grid lines (1mm spacing equivalent): 60 x 20 divisions
+    for i in range(61):
+        x_pos = i * (width / 60)
+        minor_path.moveTo(x_pos, 0)
+        minor_path.lineTo(x_pos, height)
+    for i in range(21):
+        y_pos = i * (height / 20)
+        minor_path.moveTo(0, y_pos)
+        minor_path.lineTo(width, y_pos)
+
+    # Major grid lines (5mm spacing equivalent): 12 x 4 divisions
+    for i in range(13):
+        x_pos = i * (width / 12)
+        major_path.moveTo(x_pos, 0)
+        major_path.lineTo(x_pos, height)
+    for i in range(5):
+        y_pos = i * (height / 4)
+        major_path.moveTo(0, y_pos)
+        major_path.lineTo(width, y_pos)
+
+    # Minor first so the major lines are painted on top (same order as before)
+    return Group(minor_path, major_path)
+
+def _minmax_decimate(x, y, target_cols=920):
+    """
+    Thin a uniformly sampled waveform to at most 2 points per column
+    Keeps each column's min and max sample (in time order) so QRS peaks survive
+    Returns: (x, y) - unchanged if there are already few enough points
+    """
+    n = len(y)
+    if target_cols <= 0 or n <= 2 * target_cols:
+        return x, y
+
+    # Equal-width columns: x is a linspace, so equal sample counts == equal widths
+    per_col = -(-n // target_cols)
+    cols = -(-n // per_col)
+    padded = np.empty(cols * per_col, dtype=y.dtype)
+    padded[:n] = y
+    padded[n:] = y[-1]
+    blocks = padded.reshape(cols, per_col)
+
+    offsets = np.arange(cols) * per_col
+    lo = offsets + blocks.argmin(axis=1)
+    hi = offsets + blocks.argmax(axis=1)
+
+    # np.unique sorts the indices, which keeps min/max pairs in time order
+    keep = np.unique(np.concatenate(([0], lo, hi, [n - 1])).clip(0, n - 1))
+    return x[keep], y[keep]
+
+def _interleave_points(x, y):
+    """
+    Interleave x/y coordinate arrays into the flat [x0, y0, x1, y1, ...] list
+    that ReportLab PolyLine/Path expect (two strided copies, no per-sample loop)
+    Coordinates are rounded to 0.1 pt (~0.035 mm, below a 600 dpi printer dot) so the
+    PDF content stream carries e.g. "123.4" instead of "123.4568" per number
+    """
+    points = np.empty(2 * len(x), dtype=np.float32)
+    points[0::2] = x
+    points[1::2] = y
+    np.round(points, 1, out=points)
+    return points.tolist()
+
+# A peak-to-peak range above this replaces the old std > 0.01 flat-line check
+_FLAT_LINE_RANGE = 0.02
+
+def _has_variation(samples, min_range=_FLAT_LINE_RANGE):
+    """
+    True if the samples are not a flat line
+    A min/max range test - no mean/squared-deviation temporaries like np.std
+    """
+    return float(np.ptp(samples)) > min_range
+
+def _adc_to_ypoints(adc, adc_per_box, center_y, box_height_points, baseline=0.0, out=None):
+    """
+    Map ADC samples to strip Y coordinates as one affine transform:
+    y = center_y + ((adc - baseline) / adc_per_box) * box_height_points
+    Baseline, scale and centre fold into one multiplier and one offset, applied in place
+    (no centred copy of the data, no temporary at all if out is given)
+    """
+    scale = box_height_points / adc_per_box
+    y = np.multiply(adc, scale, out=out)
+    y += center_y - baseline * scale
+    return y
+
+def _alloc_strip_scratch(n_samples):
+    """
+    Allocate the per-report float32 work buffers shared by all lead strips:
+    Y points, X points and the 0..N-1 sample ramp the X points are built from
+    """
+    ypoints = np.empty(n_samples, dtype=np.float32)
+    return ypoints, np.empty_like(ypoints), np.arange(n_samples, dtype=np.float32)
+
+def _strip_x_points(x0, width, ramp, out):
+    """
+    Evenly spaced X coordinates from x0 to x0 + width (both ends included, like np.linspace)
+    Written into out from the shared sample ramp - no new array per lead
+    """
+    n = len(out)
+    np.multiply(ramp[:n], width / (n - 1) if n > 1 else 0.0, out=out)
+    out += x0
+    return out
+
+def _build_waveform_path(x, y, **style):
+    """
+    Build a stroked waveform as one PolyLine (m l l l ... S) from x/y arrays
+    Points are interleaved in bulk instead of one lineTo() call per sample
+    """
+    return PolyLine(_interleave_points(x, y), **style)
+
+# Calibration notch: 1 mV pulse at 10 mm/mV (10mm up, 5mm across, back down) + a 2mm tick
+_NOTCH_WIDTH = 5.0 * mm
+_NOTCH_HEIGHT = 10.0 * mm
+_NOTCH_TICK = 2.0 * mm
+
+def _build_calibration_notch(notch_x, notch_y_base, stroke_line_join=0):
+    """
+    Calibration notch PolyLine with its lower-left corner at (notch_x, notch_y_base)
+    Points are the fixed notch outline offset in one list - no moveTo/lineTo calls per lead
+    """
+    right = notch_x + _NOTCH_WIDTH
+    top = notch_y_base + _NOTCH_HEIGHT
+    return PolyLine([notch_x, notch_y_base, notch_x, top, right, top, right, notch_y_base,
+                     right + _NOTCH_TICK, notch_y_base],
+                    strokeColor=_ECG_BLACK, strokeWidth=0.8,
+                    strokeLineCap=1, strokeLineJoin=stroke_line_join)
+
+def _page_label(x, y, text, fontName="Helvetica", fontSize=10):
+    """
+    Black start-anchored text for the 6:2 page as a String shape
+    The page collects these in one Group that is added to the master drawing last,
+    so labels paint on top of the strips in the order they were created
+    """
+    return String(x, y, str(text), fontName=fontName, fontSize=fontSize, fillColor=colors.black)
 
 def create_reportlab_ecg_drawing(lead_name, width=460, height=45):
     """
@@ -337,45 +716,12 @@ def create_reportlab_ecg_drawing(lead_name, width=460, height=45):
     drawing = Drawing(width, height)
     
     # STEP 1: Create solid pink background rectangle
-    bg_color = colors.HexColor("#ffe6e6")  # Light pink background
+    bg_color = _BG_COLOR  # Light pink background
     bg_rect = Rect(0, 0, width, height, fillColor=bg_color, strokeColor=None)
     drawing.add(bg_rect)
     
-    # STEP 2: Draw pink ECG grid lines (even lighter colors)
-    light_grid_color = colors.HexColor("#ffd1d1")  # Darker minor grid
-    major_grid_color = colors.HexColor("#ffb3b3")   # Darker major grid
-    
-    # Minor grid lines (1mm spacing equivalent)
-    minor_spacing_x = width / 60  # 60 divisions across width
-    minor_spacing_y = height / 20  # 20 divisions across height
-    
-    # Vertical minor grid lines
-    for i in range(61):
-        x_pos = i * minor_spacing_x
-        line = Line(x_pos, 0, x_pos, height, strokeColor=light_grid_color, strokeWidth=0.4)
-        drawing.add(line)
-    
-    # Horizontal minor grid lines
-    for i in range(21):
-        y_pos = i * minor_spacing_y
-        line = Line(0, y_pos, width, y_pos, strokeColor=light_grid_color, strokeWidth=0.4)
-        drawing.add(line)
-    
-    # Major grid lines (5mm spacing equivalent)
-    major_spacing_x = width / 12  # 12 divisions across width
-    major_spacing_y = height / 4   # 4 divisions across height
-    
-    # Vertical major grid lines
-    for i in range(13):
-        x_pos = i * major_spacing_x
-        line = Line(x_pos, 0, x_pos, height, strokeColor=major_grid_color, strokeWidth=0.8)
-        drawing.add(line)
-    
-    # Horizontal major grid lines
-    for i in range(5):
-        y_pos = i * major_spacing_y
-        line = Line(0, y_pos, width, y_pos, strokeColor=major_grid_color, strokeWidth=0.8)
-        drawing.add(line)
+    # STEP 2: Draw pink ECG grid lines (one path per colour instead of ~100 Line objects)
+    drawing.add(_build_ecg_grid_group(width, height))
     
     # REMOVE ENTIRE "STEP 3: Draw ECG waveform as series of lines" section (lines ~166-214)
     
@@ -396,20 +742,8 @@ def capture_real_ecg_graphs_from_dashboard(dashboard_instance=None, ecg_test_pag
 
     lead_sequence = settings_manager.get_setting("lead_sequence", "Standard")
     
-    # Define lead orders based on sequence 
-    LEAD_SEQUENCES = {
-        "Standard": ["I", "II", "III", "aVR", "aVL", "aVF", "V1", "V2", "V3", "V4", "V5", "V6"],
-        "Cabrera": ["aVL", "I", "-aVR", "II", "aVF", "III", "V1", "V2", "V3", "V4", "V5", "V6"]
-    }
-    
     # Use the appropriate sequence for REPORT ONLY
-    ordered_leads = LEAD_SEQUENCES.get(lead_sequence, LEAD_SEQUENCES["Standard"])
-    
-    # Map lead names to indices
-    lead_to_index = {
-        "I": 0, "II": 1, "III": 2, "aVR": 3, "aVL": 4, "aVF": 5,
-        "V1": 6, "V2": 7, "V3": 8, "V4": 9, "V5": 10, "V6": 11
-    }
+    ordered_leads = _LEAD_SEQUENCES.get(lead_sequence, _LEAD_SEQUENCES["Standard"])
     
     # Check if demo mode is active and get time window for filtering
     is_demo_mode = False
@@ -427,9 +761,7 @@ def capture_real_ecg_graphs_from_dashboard(dashboard_instance=None, ecg_test_pag
             else:
                 # Fallback: calculate from wave speed setting
                 try:
-                    from utils.settings_manager import SettingsManager
-                    sm = SettingsManager()
-                    wave_speed = float(sm.get_wave_speed())
+                    wave_speed = float(settings_manager.get_wave_speed())
                     # NEW LOGIC: Time window = 165mm / wave_speed (33 boxes × 5mm = 165mm)
                     ecg_graph_width_mm = 33 * 5  # 165mm
                     time_window_seconds = ecg_graph_width_mm / wave_speed
@@ -439,6 +771,7 @@ def capture_real_ecg_graphs_from_dashboard(dashboard_instance=None, ecg_test_pag
                     time_window_seconds = None
     # Try to get REAL ECG data from the test page
     real_ecg_data = {}
+    lead_signs = {}  # -1.0 for inverted leads (-aVR); applied inside the drawing transform
     if ecg_test_page and hasattr(ecg_test_page, 'data'):
         
         # Calculate number of samples to capture based on demo mode
@@ -451,36 +784,30 @@ def capture_real_ecg_graphs_from_dashboard(dashboard_instance=None, ecg_test_pag
             num_samples_to_capture = 10000
             print(f" NORMAL MODE: Capturing up to {num_samples_to_capture} samples")
         
-        for lead in ordered_leads:
-            if lead == "-aVR":
-                # For -aVR, we need to invert aVR data
-                if hasattr(ecg_test_page, 'data') and len(ecg_test_page.data) > 3:
-                    avr_data = np.array(ecg_test_page.data[3])  # aVR is at index 3
-                    if is_demo_mode and time_window_seconds is not None:
-                        # Demo mode: only capture window frame data
-                        real_ecg_data[lead] = -avr_data[-num_samples_to_capture:]
-                        print(f" Captured DEMO -aVR data: {len(real_ecg_data[lead])} points ({time_window_seconds}s window)")
-                    else:
-                        # Normal mode: capture maximum data
-                        real_ecg_data[lead] = -avr_data[-num_samples_to_capture:]
-                        print(f" Captured REAL -aVR data: {len(real_ecg_data[lead])} points")
-            else:
-                lead_index = lead_to_index.get(lead)
-                if lead_index is not None and len(ecg_test_page.data) > lead_index:
-                    lead_data = np.array(ecg_test_page.data[lead_index])
-                    if len(lead_data) > 0:
-                        if is_demo_mode and time_window_seconds is not None:
-                            # Demo mode: only capture window frame data
-                            real_ecg_data[lead] = lead_data[-num_samples_to_capture:]
-                            print(f" Captured DEMO {lead} data: {len(real_ecg_data[lead])} points ({time_window_seconds}s window)")
-                        else:
-                            # Normal mode: capture maximum data
-                            real_ecg_data[lead] = lead_data[-num_samples_to_capture:]
-                            print(f" Captured REAL {lead} data: {len(real_ecg_data[lead])} points")
-                    else:
-                        print(f" No data found for {lead}")
-                else:
-                    print(f" Lead {lead} index not found")
+        # -aVR is aVR (index 3) with inverted sign: one sign per ordered lead
+        source_indices = [_LEAD_META[lead]["live_index"] for lead in ordered_leads]
+        
+        # One float32 copy of the last num_samples_to_capture samples per buffer that
+        # is actually drawn (16-bit ADC values need no more precision for plotting)
+        live_buffers = ecg_test_page.data[:12]
+        lead_rows = {
+            index: np.asarray(np.asarray(live_buffers[index])[-num_samples_to_capture:], dtype=np.float32)
+            for index in set(source_indices) if index < len(live_buffers)
+        }
+        signs = np.where(np.array(ordered_leads) == "-aVR", -1.0, 1.0)
+        capture_mode = "DEMO" if (is_demo_mode and time_window_seconds is not None) else "REAL"
+        
+        for lead, lead_index, sign in zip(ordered_leads, source_indices, signs):
+            lead_data = lead_rows.get(lead_index)
+            if lead_data is None:
+                print(f" Lead {lead} index not found")
+                continue
+            if len(lead_data) == 0:
+                print(f" No data found for {lead}")
+                continue
+            real_ecg_data[lead] = lead_data  # shared float32 row - sign applied when drawing, no negated copy
+            lead_signs[lead] = float(sign)
+            print(f" Captured {capture_mode} {lead} data: {len(real_ecg_data[lead])} points")
     else:
         print(" No live ECG test page found - using grid only")
     
@@ -495,6 +822,12 @@ def capture_real_ecg_graphs_from_dashboard(dashboard_instance=None, ecg_test_pag
             wave_gain_mm_mv = 10.0
             print(f" Could not get wave_gain from settings, using default: {wave_gain_mm_mv} mm/mV")
     
+    # All captured leads normally share one length - build the 460pt time axis once
+    capture_lengths = {len(data) for data in real_ecg_data.values()}
+    t_axis = None
+    if len(capture_lengths) == 1:
+        t_axis = np.linspace(0, 460, capture_lengths.pop(), dtype=np.float32)
+    
     # Create ReportLab drawings with REAL data
     for lead in ordered_leads:
         try:
@@ -504,7 +837,9 @@ def capture_real_ecg_graphs_from_dashboard(dashboard_instance=None, ecg_test_pag
                 real_ecg_data.get(lead), 
                 width=460, 
                 height=45,
-                wave_gain_mm_mv=wave_gain_mm_mv
+                wave_gain_mm_mv=wave_gain_mm_mv,
+                t_axis=t_axis,
+                sign=lead_signs.get(lead, 1.0)
             )
             lead_drawings[lead] = drawing
             
@@ -515,8 +850,7 @@ def capture_real_ecg_graphs_from_dashboard(dashboard_instance=None, ecg_test_pag
             
         except Exception as e:
             print(f" Error creating drawing for Lead {lead}: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.debug("Lead %s capture failed", lead, exc_info=True)
     
     if is_demo_mode and time_window_seconds is not None:
         print(f" Successfully created {len(lead_drawings)}/12 ECG drawings with DEMO window filtering ({time_window_seconds}s window - visible peaks only)!")
@@ -524,7 +858,7 @@ def capture_real_ecg_graphs_from_dashboard(dashboard_instance=None, ecg_test_pag
         print(f" Successfully created {len(lead_drawings)}/12 ECG drawings with MAXIMUM heartbeats!")
     return lead_drawings
 
-def create_reportlab_ecg_drawing_with_real_data(lead_name, ecg_data, width=460, height=45, wave_gain_mm_mv=10.0):
+def create_reportlab_ecg_drawing_with_real_data(lead_name, ecg_data, width=460, height=45, wave_gain_mm_mv=10.0, simplify=True, t_axis=None, sign=1.0):
     """
     Create ECG drawing using ReportLab with REAL ECG data showing MAXIMUM heartbeats
     Returns: ReportLab Drawing with guaranteed pink background and REAL ECG waveform
@@ -532,198 +866,65 @@ def create_reportlab_ecg_drawing_with_real_data(lead_name, ecg_data, width=460,
     Parameters:
         wave_gain_mm_mv: Wave gain in mm/mV (default: 10.0 mm/mV)
                          Used for amplitude scaling: 10mm/mV = 1.0x, 20mm/mV = 2.0x, 5mm/mV = 0.5x
+        simplify: Min/max decimate to ~2 points per column before drawing (visually lossless)
+        t_axis: Optional precomputed x positions (0..width) shared by leads of equal length
+        sign: -1.0 to draw the lead inverted about the baseline (e.g. -aVR from aVR data)
     """
     drawing = Drawing(width, height)
     
     # STEP 1: Create solid pink background rectangle
-    bg_color = colors.HexColor("#ffe6e6")  # Light pink background
+    bg_color = _BG_COLOR  # Light pink background
     bg_rect = Rect(0, 0, width, height, fillColor=bg_color, strokeColor=None)
     drawing.add(bg_rect)
     
-    # STEP 2: Draw pink ECG grid lines (even lighter colors)
-    light_grid_color = colors.HexColor("#ffd1d1")  # Darker minor grid
-    major_grid_color = colors.HexColor("#ffb3b3")   # Darker major grid
-    
-    # Minor grid lines (1mm spacing equivalent)
-    minor_spacing_x = width / 60  # 60 divisions across width
-    minor_spacing_y = height / 20  # 20 divisions across height
-    
-    # Vertical minor grid lines
-    for i in range(61):
-        x_pos = i * minor_spacing_x
-        line = Line(x_pos, 0, x_pos, height, strokeColor=light_grid_color, strokeWidth=0.4)
-        drawing.add(line)
-    
-    # Horizontal minor grid lines
-    for i in range(21):
-        y_pos = i * minor_spacing_y
-        line = Line(0, y_pos, width, y_pos, strokeColor=light_grid_color, strokeWidth=0.4)
-        drawing.add(line)
-    
-    # Major grid lines (5mm spacing equivalent)
-    major_spacing_x = width / 12  # 12 divisions across width
-    major_spacing_y = height / 4   # 4 divisions across height
-    
-    # Vertical major grid lines
-    for i in range(13):
-        x_pos = i * major_spacing_x
-        line = Line(x_pos, 0, x_pos, height, strokeColor=major_grid_color, strokeWidth=0.8)
-        drawing.add(line)
-    
-    # Horizontal major grid lines
-    for i in range(5):
-        y_pos = i * major_spacing_y
-        line = Line(0, y_pos, width, y_pos, strokeColor=major_grid_color, strokeWidth=0.8)
-        drawing.add(line)
+    # STEP 2: Draw pink ECG grid lines (one path per colour instead of ~100 Line objects)
+    drawing.add(_build_ecg_grid_group(width, height))
     
     # STEP 3: Draw ALL AVAILABLE ECG data - NO DOWNSAMPLING, NO LIMITS!
     if ecg_data is not None and len(ecg_data) > 0:
-        print(f" Drawing ALL AVAILABLE ECG data for {lead_name}: {len(ecg_data)} points (NO LIMITS)")
+        logger.debug("Drawing ALL AVAILABLE ECG data for %s: %d points", lead_name, len(ecg_data))
         
         # SIMPLE APPROACH: Use ALL available data points - NO cutting, NO downsampling
         # This will show as many heartbeats as possible in the available data
         
-        # Create time array for ALL the data
-        t = np.linspace(0, width, len(ecg_data))
-        
+        # Create time array for ALL the data (float32 like the Y values - plenty for a 460pt strip)
+        if t_axis is not None and len(t_axis) == len(ecg_data):
+            t = t_axis
+        else:
+            t = np.linspace(0, width, len(ecg_data), dtype=np.float32)
         
-        adc_per_box_config = {
-            'I': 5500.0,
-            'II': 4955.0,  
-            'III': 5213.0,  
-            'aVR': 5353.0, 
-            'aVL': 5500.0,
-            'aVF': 5353.0, 
-            'V1': 5500.0,
-            'V2': 5500.0,
-            'V3': 5500.0,
-            'V4': 7586.0,  
-            'V5': 7586.0, 
-            'V6': 8209.0, 
-            '-aVR': 5500.0,  # For Cabrera sequence
-        }
         # Get lead-specific ADC per box multiplier (default: 5500)
-        adc_per_box_multiplier = adc_per_box_config.get(lead_name, 5500.0)
-        
-        # Convert to numpy array
-        adc_data = np.array(ecg_data, dtype=float)
+        adc_per_box_multiplier = _ADC_PER_BOX_CONFIG.get(lead_name, 5500.0)
         
         # Apply baseline 2000 (subtract baseline from ADC values)
         baseline_adc = 2000.0
-        centered_adc = adc_data - baseline_adc
-        
-        # Calculate ADC per box based on wave_gain and lead-specific multiplier
-        adc_per_box = adc_per_box_multiplier / max(1e-6, wave_gain_mm_mv)  # Avoid division by zero
-        
-        # Convert ADC offset to boxes (vertical units)
-        # Direct calculation: boxes_offset = centered_adc / adc_per_box
-        boxes_offset = centered_adc / adc_per_box
-        
-        # Convert boxes to Y position
         center_y = height / 2.0  # Center of the graph in points
         box_height_points = 5.0  # 1 box = 5mm = 5 points
         
-        # Convert boxes offset to Y position
-        ecg_normalized = center_y + (boxes_offset * box_height_points)
+        # ADC per box = multiplier / wave_gain (sign < 0 flips it, folding lead inversion into the scale)
+        adc_per_box = sign * adc_per_box_multiplier / max(1e-6, wave_gain_mm_mv)  # Avoid division by zero
+        
+        # Same affine map as the report strips: one multiply + one add over float32 samples
+        # np.asarray avoids re-copying data that already arrives as an ndarray
+        adc_data = np.asarray(ecg_data, dtype=np.float32)
+        ecg_normalized = _adc_to_ypoints(adc_data, adc_per_box, center_y, box_height_points, baseline=baseline_adc)
         
         # Draw ALL ECG data points - NO REDUCTION
-        ecg_color = colors.HexColor("#000000")  # Black ECG line
+        ecg_color = _ECG_BLACK  # Black ECG line
+        
+        # Drawing is only `width` points wide - keep per-column min/max instead of every sample
+        if simplify:
+            t, ecg_normalized = _minmax_decimate(t, ecg_normalized, target_cols=int(width * 2))
         
-        # OPTIMIZED: Draw every point for maximum detail
-        for i in range(len(t) - 1):
-            line = Line(t[i], ecg_normalized[i], 
-                       t[i+1], ecg_normalized[i+1], 
-                       strokeColor=ecg_color, strokeWidth=0.5)
-            drawing.add(line)
+        # OPTIMIZED: Draw every point as ONE path (single PDF path operator, not one Line per sample)
+        drawing.add(_build_waveform_path(t, ecg_normalized, strokeColor=ecg_color, strokeWidth=0.5))
         
-        print(f" Drew ALL {len(ecg_data)} ECG data points for {lead_name} - showing MAXIMUM heartbeats!")
+        logger.debug("Drew ALL %d ECG data points for %s", len(ecg_data), lead_name)
     else:
         print(f" No real data available for {lead_name} - showing grid only")
     
     return drawing
 
-def create_clean_ecg_image(lead_name, width=6, height=2):
-    """
-    Create COMPLETELY CLEAN ECG image with GUARANTEED pink background
-    NO labels, NO time markers, NO axes, NO white background
-    """
-    # FORCE matplotlib to use proper backend
-    import matplotlib
-    matplotlib.use('Agg')
-    import matplotlib.pyplot as plt
-    
-    # STEP 1: Create figure with FORCED pink background
-    fig = plt.figure(figsize=(width, height), facecolor='#ffe6e6', frameon=True)
-    
-    # FORCE figure background to pink
-    fig.patch.set_facecolor('#ffe6e6')
-    fig.patch.set_alpha(1.0)  # Full opacity
-    
-    # Create axes with FORCED pink background
-    ax = fig.add_subplot(111)
-    ax.set_facecolor('#ffe6e6')  # FORCE axes background pink
-    ax.patch.set_facecolor('#ffe6e6')  # FORCE axes patch pink
-    ax.patch.set_alpha(1.0)  # Full opacity
-    
-    # STEP 2: Draw pink ECG grid lines OVER pink background (darker for clarity)
-    light_grid_color = '#ffd1d1'  # Darker minor grid
-    major_grid_color = '#ffb3b3'  # Darker major grid
-    
-    # Minor grid lines (1mm equivalent spacing)
-    minor_spacing_x = width / 60  # 60 minor divisions
-    minor_spacing_y = height / 20  # 20 minor divisions
-    
-    # Draw vertical minor pink grid lines
-    for i in range(61):
-        x_pos = i * minor_spacing_x
-        ax.axvline(x=x_pos, color=light_grid_color, linewidth=0.6, alpha=0.8)
-    
-    # Draw horizontal minor pink grid lines
-    for i in range(21):
-        y_pos = i * minor_spacing_y
-        ax.axhline(y=y_pos, color=light_grid_color, linewidth=0.6, alpha=0.8)
-    
-    # Major grid lines (5mm equivalent spacing)
-    major_spacing_x = width / 12  # 12 major divisions
-    major_spacing_y = height / 4   # 4 major divisions
-    
-    # Draw vertical major pink grid lines
-    for i in range(13):
-        x_pos = i * major_spacing_x
-        ax.axvline(x=x_pos, color=major_grid_color, linewidth=1.0, alpha=0.9)
-    
-    # Draw horizontal major pink grid lines
-    for i in range(5):
-        y_pos = i * major_spacing_y
-        ax.axhline(y=y_pos, color=major_grid_color, linewidth=1.0, alpha=0.9)
-    
-    # REMOVE ENTIRE "STEP 3: Create realistic ECG waveform" section (lines ~315-356)
-    # REMOVE ENTIRE "STEP 4: Plot DARK ECG line" section
-    
-    # STEP 5: Set limits and remove ALL visual elements except grid
-    ax.set_xlim(0, width)
-    ax.set_ylim(0, height)
-    
-    # COMPLETELY remove ALL spines, ticks, labels
-    for spine in ax.spines.values():
-        spine.set_visible(False)
-    ax.set_xticks([])
-    ax.set_yticks([])
-    ax.set_xlabel('')
-    ax.set_ylabel('')
-    ax.set_title('')
-    ax.axis('off')  # FORCE turn off all axis elements
-    
-    # Remove any text objects
-    for text in ax.texts:
-        text.set_visible(False)
-    
-    # FORCE tight layout with pink background
-    fig.tight_layout(pad=0)
-    
-    return fig
-
-
 def get_dashboard_conclusions_from_image(dashboard_instance):
     """
     Load dynamic conclusions from JSON file (saved by dashboard)
@@ -742,8 +943,6 @@ def get_dashboard_conclusions_from_image(dashboard_instance):
             with open(conclusions_file, 'r') as f:
                 conclusions_data = json.load(f)
             
-            print(f" Loaded JSON data: {conclusions_data}")
-            
             # Extract findings from JSON
             findings = conclusions_data.get('findings', [])
             
@@ -758,9 +957,8 @@ def get_dashboard_conclusions_from_image(dashboard_instance):
             print(f" Conclusions JSON file not found: {conclusions_file}")
     
     except Exception as json_err:
-        print(f" Error loading conclusions from JSON: {json_err}")
-        import traceback
-        traceback.print_exc()
+        # Malformed/locked file is an expected miss - one line, no traceback
+        logger.warning("conclusions load failed: %s: %s", type(json_err).__name__, json_err)
     
     # **REMOVED: Old code that extracted from dashboard_instance.conclusion_box**
     # **REMOVED: Fallback default conclusions**
@@ -776,144 +974,216 @@ def get_dashboard_conclusions_from_image(dashboard_instance):
         print(" Using zero-value fallback (no ECG data available)")
     
     # Ensure we have exactly 12 conclusions (pad with empty strings if needed)
+    # Pad with "---" for empty slots and limit to maximum 12 in one step
     MAX_CONCLUSIONS = 12
-    while len(conclusions) < MAX_CONCLUSIONS:
-        conclusions.append("---")  # Use "---" for empty slots
-    
-    # Limit to maximum 12 conclusions
-    conclusions = conclusions[:MAX_CONCLUSIONS]
+    conclusions = (conclusions + ["---"] * MAX_CONCLUSIONS)[:MAX_CONCLUSIONS]
     
-    print(f" Final conclusions list (12 total): {len([c for c in conclusions if c and c != '---'])} filled, {len([c for c in conclusions if not c or c == '---'])} blank")
+    filled = sum(1 for c in conclusions if c and c != '---')
+    print(f" Final conclusions list (12 total): {filled} filled, {MAX_CONCLUSIONS - filled} blank")
     
     return conclusions
 
 
+_METRICS_TAIL_BYTES = 64 * 1024
+
+def _read_last_json_array_item(f, size):
+    """
+    Decode the last object of a top-level JSON array by reading only the file tail.
+    Returns: dict, or None if the tail alone can't answer (caller falls back to a full parse)
+    """
+    read_size = min(size, _METRICS_TAIL_BYTES)
+    f.seek(size - read_size)
+    tail = f.read(read_size).decode('utf-8', errors='ignore').rstrip()
+    if not tail.endswith(']'):
+        return None
+    body = tail[:-1].rstrip()
+    if not body.endswith('}'):
+        return None
+
+    # Walk '{' candidates right-to-left: the last item is the object that parses
+    # exactly to the end of the array and sits directly after '[' or ','
+    decoder = json.JSONDecoder()
+    pos = body.rfind('{')
+    while pos != -1:
+        try:
+            obj, end = decoder.raw_decode(body, pos)
+        except ValueError:
+            obj, end = None, -1
+        if end == len(body) and isinstance(obj, dict) and body[:pos].rstrip().endswith((',', '[')):
+            return obj
+        pos = body.rfind('{', 0, pos)
+    return None
+
 def load_latest_metrics_entry(reports_dir):
     """
     Return the most recent metrics entry from reports/metrics.json, if available.
+    The file is a JSON list that grows with every report, so the last entry is
+    decoded from the file tail; older/other shapes fall back to a full parse.
     """
     metrics_path = os.path.join(reports_dir, 'metrics.json')
-    if not os.path.exists(metrics_path):
-        return None
     try:
-        with open(metrics_path, 'r') as f:
+        # No separate exists() check: open failing is the "no file" case
+        with open(metrics_path, 'rb') as f:
+            if f.read(64).lstrip().startswith(b'['):
+                entry = _read_last_json_array_item(f, os.fstat(f.fileno()).st_size)
+                if entry is not None:
+                    return entry
+            f.seek(0)
             data = json.load(f)
+    except (FileNotFoundError, IsADirectoryError):
+        return None
+    except Exception as e:
+        print(f" Could not read metrics file for HR: {e}")
+        return None
+
+    if isinstance(data, list) and data:
+        return data[-1]
+
+    if isinstance(data, dict):
+        # support older shape where 'entries' may list the items
+        entries = data.get('entries')
+        if isinstance(entries, list) and entries:
+            return entries[-1]
 
-        if isinstance(data, list) and data:
-            return data[-1]
+        # if dict already looks like one entry, return it
+        if data.get('timestamp'):
+            return data
+    return None
 
-        if isinstance(data, dict):
-            # support older shape where 'entries' may list the items
-            entries = data.get('entries')
-            if isinstance(entries, list) and entries:
-                return entries[-1]
+# Static header/footer label widths (standard Type1 fonts - metrics never change)
+_ORG_LABEL_W9 = stringWidth("Org:", "Helvetica-Bold", 9)
+_PHONE_LABEL_W9 = stringWidth("Phone No:", "Helvetica-Bold", 9)
+_FOOTER_TEXT = "Deckmount Electronic , Plot No. 260, Phase IV, Udyog Vihar, Sector 18, Gurugram, Haryana 122015"
+_FOOTER_TEXT_W = stringWidth(_FOOTER_TEXT, "Helvetica", 8)
 
-            # if dict already looks like one entry, return it
-            if data.get('timestamp'):
-                return data
+@lru_cache(maxsize=1)
+def _get_logo_reader():
+    """
+    Resolve and decode the Deckmount logo once per report (the module is
+    re-executed for every report, so the cache does not carry over)
+    Returns: ImageReader for the PNG (or WebP fallback), or None if neither exists
+    """
+    from reportlab.lib.utils import ImageReader
+    
+    # Use resource_path helper for PyInstaller compatibility
+    png_path = _get_resource_path("assets/Deckmountimg.png")
+    webp_path = _get_resource_path("assets/Deckmount.webp")
+    logo_path = png_path if os.path.exists(png_path) else webp_path
+    if not os.path.exists(logo_path):
+        return None
+    try:
+        return ImageReader(logo_path)
     except Exception as e:
-        print(f" Could not read metrics file for HR: {e}")
-def _draw_logo_and_footer_callback(canvas, doc_obj, patient=None):
-    from reportlab.lib.units import mm
+        print(f" Could not load logo image: {e}")
+        return None
+
+def _draw_page1_grid(canvas, page_width, page_height):
+    """Draw the full-page pink ECG paper (background + minor/major grid) for page 1"""
+    # ========== 57 BOXES IN FULL 297MM PAGE WIDTH ==========
+    # Page width: 297mm (full A4 landscape)
+    # Number of boxes: 57
+    # Box size: 297mm / 57 = 5.2105mm per box
+    num_boxes_width = 57
+    page_width_mm = 297.0
+    box_width_mm = page_width_mm / num_boxes_width  # 297/57 = 5.2105mm per box
+    box_width_pts = box_width_mm * mm
+    
+    # Pink background - FULL PAGE (297mm width, no white space)
+    canvas.setFillColor(_BG_COLOR)
+    canvas.rect(0, 0, page_width, page_height, fill=1, stroke=0)
+    
+    # Grid colors
+    light_grid_color = _MINOR_GRID_COLOR
+    major_grid_color = _MAJOR_GRID_COLOR
+    
+    # Minor grid lines - 1mm spacing (scaled proportionally)
+    # In each box of 5.2105mm, we want 5 minor divisions (1mm each)
+    # So minor spacing = box_width / 5 = 5.2105 / 5 = 1.042mm
+    minor_spacing_mm = box_width_mm / 5.0  # 1.042mm per minor division
+    minor_spacing_pts = minor_spacing_mm * mm
+    
+    # Each group of lines goes out as one canvas.lines() batch instead of a
+    # canvas.line() call per line. Positions are accumulated exactly as before
+    # so the grid coordinates are unchanged.
+    canvas.setStrokeColor(light_grid_color)
+    canvas.setLineWidth(0.6)  # Minor grid lines (1mm spacing) - keep original thickness
+    # Vertical minor lines - full page width (297mm)
+    minor_lines = []
+    x = 0
+    while x <= page_width:
+        minor_lines.append((x, 0, x, page_height))
+        x += minor_spacing_pts
+    
+    # Horizontal minor lines - full page height
+    minor_spacing_y = 1.0 * mm  # 1mm vertical spacing
+    y = 0
+    while y <= page_height:
+        minor_lines.append((0, y, page_width, y))
+        y += minor_spacing_y
+    canvas.lines(minor_lines)
+    
+    # Major grid lines - exactly 57 boxes across full 297mm width
+    canvas.setStrokeColor(major_grid_color)
+    canvas.setLineWidth(0.6)  # Thinner major grid lines (5mm spacing) - was 1.2
+    # Vertical major lines - 57 boxes (297mm width, 5.2105mm per box)
+    major_lines = []
+    x = 0
+    for i in range(num_boxes_width + 1):  # 58 lines for 57 boxes
+        major_lines.append((x, 0, x, page_height))
+        x += box_width_pts
+    
+    # Horizontal major lines - 40 boxes (210mm height, 5.25mm per box)
+    num_boxes_height = 40
+    page_height_mm = 210.0
+    box_height_mm = page_height_mm / num_boxes_height  # 210/40 = 5.25mm per box
+    box_height_pts = box_height_mm * mm
+    y = 0
+    for i in range(num_boxes_height + 1):  # 41 lines for 40 boxes
+        major_lines.append((0, y, page_width, y))
+        y += box_height_pts
+    canvas.lines(major_lines)
+
+def _draw_page1_header(canvas, patient, x, y_top):
+    """
+    Draw Date/Time and Org/Phone No. as one text block on page 1.
+    Lines are 15pt apart starting at y_top. All bold labels are drawn first,
+    then all regular text, so the font is switched only twice.
+    """
+    now = datetime.now()
+    date_y, time_y, org_y, phone_y = y_top, y_top - 15, y_top - 30, y_top - 45
+    
+    canvas.saveState()
+    canvas.setFillColor(colors.black)
+    
+    canvas.setFont("Helvetica-Bold", 9)
+    canvas.drawString(x, org_y, "Org:")
+    canvas.drawString(x, phone_y, "Phone No:")
     
+    canvas.setFont("Helvetica", 9)
+    canvas.drawString(x, date_y, f"Date: {now.strftime('%d/%m/%Y')}")
+    canvas.drawString(x, time_y, f"Time: {now.strftime('%H:%M:%S')}")
+    canvas.drawString(x + _ORG_LABEL_W9 + 5, org_y, patient.get("Org.", "") if patient else "")
+    canvas.drawString(x + _PHONE_LABEL_W9 + 5, phone_y, patient.get("doctor_mobile", "") if patient else "")
+    canvas.restoreState()
+
+def _draw_logo_and_footer_callback(canvas, doc_obj, patient=None):
     # STEP 1: Draw pink ECG grid background on Page 1 (now the only landscape page)
     if canvas.getPageNumber() == 1:
         page_width, page_height = canvas._pagesize
         
-        # ========== 57 BOXES IN FULL 297MM PAGE WIDTH ==========
-        # Page width: 297mm (full A4 landscape)
-        # Number of boxes: 57
-        # Box size: 297mm / 57 = 5.2105mm per box
-        num_boxes_width = 57
-        page_width_mm = 297.0
-        box_width_mm = page_width_mm / num_boxes_width  # 297/57 = 5.2105mm per box
-        box_width_pts = box_width_mm * mm
-        
-        # Pink background - FULL PAGE (297mm width, no white space)
-        canvas.setFillColor(colors.HexColor("#ffe6e6"))
-        canvas.rect(0, 0, page_width, page_height, fill=1, stroke=0)
-        
-        # Grid colors
-        light_grid_color = colors.HexColor("#ffd1d1")
-        major_grid_color = colors.HexColor("#ffb3b3")
-        
-        # Minor grid lines - 1mm spacing (scaled proportionally)
-        # In each box of 5.2105mm, we want 5 minor divisions (1mm each)
-        # So minor spacing = box_width / 5 = 5.2105 / 5 = 1.042mm
-        minor_spacing_mm = box_width_mm / 5.0  # 1.042mm per minor division
-        minor_spacing_pts = minor_spacing_mm * mm
-        
-        canvas.setStrokeColor(light_grid_color)
-        canvas.setLineWidth(0.6)  # Minor grid lines (1mm spacing) - keep original thickness
-        # Vertical minor lines - full page width (297mm)
-        x = 0
-        while x <= page_width:
-            canvas.line(x, 0, x, page_height)
-            x += minor_spacing_pts
-            if x > page_width:
-                break
-        
-        # Horizontal minor lines - full page height
-        minor_spacing_y = 1.0 * mm  # 1mm vertical spacing
-        y = 0
-        while y <= page_height:
-            canvas.line(0, y, page_width, y)
-            y += minor_spacing_y
-        
-        # Major grid lines - exactly 57 boxes across full 297mm width
-        canvas.setStrokeColor(major_grid_color)
-        canvas.setLineWidth(0.6)  # Thinner major grid lines (5mm spacing) - was 1.2
-        # Vertical major lines - 57 boxes (297mm width, 5.2105mm per box)
-        x = 0
-        for i in range(num_boxes_width + 1):  # 58 lines for 57 boxes
-            canvas.line(x, 0, x, page_height)
-            x += box_width_pts
-        
-        # Horizontal major lines - 40 boxes (210mm height, 5.25mm per box)
-        num_boxes_height = 40
-        page_height_mm = 210.0
-        box_height_mm = page_height_mm / num_boxes_height  # 210/40 = 5.25mm per box
-        box_height_pts = box_height_mm * mm
-        y = 0
-        for i in range(num_boxes_height + 1):  # 41 lines for 40 boxes
-            canvas.line(0, y, page_width, y)
-            y += box_height_pts
-    
-    # STEP 1.5: Draw Org. and Phone No. on Page 1 (REPOSITIONED - slightly higher, more left)
-    if canvas.getPageNumber() == 1:
-        canvas.saveState()
-        # Portrait A4 height = 842 points, position very close to top
-        page_height = 842  # A4 portrait height
-        x_pos = 15  # More to the left (was 30, now 15)
-        y_pos = page_height - 30
-        
-        canvas.setFont("Helvetica-Bold", 10)
-        canvas.setFillColor(colors.black)
-        org_label = "Org:"
-        canvas.drawString(x_pos, y_pos, org_label)
-        
-        org_label_width = canvas.stringWidth(org_label, "Helvetica-Bold", 10)
-        canvas.setFont("Helvetica", 10)
-        canvas.drawString(x_pos + org_label_width + 5, y_pos, patient.get("Org.", "") if patient else "")
-        
-        y_pos -= 15
-        
-        canvas.setFont("Helvetica-Bold", 10)
-        phone_label = "Phone No:"
-        canvas.drawString(x_pos, y_pos, phone_label)
-        
-        phone_label_width = canvas.stringWidth(phone_label, "Helvetica-Bold", 10)
-        canvas.setFont("Helvetica", 10)
-        canvas.drawString(x_pos + phone_label_width + 5, y_pos, patient.get("doctor_mobile", "") if patient else "")
-        canvas.restoreState()
+        # The grid is static: record it once per document as a Form XObject
+        # and stamp it with a single Do operator
+        grid_form_name = "ecg_page1_grid"
+        if not canvas.hasForm(grid_form_name):
+            canvas.beginForm(grid_form_name, 0, 0, page_width, page_height)
+            _draw_page1_grid(canvas, page_width, page_height)
+            canvas.endForm()
+        canvas.doForm(grid_form_name)
     
     # STEP 2: Draw logo (REPOSITIONED - lower from top)
-    # Use resource_path helper for PyInstaller compatibility
-    png_path = _get_resource_path("assets/Deckmountimg.png")
-    webp_path = _get_resource_path("assets/Deckmount.webp")
-    logo_path = png_path if os.path.exists(png_path) else webp_path
+    logo_reader = _get_logo_reader()
     
-    if os.path.exists(logo_path):
+    if logo_reader is not None:
         canvas.saveState()
         if canvas.getPageNumber() == 1:
             # Page 1 is now LANDSCAPE - logo at top right
@@ -928,68 +1198,23 @@ def _draw_logo_and_footer_callback(canvas, doc_obj, patient=None):
             x = 595 - logo_w - 30  # 595 = A4 width, 30 = right margin
             y = page_height - 35  # 35 points from top
         try:
-            canvas.drawImage(logo_path, x, y, width=logo_w, height=logo_h, preserveAspectRatio=True, mask="auto")
+            canvas.drawImage(logo_reader, x, y, width=logo_w, height=logo_h, preserveAspectRatio=True, mask="auto")
         except Exception:
             pass
         canvas.restoreState()
     
-    # STEP 2.5: Add Date and Time labels below logo on Page 1
+    # STEP 2.5: Date/Time and Org/Phone below the logo on Page 1
     if canvas.getPageNumber() == 1:
-        from datetime import datetime
-        canvas.saveState()
-        canvas.setFont("Helvetica", 9)
-        canvas.setFillColor(colors.black)
-        
-        # Get current date and time
-        now = datetime.now()
-        date_str = now.strftime("%d/%m/%Y")
-        time_str = now.strftime("%H:%M:%S")
-        
-        # Position below logo (logo ends at y, so date at y-15, time at y-30)
-        # Page 1 is now LANDSCAPE - use same x position as logo (right aligned)
         page_width, page_height = canvas._pagesize
         logo_w = 120
-        date_x = page_width - logo_w - 35  # Same x as logo
-        time_x = page_width - logo_w - 35  # Same x as logo
-        date_y = page_height - 40  # Right below logo (shifted up 5 more points from -45)
-        time_y = page_height - 55  # 15 points below logo (shifted up 5 more points from -60)
-        
-        # Draw date label
-        canvas.drawString(date_x, date_y, f"Date: {date_str}")
-        # Draw time label  
-        canvas.drawString(time_x, time_y, f"Time: {time_str}")
-        
-        # STEP 2.6: Add Org and Phone No. labels below date/time on Page 2
-        canvas.setFont("Helvetica-Bold", 9)
-        canvas.setFillColor(colors.black)
-        
-        # Org label (15 points below time)
-        org_y = page_height - 70  # 15 points below time (time_y = -55, so -55 - 15 = -70)
-        org_label = "Org:"
-        canvas.drawString(date_x, org_y, org_label)
-        
-        org_label_width = canvas.stringWidth(org_label, "Helvetica-Bold", 9)
-        canvas.setFont("Helvetica", 9)
-        canvas.drawString(date_x + org_label_width + 5, org_y, patient.get("Org.", "") if patient else "")
-        
-        # Phone No. label (15 points below org)
-        phone_y = page_height - 85  # 15 points below org (org_y = -70, so -70 - 15 = -85)
-        canvas.setFont("Helvetica-Bold", 9)
-        phone_label = "Phone No:"
-        canvas.drawString(date_x, phone_y, phone_label)
-        
-        phone_label_width = canvas.stringWidth(phone_label, "Helvetica-Bold", 9)
-        canvas.setFont("Helvetica", 9)
-        canvas.drawString(date_x + phone_label_width + 5, phone_y, patient.get("doctor_mobile", "") if patient else "")
-        
-        canvas.restoreState()
+        _draw_page1_header(canvas, patient, page_width - logo_w - 35, page_height - 40)  # Same x as logo
     
     # STEP 3: Footer
     canvas.saveState()
     canvas.setFont("Helvetica", 8)
     canvas.setFillColor(colors.black)
-    footer_text = "Deckmount Electronic , Plot No. 260, Phase IV, Udyog Vihar, Sector 18, Gurugram, Haryana 122015"
-    text_width = canvas.stringWidth(footer_text, "Helvetica", 8)
+    footer_text = _FOOTER_TEXT
+    text_width = _FOOTER_TEXT_W
     
     if canvas.getPageNumber() == 2:
         # Page 2 is LANDSCAPE
@@ -1050,6 +1275,17 @@ def generate_6_2_ecg_report(filename="ecg_report.pdf", data=None, lead_images=No
 
     from utils.settings_manager import SettingsManager
     settings_manager = SettingsManager()
+    # Snapshot of every setting this report reads - looked up once, reused below
+    report_settings = {
+        key: settings_manager.get_setting(key, default)
+        for key, default in (
+            ("wave_speed", "25"),
+            ("wave_gain", "10"),
+            ("lead_sequence", "Standard"),
+            ("filter_band", "0.5~35Hz"),
+            ("ac_frequency", "50"),
+        )
+    }
 
     def _safe_float(value, default):
         try:
@@ -1063,6 +1299,13 @@ def generate_6_2_ecg_report(filename="ecg_report.pdf", data=None, lead_images=No
         except Exception:
             return default
 
+    def _is_zero_metric(value):
+        # Numeric zero, or one of the "no value" placeholders
+        try:
+            return float(value) == 0.0
+        except Exception:
+            return str(value).strip() in ["0", "--", "", "None"]
+
     # ==================== STEP 1: Get HR_bpm from metrics.json (PRIORITY) ====================
     # Priority: metrics.json  latest HR_bpm  (calculation-based beats  )
     latest_metrics = load_latest_metrics_entry(reports_dir)
@@ -1097,8 +1340,8 @@ def generate_6_2_ecg_report(filename="ecg_report.pdf", data=None, lead_images=No
 
     # ==================== STEP 2: Get wave_speed from ecg_settings.json (PRIORITY) ====================
     # Priority: ecg_settings.json  wave_speed  (calculation-based beats  )
-    wave_speed_setting = settings_manager.get_setting("wave_speed", "25")
-    wave_gain_setting = settings_manager.get_setting("wave_gain", "10")
+    wave_speed_setting = report_settings["wave_speed"]
+    wave_gain_setting = report_settings["wave_gain"]
     wave_speed_mm_s = _safe_float(wave_speed_setting, 25.0)  # Default: 25.0 mm/s
     wave_gain_mm_mv = _safe_float(wave_gain_setting, 10.0)   # Default: 10.0 mm/mV
     print(f" Using wave_speed from ecg_settings.json: {wave_speed_mm_s} mm/s (for calculation-based beats)")
@@ -1148,6 +1391,12 @@ def generate_6_2_ecg_report(filename="ecg_report.pdf", data=None, lead_images=No
     
     if not saved_ecg_data:
         print(" Warning: No saved ECG data available - beats will not be calculation-based")
+    
+    # Saved leads as float32 arrays, resolved once (no-op for arrays the loader already converted)
+    saved_leads = {}
+    if saved_ecg_data:
+        saved_leads = {name: np.asarray(samples, dtype=np.float32)
+                       for name, samples in saved_ecg_data.get('leads', {}).items()}
 
     # Get conclusions from dashboard/JSON
     dashboard_conclusions = get_dashboard_conclusions_from_image(dashboard_instance)
@@ -1156,13 +1405,8 @@ def generate_6_2_ecg_report(filename="ecg_report.pdf", data=None, lead_images=No
     # persisted conclusions and use the explicit "no data" conclusions instead.
     try:
         core_keys = ["HR", "PR", "QRS", "QT", "QTc", "ST"]
-        all_zero = True
-        for k in core_keys:
-            v = data.get(k, 0)
-            try:
-                all_zero = all_zero and (float(v) == 0.0)
-            except Exception:
-                all_zero = all_zero and (str(v).strip() in ["0", "--", "", "None"])
+        # Stops at the first non-zero metric
+        all_zero = all(_is_zero_metric(data.get(k, 0)) for k in core_keys)
         if all_zero:
             dashboard_conclusions = [
                 " No ECG data available",
@@ -1203,8 +1447,6 @@ def generate_6_2_ecg_report(filename="ecg_report.pdf", data=None, lead_images=No
 
     #  FORCE DELETE ALL OLD WHITE BACKGROUND IMAGES
     if lead_images is None:
-        print("  DELETING ALL OLD WHITE BACKGROUND IMAGES...") 
-        
         # Get both possible locations
         current_dir = os.path.dirname(os.path.abspath(__file__)) 
         project_root = os.path.join(current_dir, '..', '..')
@@ -1212,730 +1454,192 @@ def generate_6_2_ecg_report(filename="ecg_report.pdf", data=None, lead_images=No
         src_dir = os.path.join(current_dir, '..')
         
         leads = ["I", "II", "III", "aVR", "aVL", "aVF", "V1", "V2", "V3", "V4", "V5", "V6"] 
-        
-        # DELETE from both locations
-        for lead in leads:
-            # Location 1: project root
-            img_path1 = os.path.join(project_root, f"lead_{lead}.png")
-            if os.path.exists(img_path1):
-                os.remove(img_path1)
-                print(f"  Deleted OLD image: {img_path1}")
-            
-            # Location 2: src directory  
-            img_path2 = os.path.join(src_dir, f"lead_{lead}.png")
-            if os.path.exists(img_path2):
-                os.remove(img_path2)
-                print(f"  : {img_path2}")
-        
-        print(" CREATING NEW PINK GRID IMAGES...")
-        
-        # Create NEW pink grid images
-        lead_images = {}
-        for lead in leads:
-            try:
-                # Create pink grid ECG
-                fig = create_ecg_grid_with_waveform(None, lead, width=6, height=2)
-                
-                # Save to project root with pink background
-                img_path = os.path.join(project_root, f"lead_{lead}.png")
-                fig.savefig(img_path, 
-                           dpi=200, 
-                           bbox_inches='tight', 
-                           pad_inches=0.05,
-                           facecolor='#ffe6e6',  # PINK background
-                           edgecolor='none',
-                           format='png')
-                plt.close(fig)
-                
-                lead_images[lead] = img_path
-                print(f" Created NEW PINK GRID image: {img_path}")
-                
-            except Exception as e:
-                print(f" Error creating {lead}: {e}")
-        
-        if not lead_images:
-            return "Error: Could not create PINK GRID ECG images"
-    
-    # Get REAL ECG drawings from live test page
-    print(" Capturing REAL ECG data from live test page...")
-    
-    # Check if demo mode is active and data is available
-    if ecg_test_page and hasattr(ecg_test_page, 'demo_toggle'):
-        is_demo = ecg_test_page.demo_toggle.isChecked()
-        if is_demo:
-            print(" DEMO MODE DETECTED - Checking data availability...")
-            if hasattr(ecg_test_page, 'data') and len(ecg_test_page.data) > 0:
-                # Check if data has actual variation (not just zeros)
-                sample_data = ecg_test_page.data[0] if len(ecg_test_page.data) > 0 else []
-                if len(sample_data) > 0:
-                    std_val = np.std(sample_data)
-                    print(f"    Data buffer size: {len(sample_data)}, Std deviation: {std_val:.4f}")
-                    if std_val < 0.01:
-                        print("    WARNING: Demo data appears to be flat/empty!")
-                        print("    TIP: Make sure demo has been running for at least 5 seconds before generating report")
-                    else:
-                        print(f"    Demo data looks good (variation detected)")
-                else:
-                    print("    WARNING: Data buffer is empty!")
-            else:
-                print("    ERROR: No data structure found!")
-    
-    lead_drawings = capture_real_ecg_graphs_from_dashboard(
-        dashboard_instance,
-        ecg_test_page,
-        samples_per_second=computed_sampling_rate,
-        settings_manager=settings_manager
-    )
-    
-    # Get lead sequence from settings (already initialized above)
-    lead_sequence = settings_manager.get_setting("lead_sequence", "Standard")
-    
-    # Define lead orders based on sequence
-    LEAD_SEQUENCES = {
-        "Standard": ["I", "II", "III", "aVR", "aVL", "aVF", "V1", "V2", "V3", "V4", "V5", "V6"],
-        "Cabrera": ["aVL", "I", "-aVR", "II", "aVF", "III", "V1", "V2", "V3", "V4", "V5", "V6"]
-    }
-    
-    # Use the appropriate sequence for REPORT ONLY
-    lead_order = LEAD_SEQUENCES.get(lead_sequence, LEAD_SEQUENCES["Standard"])
-    
-    print(f" Using lead sequence for REPORT: {lead_sequence}")
-    print(f" Lead order for REPORT: {lead_order}")
-
-    # Create BaseDocTemplate for mixed page orientations (from hyperkalemia)
-    doc = BaseDocTemplate(filename, pagesize=A4,
-                         rightMargin=30, leftMargin=30,
-                         topMargin=30, bottomMargin=30)
-    # Create wrapper function for callback with patient parameter
-    def callback_wrapper(canvas, doc):
-        return _draw_logo_and_footer_callback(canvas, doc, patient)
-
-
-    # Define Landscape template as DEFAULT (only template) with onPage callback
-    landscape_width, landscape_height = landscape(A4)
-    # Reduce margins to increase frame size (from 30 to 20 on each side)
-    landscape_frame = Frame(20, 20,  # reduced margins for landscape to fit taller drawing
-                           landscape_width - 40, landscape_height - 40,
-                           id="landscape_frame")
-    landscape_template = PageTemplate(id="landscape", frames=[landscape_frame],
-                                     pagesize=landscape(A4), onPage=callback_wrapper)
-
-    # Add ONLY landscape template as default
-    doc.addPageTemplates([landscape_template])
-
-    story = []
-    styles = getSampleStyleSheet()
-    
-    # Skip title and other Page 1 content - go directly to landscape ECG content
-
-    # Skip all Page 1 content - go directly to landscape ECG graphs
-    # Patient details will be shown in the landscape page master drawing
-
-    # Patient details for landscape page (will be used in master drawing)
-    if patient is None:
-        patient = {}
-    first_name = patient.get("first_name", "")
-    last_name = patient.get("last_name", "")
-    full_name = f"{first_name} {last_name}".strip()
-    age = patient.get("age", "")
-    gender = patient.get("gender", "")
-    date_time_str = patient.get("date_time", "")
-
-    # REMOVED: Date/Time table from story - will be added in master drawing instead
-    # Patient info and vital parameters are now in master drawing above ECG graph
-    # No extra spacing needed as they're positioned in drawing coordinates
-
-    
-    # Vital Parameters Header (completely transparent)
-    vital_style = ParagraphStyle(
-        'VitalStyle',
-        fontSize=12,  # Increased from 11
-        fontName='Helvetica-Bold',
-        textColor=colors.black,
-        spaceAfter=15,
-        alignment=1,  # center
-        # Add white background 
-        # for better visibility on pink grid
-        backColor=colors.white,
-    )
-
-    # Vital Parameters Header (on top of background)
-    vital_style = ParagraphStyle(
-
-
-            
-        'VitalStyle',
-        fontSize=11,
-        fontName='Helvetica-Bold',
-        textColor=colors.black,
-        spaceAfter=15,
-        alignment=1,  # center
-        
-    )
-
-    # Get real ECG data from dashboard
-    HR = data.get('HR_avg', 70)
-    PR = data.get('PR', 192) 
-    QRS = data.get('QRS', 93)
-    QT = data.get('QT', 354)
-    QTc = data.get('QTc', 260)
-    QTcF = data.get('QTc_Fridericia') or data.get('QTcF') or 0
-    ST = data.get('ST', 114)
-    # DYNAMIC RR interval calculation from heart rate (instead of hard-coded 857)
-    RR = int(60000 / HR) if HR and HR > 0 else 0  # RR interval in ms from heart rate
-   
-
-    # Create table data: 4 rows × 2 columns
-    vital_table_data = [
-        [f"HR : {int(round(HR))} bpm", f"QT: {int(round(QT))} ms"],
-        [f"PR : {int(round(PR))} ms", f"QTc: {int(round(QTc))} ms"],
-        [f"QRS: {int(round(QRS))} ms", f"ST: {int(round(ST))} ms"],
-        [f"RR : {int(round(RR))} ms", f"QTcF: {QTcF/1000.0:.3f} s"]  
-    ]
-
-    # Create vital parameters table with MORE LEFT and TOP positioning
-    vital_params_table = Table(vital_table_data, colWidths=[100, 100])  # Even smaller widths for more left
-
-    vital_params_table.setStyle(TableStyle([
-        # Transparent background to show pink grid
-        ("BACKGROUND", (0, 0), (-1, -1), colors.Color(0, 0, 0, alpha=0)),
-        ("GRID", (0, 0), (-1, -1), 0, colors.Color(0, 0, 0, alpha=0)),
-        ("BOX", (0, 0), (-1, -1), 0, colors.Color(0, 0, 0, alpha=0)),
-        ("ALIGN", (0, 0), (-1, -1), "LEFT"),  # Left align
-        ("VALIGN", (0, 0), (-1, -1), "TOP"),
-        ("FONTNAME", (0, 0), (-1, -1), "Helvetica"),  # Normal font
-        ("FONTSIZE", (0, 0), (-1, -1), 10),  # Same size as Name, Age, Gender
-        ("TEXTCOLOR", (0, 0), (-1, -1), colors.black),
-        ("LEFTPADDING", (0, 0), (-1, -1), 0),  # Zero left padding for extreme left
-        ("RIGHTPADDING", (0, 0), (-1, -1), 0),  # Zero right padding too
-        ("TOPPADDING", (0, 0), (-1, -1), 0),   # Zero top padding for top shift
-        ("BOTTOMPADDING", (0, 0), (-1, -1), 0),
-    ]))
-
-   
-
-    #  CREATE SINGLE MASSIVE DRAWING with ALL ECG content (NO individual drawings)
-    print("Creating SINGLE drawing with all ECG content...")
-    
-    # Single drawing dimensions - ADJUSTED HEIGHT to fit within page frame (max ~770)
-    total_width = 780   # Full page width
-    total_height = 540  # Reduced to 720 to fit within page frame (max ~770) with margin
-    
-    # Create ONE master drawing
-    master_drawing = Drawing(total_width, total_height)
-    
-    # STEP 1: NO background rectangle - let page pink grid show through
-    
-    # STEP 2: Define positions for all 12 leads in VERTICAL COLUMNS
-    # Column 1: vertical stack from top to bottom, Column 2: vertical stack from top to bottom
-    lead_positions = []
-    
-    # Define which leads go in which column
-    column1_leads = ["I", "II", "III", "aVR", "aVL", "aVF"]  # First 6 leads - vertical column
-    column2_leads = ["V1", "V2", "V3", "V4", "V5", "V6"]     # Last 6 leads - vertical column
-    
-    # QTc label is at Y=455, so start leads 60 points below that
-    qtc_y_position = 455
-    start_y = qtc_y_position - 60 + 17  # 412 (60 points below QTc + 17 points up shift)
-    
-    for i, lead in enumerate(lead_order):
-        # Determine X position based on which column this lead belongs to
-        if lead in column1_leads:
-            # Column 1: Vertical stack - all at same X, different Y
-            lead_index = column1_leads.index(lead)
-            # Shift ALL column1 leads 45 points to the left
-            x_pos = 20 - 45  # -25 (shifted left 45 points)
-            y_pos = start_y - (lead_index * 60)  # GO DOWNWARD: 395, 335, 275, 215, 155, 95
-        else:
-            # Column 2: Vertical stack - all at same X, different Y
-            lead_index = column2_leads.index(lead)
-            x_pos = 400  # ALL column2 leads at same X position (center/right side)
-            y_pos = start_y - (lead_index * 60)  # GO DOWNWARD: 395, 335, 275, 215, 155, 95
-        
-        lead_positions.append({
-            "lead": lead, 
-            "x": x_pos, 
-            "y": y_pos
-        })
-    
-    print(f" Using lead positions in {lead_sequence} sequence: {[pos['lead'] for pos in lead_positions]}")
-    
-    # STEP 3: Draw ALL ECG content directly in master drawing
-    successful_graphs = 0
-    
-    # Check if demo mode is active and get time window for filtering
-    is_demo_mode = False
-    time_window_seconds = None
-    samples_per_second = computed_sampling_rate
-    
-    if ecg_test_page and hasattr(ecg_test_page, 'demo_toggle'):
-        is_demo_mode = ecg_test_page.demo_toggle.isChecked()
-        if is_demo_mode:
-            # Get time window from demo manager
-            if hasattr(ecg_test_page, 'demo_manager') and ecg_test_page.demo_manager:
-                time_window_seconds = getattr(ecg_test_page.demo_manager, 'time_window', None)
-                samples_per_second = getattr(ecg_test_page.demo_manager, 'samples_per_second', samples_per_second)
-                print(f" Report Generator: Demo mode ON - Wave speed window: {time_window_seconds}s, Sampling rate: {samples_per_second}Hz")
-            else:
-                # Fallback: calculate from wave speed setting
-                try:
-                    from utils.settings_manager import SettingsManager
-                    sm = SettingsManager()
-                    wave_speed = float(sm.get_wave_speed())
-                    # NEW LOGIC: Time window = 165mm / wave_speed (33 boxes × 5mm = 165mm)
-                    ecg_graph_width_mm = 33 * 5  # 165mm
-                    time_window_seconds = ecg_graph_width_mm / wave_speed
-                    print(f" Report Generator: Demo mode ON - Calculated window using NEW LOGIC: 165mm / {wave_speed}mm/s = {time_window_seconds}s")
-                except Exception as e:
-                    print(f" Could not get demo time window: {e}")
-                    time_window_seconds = None
-        else:
-            print(f" Report Generator: Demo mode is OFF")
-    
-    # Calculate number of samples to capture based on demo mode OR BPM + wave_speed
-    calculated_time_window = None  # Initialize for use in data loading section
-    if is_demo_mode and time_window_seconds is not None:
-        # In demo mode: only capture data visible in one window frame
-        calculated_time_window = time_window_seconds
-        num_samples_to_capture = int(time_window_seconds * samples_per_second)
-        print(f" DEMO MODE: Master drawing will capture only {num_samples_to_capture} samples ({time_window_seconds}s window)")
-    else:
-        # Normal mode: Calculate time window based on wave_speed ONLY (NEW LOGIC)
-        # This ensures proper number of beats are displayed based on graph width
-        # Formula: 
-        #   - Time window = 165mm / wave_speed ONLY (33 boxes × 5mm = 165mm)
-        #   - BPM window is NOT used - only wave speed determines time window
-        #   - Beats = (BPM / 60) × time_window
-        #   - Maximum clamp: 20 seconds (NO minimum clamp)
-        calculated_time_window, _ = calculate_time_window_from_bpm_and_wave_speed(
-            hr_bpm_value,      # 90 bpm
-            wave_speed_mm_s,   # 25 mm/s (current)
-            desired_beats=15   
-        )
-        
-        # Recalculate with actual sampling rate
-        num_samples_to_capture = int(calculated_time_window * computed_sampling_rate)
-        print(f" NORMAL MODE: Calculated time window: {calculated_time_window:.2f}s")
-        print(f"   Based on BPM={hr_bpm_value} and wave_speed={wave_speed_mm_s}mm/s")
-        print(f"   Will capture {num_samples_to_capture} samples (at {computed_sampling_rate}Hz)")
-        if hr_bpm_value > 0:
-            expected_beats = int((calculated_time_window * hr_bpm_value) / 60)
-            print(f"   Expected beats shown: ~{expected_beats} beats")
-    
-    for pos_info in lead_positions:
-        lead = pos_info["lead"]
-        x_pos = pos_info["x"]
-        y_pos = pos_info["y"]
-        
-        print(f" DEBUG: Processing Lead {lead} at position ({x_pos}, {y_pos})")
-        print(f" DEBUG: Drawing dimensions: width={total_width}, height={total_height}")
-        
-        try:
-            # STEP 3A: Add lead labels 15 points above ECG graph strips
-            from reportlab.graphics.shapes import String
-            
-            # Calculate label position - shift 45 points right for column 1 leads, then 10 points left
-            if lead in ["I", "II", "III", "aVR", "aVL", "aVF"]:
-                label_x_pos = x_pos + 45.0 - 10.0  # Shift 45 points right, then 10 points left
-            else:
-                label_x_pos = x_pos  # Keep original position for other leads
-                
-            lead_label = String(label_x_pos, y_pos + 52, f"{lead}",  # Y+52 (35+17) - labels 17 points higher
-                              fontSize=10, fontName="Helvetica-Bold", fillColor=colors.black)
-            master_drawing.add(lead_label)
-            
-            # Add vertical dotted line to separate columns - positioned to prevent column 1 data overlap
-            if lead in column2_leads:  # Draw for ALL V leads to debug
-                print(f" DEBUG: Drawing dotted line for {lead} at X=397.5, Y=430 to 105")
-                # Draw vertical dotted line from V1 to V6, positioned between columns
-                from reportlab.graphics.shapes import Line
-                from reportlab.lib.units import mm
-                
-                # Position line 14.5 boxes (217.5 points) to the right
-                # Original X=180, now X=180 + 217.5 = 397.5
-                line_x = 397.5  # Shifted right 14.5 boxes from 180
-                # Reduce line length by 2 boxes (30 points) from bottom
-                line_y_start = 447  # 430 + 17 = 447 (shifted 17 points up)
-                line_y_end = 122     # 105 + 17 = 122 (shifted 17 points up)
-                
-                # Create dotted line effect with multiple short lines
-                dotted_line_spacing = 3  # points between dots
-                dot_length = 2  # length of each dot
-                
-                current_y = line_y_start
-                dots_count = 0
-                while current_y > line_y_end:
-                    # Draw small line segments to create dotted effect
-                    segment_end = max(current_y - dot_length, line_y_end)
-                    dotted_line = Line(line_x, current_y, line_x, segment_end,
-                                    strokeColor=colors.black, strokeWidth=0.5)
-                    master_drawing.add(dotted_line)
-                    dots_count += 1
-                    current_y = segment_end - dotted_line_spacing
-                
-                print(f" DEBUG: Added {dots_count} dotted segments to vertical line (reduced by 2 boxes from bottom)")
-            
-            # STEP 3B: Get REAL ECG data for this lead (ONLY from saved file - calculation-based)
-            # IMPORTANT:  saved file  data use , live dashboard   (calculation-based beats  )
-            real_data_available = False
-            real_ecg_data = None
-            
-            # Helper function to calculate derived leads from I and II
-            def calculate_derived_lead(lead_name, lead_i_data, lead_ii_data):
-                """Calculate derived leads: III, aVR, aVL, aVF from I and II"""   
-                
-                lead_i = np.array(lead_i_data, dtype=float)
-                lead_ii = np.array(lead_ii_data, dtype=float)
-                
-                if lead_name == "III":
-                    return lead_ii - lead_i  # III = II - I
-                elif lead_name == "aVR":
-                    return -(lead_i + lead_ii) / 2.0  # aVR = -(I + II) / 2
-                elif lead_name == "aVL":
-                    # aVL = (Lead I - Lead III) / 2
-                    lead_iii = lead_ii - lead_i  # Calculate Lead III first
-                    return (lead_i - lead_iii) / 2.0  # aVL = (I - III) / 2
-                elif lead_name == "aVF":
-                    # aVF = (Lead II + Lead III) / 2
-                    lead_iii = lead_ii - lead_i  # Calculate Lead III first
-                    return (lead_ii + lead_iii) / 2.0  # aVF = (II + III) / 2
-                elif lead_name == "-aVR":
-                    return -(-(lead_i + lead_ii) / 2.0)  # -aVR = -aVR = (I + II) / 2
-                else:
-                    return None
-            
-            # Priority 1: Use saved_ecg_data (REQUIRED for calculation-based beats)
-            saved_data_samples = 0  # Initialize for comparison with live data
-            if saved_ecg_data and 'leads' in saved_ecg_data:
-                # For calculated leads, calculate from I and II
-                if lead in ["III", "aVR", "aVL", "aVF", "-aVR"]:
-                    if "I" in saved_ecg_data['leads'] and "II" in saved_ecg_data['leads']:
-                        lead_i_data = saved_ecg_data['leads']["I"]
-                        lead_ii_data = saved_ecg_data['leads']["II"]
-                        
-                        # Ensure same length
-                        min_len = min(len(lead_i_data), len(lead_ii_data))
-                        lead_i_data = lead_i_data[:min_len]
-                        lead_ii_data = lead_ii_data[:min_len]
-                        
-                        # IMPORTANT: Subtract baseline from Lead I and Lead II BEFORE calculating derived leads
-                        # This ensures calculated leads are centered around 0, not around baseline
-                        baseline_adc = 2000.0
-                        lead_i_centered = np.array(lead_i_data, dtype=float) - baseline_adc
-                        lead_ii_centered = np.array(lead_ii_data, dtype=float) - baseline_adc
-                        
-                        # Calculate derived lead from centered values
-                        calculated_data = calculate_derived_lead(lead, lead_i_centered, lead_ii_centered)
-                        if calculated_data is not None:
-                            raw_data = calculated_data.tolist() if isinstance(calculated_data, np.ndarray) else calculated_data
-                            print(f" Calculated {lead} from saved I and II data (baseline-subtracted): {len(raw_data)} points")
-                        else:
-                            # Fallback to saved data if calculation fails
-                            lead_name_for_saved = lead.replace("-aVR", "aVR")
-                            if lead_name_for_saved in saved_ecg_data['leads']:
-                                raw_data = saved_ecg_data['leads'][lead_name_for_saved]
-                                if lead == "-aVR":
-                                    raw_data = [-x for x in raw_data]  # Invert for -aVR
-                            else:
-                                raw_data = []
-                    else:
-                        print(f" Cannot calculate {lead}: I or II data missing in saved file")
-                        raw_data = []
-                else:
-                    # For non-calculated leads, use saved data directly
-                    lead_name_for_saved = lead.replace("-aVR", "aVR")  # Handle -aVR case
-                    if lead_name_for_saved in saved_ecg_data['leads']:
-                        raw_data = saved_ecg_data['leads'][lead_name_for_saved]
-                        if lead == "-aVR":
-                            raw_data = [-x for x in raw_data]  # Invert for -aVR
-                    else:
-                        raw_data = []
-                
-                if len(raw_data) > 0:
-                    # Check if saved data has enough samples for calculated time window
-                    saved_data_samples = len(raw_data)
-                    if saved_data_samples < num_samples_to_capture:
-                        print(f" SAVED FILE {lead} has only {saved_data_samples} samples, need {num_samples_to_capture} for {calculated_time_window:.2f}s window")
-                        print(f"   Will use ALL saved data ({saved_data_samples} samples) - may show fewer beats than calculated")
-                        # Use all available saved data (don't filter)
-                        raw_data_to_use = raw_data
-                    else:
-                        # Apply time window filtering based on calculated window
-                        raw_data_to_use = raw_data[-num_samples_to_capture:]
-                    
-                    if len(raw_data_to_use) > 0 and np.std(raw_data_to_use) > 0.01:
-                        real_ecg_data = np.array(raw_data_to_use)
-                        real_data_available = True
-                        time_window_str = f"{calculated_time_window:.2f}s" if calculated_time_window else "auto"
-                        actual_time_window = len(real_ecg_data) / computed_sampling_rate if computed_sampling_rate > 0 else 0
-                        print(f" Using SAVED FILE {lead} data: {len(real_ecg_data)} points (requested: {time_window_str}, actual: {actual_time_window:.2f}s, std: {np.std(real_ecg_data):.2f})")
-            
-            # Priority 2: Fallback to live dashboard data (if saved data not available OR has insufficient samples)
-            # Check if live data has MORE samples than saved data
-            if ecg_test_page and hasattr(ecg_test_page, 'data'):
-                lead_to_index = {
-                    "I": 0, "II": 1, "III": 2, "aVR": 3, "aVL": 4, "aVF": 5,
-                    "V1": 6, "V2": 7, "V3": 8, "V4": 9, "V5": 10, "V6": 11
-                }
-                
-                live_data_available = False
-                live_data_samples = 0
-                
-                # For calculated leads, calculate from live I and II
-                if lead in ["III", "aVR", "aVL", "aVF", "-aVR"]:
-                    if len(ecg_test_page.data) > 1:  # Need at least I and II
-                        lead_i_data = ecg_test_page.data[0]  # I
-                        lead_ii_data = ecg_test_page.data[1]  # II
-                        
-                        if len(lead_i_data) > 0 and len(lead_ii_data) > 0:
-                            # Ensure same length
-                            min_len = min(len(lead_i_data), len(lead_ii_data))
-                            lead_i_slice = lead_i_data[-min_len:] if len(lead_i_data) >= min_len else lead_i_data
-                            lead_ii_slice = lead_ii_data[-min_len:] if len(lead_ii_data) >= min_len else lead_ii_data
-                            
-                            # IMPORTANT: Subtract baseline from Lead I and Lead II BEFORE calculating derived leads
-                            # This ensures calculated leads are centered around 0, not around baseline
-                            baseline_adc = 2000.0
-                            lead_i_centered = np.array(lead_i_slice, dtype=float) - baseline_adc
-                            lead_ii_centered = np.array(lead_ii_slice, dtype=float) - baseline_adc
-                            
-                            # Calculate derived lead from centered values
-                            calculated_data = calculate_derived_lead(lead, lead_i_centered, lead_ii_centered)
-                            if calculated_data is not None:
-                                live_data_samples = len(calculated_data)
-                                use_live_data = False
-                                if not real_data_available:
-                                    use_live_data = True
-                                elif live_data_samples > saved_data_samples:
-                                    use_live_data = True
-                                
-                                if use_live_data:
-                                    raw_data = calculated_data
-                                    if len(raw_data) >= num_samples_to_capture:
-                                        raw_data = raw_data[-num_samples_to_capture:]
-                                    if len(raw_data) > 0 and np.std(raw_data) > 0.01:
-                                        real_ecg_data = np.array(raw_data)
-                                        real_data_available = True
-                                        actual_time_window = len(real_ecg_data) / computed_sampling_rate if computed_sampling_rate > 0 else 0
-                
-                # For non-calculated leads, use existing logic
-                if not real_data_available:
-                    if lead == "-aVR" and len(ecg_test_page.data) > 3:
-                        live_data_samples = len(ecg_test_page.data[3])
-                    elif lead in lead_to_index and len(ecg_test_page.data) > lead_to_index[lead]:
-                        live_data_samples = len(ecg_test_page.data[lead_to_index[lead]])
-                    
-                    # Use live data if: (1) saved data not available OR (2) live data has MORE samples
-                    use_live_data = False
-                    if not real_data_available:
-                        use_live_data = True
-                    elif live_data_samples > saved_data_samples:
-                        use_live_data = True
-                    
-                    if use_live_data:
-                        if lead == "-aVR" and len(ecg_test_page.data) > 3:
-                            # For -aVR, use filtered inverted aVR data
-                            raw_data = ecg_test_page.data[3]
-                            # Check if we have enough samples, otherwise use all available
-                            if len(raw_data) >= num_samples_to_capture:
-                                raw_data = raw_data[-num_samples_to_capture:]
-                            # Check if data is not all zeros or flat
-                            if len(raw_data) > 0 and np.std(raw_data) > 0.01:
-                                # STEP 1: Capture ORIGINAL dashboard data (NO gain applied)
-                                real_ecg_data = np.array(raw_data)
-                                
-                                real_data_available = True
-                                actual_time_window = len(real_ecg_data) / computed_sampling_rate if computed_sampling_rate > 0 else 0
-                                if is_demo_mode and time_window_seconds is not None:
-                                    pass
-                                else:
-                                    time_window_str = f"{calculated_time_window:.2f}s" if calculated_time_window else "auto"
-                            else:
-                                pass
-                        elif lead in lead_to_index and len(ecg_test_page.data) > lead_to_index[lead]:
-                            # Get filtered real data for this lead
-                            lead_index = lead_to_index[lead]
-                            if len(ecg_test_page.data[lead_index]) > 0:
-                                raw_data = ecg_test_page.data[lead_index]
-                                # Check if we have enough samples, otherwise use all available
-                                if len(raw_data) >= num_samples_to_capture:
-                                    raw_data = raw_data[-num_samples_to_capture:]
-                                # Check if data has variation (not all zeros or flat line)
-                                if len(raw_data) > 0 and np.std(raw_data) > 0.01:
-                                    # STEP 1: Capture ORIGINAL dashboard data (NO gain applied)
-                                    real_ecg_data = np.array(raw_data)
-                                    
-                                    real_data_available = True
-                                    actual_time_window = len(real_ecg_data) / computed_sampling_rate if computed_sampling_rate > 0 else 0
-                                    if is_demo_mode and time_window_seconds is not None:
-                                        pass
-                                    else:
-                                        time_window_str = f"{calculated_time_window:.2f}s" if calculated_time_window else "auto"
-                                else:
-                                    pass
-                            else:
-                                pass
-            
-            if real_data_available and len(real_ecg_data) > 0:
-                # Draw ALL REAL ECG data - NO LIMITS
-                # Adjust ECG width based on column to ensure column 1 stops before dotted line
-                if lead in column1_leads:
-                    # Column 1: Graph should stop exactly at dotted line at X=397.5
-                    # Lead starts at adjusted_x_pos (x_pos + 30), so calculate exact width
-                    ecg_width = 397.5 - (x_pos + 30)  # Stop exactly at dotted line
-                else:
-                    # Column 2: Full width available (from X=400 onwards)
-                    ecg_width = 460  # Standard width for V leads
-                
-                ecg_height = 45
-                
-                # Create time array for ALL data with adjusted width and position
-                # For column 1 leads, shift start position 2 boxes (30 points) to the right
-                if lead in column1_leads:
-                    # Shift column 1 leads 2 boxes (30 points) to the right
-                    adjusted_x_pos = x_pos + 30  # Move 30 points right
+        
+        print("  DELETING ALL OLD WHITE BACKGROUND IMAGES...") 
+        
+        # DELETE from both locations (project root, src directory) - cache hit or miss
+        # One directory listing each instead of an exists() stat per lead per location
+        lead_png_names = {f"lead_{lead}.png" for lead in leads}
+        for image_dir in (project_root, src_dir):
+            try:
+                with os.scandir(image_dir) as entries:
+                    stale_paths = [entry.path for entry in entries if entry.name in lead_png_names]
+            except OSError:
+                continue
+            for img_path in stale_paths:
+                os.remove(img_path)
+                logger.debug("Deleted OLD image: %s", img_path)
+        
+        # The grid-only image is deterministic - reuse the cached PNG when the spec matches
+        grid_cache_path = os.path.join(project_root, 'reports', '.gridcache', f"{_lead_grid_cache_key()}.png")
+        grid_png = None
+        try:
+            with open(grid_cache_path, 'rb') as f:
+                grid_png = f.read()
+            print(f" Using cached PINK GRID image: {grid_cache_path}")
+        except OSError:
+            pass
+        
+        if not grid_png:
+            print(" CREATING NEW PINK GRID IMAGES...")
+            
+            # The grid-only image is identical for every lead - render + encode it ONCE
+            try:
+                fig = create_ecg_grid_with_waveform(None, None, *_LEAD_GRID_PNG_SIZE)
+                grid_png = _figure_to_png_bytes(fig, dpi=_LEAD_GRID_PNG_DPI, pad_inches=_LEAD_GRID_PNG_PAD)  # PINK background from the figure patch
+            except Exception as e:
+                print(f" Error creating pink grid image: {e}")
+            
+            # Best-effort cache write - a read-only install just re-renders next time
+            if grid_png:
+                try:
+                    os.makedirs(os.path.dirname(grid_cache_path), exist_ok=True)
+                    with open(grid_cache_path, 'wb') as f:
+                        f.write(grid_png)
+                except OSError as e:
+                    print(f" Could not cache pink grid image: {e}")
+        
+        # Create NEW pink grid images (copy the encoded bytes to each lead file)
+        def _write_lead_png(lead):
+            # Save to project root with pink background
+            img_path = os.path.join(project_root, f"lead_{lead}.png")
+            with open(img_path, 'wb') as f:
+                f.write(grid_png)
+            return img_path
+        
+        lead_images = {}
+        if grid_png:
+            # The 12 writes are pure file I/O - overlap them on a small thread pool
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                futures = {lead: executor.submit(_write_lead_png, lead) for lead in leads}
+            
+            for lead, future in futures.items():
+                try:
+                    lead_images[lead] = future.result()
+                    logger.debug("Created NEW PINK GRID image: %s", lead_images[lead])
+                except Exception as e:
+                    logger.warning("Error creating %s: %s", lead, e)
+            print(f" Created {len(lead_images)} PINK GRID images in {project_root}")
+        
+        if not lead_images:
+            return "Error: Could not create PINK GRID ECG images"
+    
+    # Get REAL ECG drawings from live test page
+    print(" Capturing REAL ECG data from live test page...")
+    
+    # Check if demo mode is active and data is available
+    if ecg_test_page and hasattr(ecg_test_page, 'demo_toggle'):
+        is_demo = ecg_test_page.demo_toggle.isChecked()
+        if is_demo:
+            print(" DEMO MODE DETECTED - Checking data availability...")
+            if hasattr(ecg_test_page, 'data') and len(ecg_test_page.data) > 0:
+                # Check if data has actual variation (not just zeros)
+                sample_data = ecg_test_page.data[0] if len(ecg_test_page.data) > 0 else []
+                if len(sample_data) > 0:
+                    range_val = float(np.ptp(sample_data))
+                    print(f"    Data buffer size: {len(sample_data)}, Range: {range_val:.4f}")
+                    if range_val <= _FLAT_LINE_RANGE:
+                        print("    WARNING: Demo data appears to be flat/empty!")
+                        print("    TIP: Make sure demo has been running for at least 5 seconds before generating report")
+                    else:
+                        print(f"    Demo data looks good (variation detected)")
                 else:
-                    # Column 2 leads keep original position
-                    adjusted_x_pos = x_pos
-                
-                t = np.linspace(adjusted_x_pos, adjusted_x_pos + ecg_width, len(real_ecg_data))
-                
-                
-                
-                # Step 1: Convert ADC data to numpy array
-                adc_data = np.array(real_ecg_data, dtype=float)
-                
-                # DEBUG: Check if data is already processed (baseline-subtracted)
-                # If data range is far from 2000 baseline, it might already be processed
-                data_mean = np.mean(adc_data)
-                data_std = np.std(adc_data)
-                
-                # Step 2: Apply baseline 2000 (subtract baseline from ADC values)
-                # IMPORTANT: For calculated leads (III, aVR, aVL, aVF), data is already calculated from processed I and II
-                # So it's already centered (mean ~0), but we still need to scale it properly
-                baseline_adc = 2000.0
-                is_calculated_lead = lead in ["III", "aVR", "aVL", "aVF", "-aVR"]
-                
-                if abs(data_mean - 2000.0) < 500:  # Data is close to baseline 2000 (raw ADC)
-                    centered_adc = adc_data - baseline_adc
-                elif is_calculated_lead:
-                    # For calculated leads, data is already centered from calculation (II - I, etc.)
-                    # The calculated value is already the difference, so it's centered around 0
-                    # We use it directly without baseline subtraction
-                    centered_adc = adc_data  # Use data as-is (already centered from calculation)
-                else:  # Data is already processed (baseline-subtracted or filtered)
-                    centered_adc = adc_data  # Use data as-is (already centered)
-                
-                # Step 3: Calculate ADC per box based on wave_gain and lead-specific multiplier
-                # LEAD-SPECIFIC ADC PER BOX CONFIGURATION
-                # Each lead can have different ADC per box multiplier (will be divided by wave_gain)
-                adc_per_box_config = {
-                    'I': 5500.0,
-                    'II': 4955.0, 
-                    'III': 5213.0,  
-                    'aVR': 5353.0, 
-                    'aVL': 5500.0,
-                    'aVF': 5353.0,  
-                    'V1': 5500.0,
-                    'V2': 5500.0,
-                    'V3': 5500.0,
-                    'V4': 7586.0, 
-                    'V5': 7586.0,  
-                    'V6': 8209.0,    
-                    '-aVR': 5500.0,  # For Cabrera sequence
-                }
-                # Get lead-specific ADC per box multiplier (default: 5500)
-                adc_per_box_multiplier = adc_per_box_config.get(lead, 5500.0)
-                # Formula: ADC_per_box = adc_per_box_multiplier / wave_gain_mm_mv
-                # IMPORTANT: Each lead can have different ADC per box multiplier
-                # For 10mm/mV with multiplier 5500: 5500 / 10 = 550 ADC per box
-                # This means: 550 ADC offset = 1 box (5mm) vertical movement
-                adc_per_box = adc_per_box_multiplier / max(1e-6, wave_gain_mm_mv)  # Avoid division by zero
-                
-                # DEBUG: Log actual ADC values for troubleshooting
-                max_centered_adc = np.max(np.abs(centered_adc))
-                min_centered_adc = np.min(centered_adc)
-                max_centered_adc_abs = np.max(np.abs(centered_adc))
-                expected_boxes = max_centered_adc_abs / adc_per_box
-                
-                # Step 4: Convert ADC offset to boxes (vertical units)
-                # Direct calculation: boxes_offset = centered_adc / adc_per_box
-                # Example: 2000 ADC offset / 750 ADC per box = 2.6666 boxes
-                # BUT: If actual ADC values are smaller (e.g., 375 ADC), then:
-                # 375 ADC / 750 ADC per box = 0.5 boxes (which matches what user sees!)
-                boxes_offset = centered_adc / adc_per_box
-                
-                # Log boxes offset for verification
-                
-                # Step 5: Convert boxes to Y position
-                center_y = y_pos + (ecg_height / 2.0)  # Center of the graph in points
-                # IMPORTANT: Standard ECG paper uses 5mm per box
-                # 5mm = 5 * 2.834645669 points = 14.17 points per box
-                from reportlab.lib.units import mm
-                box_height_points = 5.0 * mm  # Standard ECG: 5mm = 14.17 points per box
-        except Exception as e:
-            print(f" Error adding Lead {lead}: {e}")
-            import traceback
-            traceback.print_exc()
+                    print("    WARNING: Data buffer is empty!")
+            else:
+                print("    ERROR: No data structure found!")
     
-    # STEP 4: Add Patient Info, Date/Time and Vital Parameters to master drawing
-    # POSITIONED ABOVE ECG GRAPH (not mixed inside graph)
-    from reportlab.graphics.shapes import String
+    lead_drawings = capture_real_ecg_graphs_from_dashboard(
+        dashboard_instance,
+        ecg_test_page,
+        samples_per_second=computed_sampling_rate,
+        settings_manager=settings_manager
+    )
+    
+    # Get lead sequence from settings (already initialized above)
+    lead_sequence = report_settings["lead_sequence"]
+    
+    # Use the appropriate sequence for REPORT ONLY
+    if lead_sequence not in _LEAD_SEQUENCES:
+        lead_sequence = "Standard"
+    lead_order = _LEAD_SEQUENCES[lead_sequence]
+    
+    print(f" Using lead sequence for REPORT: {lead_sequence}")
+    print(f" Lead order for REPORT: {lead_order}")
 
-    # LEFT SIDE: Patient Info (TOP LEFT CORNER - moved up by 1 box and left by 1 box) - SHIFTED LEFT 10 points
-    patient_name_label = String(-45, 555, f"Name: {full_name}",  # Moved left 10 points from -25 to -35
-                           fontSize=10, fontName="Helvetica", fillColor=colors.black)
-    master_drawing.add(patient_name_label)
+    # Create BaseDocTemplate for mixed page orientations (from hyperkalemia)
+    doc = BaseDocTemplate(filename, pagesize=A4,
+                         rightMargin=30, leftMargin=30,
+                         topMargin=30, bottomMargin=30)
+    # Create wrapper function for callback with patient parameter
+    def callback_wrapper(canvas, doc):
+        return _draw_logo_and_footer_callback(canvas, doc, patient)
 
-    patient_age_label = String(-45, 535, f"Age: {age}",  # Moved left 10 points from -25 to -35
-                          fontSize=10, fontName="Helvetica", fillColor=colors.black)
-    master_drawing.add(patient_age_label)
 
-    patient_gender_label = String(-45, 515, f"Gender: {gender}",  # Moved left 10 points from -25 to -35
-                             fontSize=10, fontName="Helvetica", fillColor=colors.black)
-    master_drawing.add(patient_gender_label)
+    # Define Landscape template as DEFAULT (only template) with onPage callback
+    landscape_width, landscape_height = landscape(A4)
+    # Reduce margins to increase frame size (from 30 to 20 on each side)
+    landscape_frame = Frame(20, 20,  # reduced margins for landscape to fit taller drawing
+                           landscape_width - 40, landscape_height - 40,
+                           id="landscape_frame")
+    landscape_template = PageTemplate(id="landscape", frames=[landscape_frame],
+                                     pagesize=landscape(A4), onPage=callback_wrapper)
 
-    # RIGHT SIDE: Vital Parameters at SAME LEVEL as patient info (ABOVE ECG GRAPH)
-    # Get real ECG data from dashboard
-    HR = data.get('HR_avg', 70)
-    PR = data.get('PR', 192) 
-    QRS = data.get('QRS', 93)
-    QT = data.get('QT', 354)
-    QTc = data.get('QTc', 260)
-    QTcF = data.get('QTc_Fridericia') or data.get('QTcF') or 0
-    ST = data.get('ST', 114)
-    # DYNAMIC RR interval calculation from heart rate (instead of hard-coded 857)
-    RR = int(60000 / HR) if HR and HR > 0 else 0  # RR interval in ms from heart rate
-   
+    # Add ONLY landscape template as default
+    doc.addPageTemplates([landscape_template])
 
-    # Create table data: 4 rows × 2 columns
-    vital_table_data = [
-        [f"HR : {int(round(HR))} bpm", f"QT: {int(round(QT))} ms"],
-        [f"PR : {int(round(PR))} ms", f"QTc: {int(round(QTc))} ms"],
-        [f"QRS: {int(round(QRS))} ms", f"ST: {int(round(ST))} ms"],
-        [f"RR : {int(round(RR))} ms", f"QTcF: {QTcF/1000.0:.3f} s"]  
-    ]
-
-    # Create vital parameters table with MORE LEFT and TOP positioning
-    vital_params_table = Table(vital_table_data, colWidths=[100, 100])  # Even smaller widths for more left
-
-    vital_params_table.setStyle(TableStyle([
-        # Transparent background to show pink grid
-        ("BACKGROUND", (0, 0), (-1, -1), colors.Color(0, 0, 0, alpha=0)),
-        ("GRID", (0, 0), (-1, -1), 0, colors.Color(0, 0, 0, alpha=0)),
-        ("BOX", (0, 0), (-1, -1), 0, colors.Color(0, 0, 0, alpha=0)),
-        ("ALIGN", (0, 0), (-1, -1), "LEFT"),  # Left align
-        ("VALIGN", (0, 0), (-1, -1), "TOP"),
-        ("FONTNAME", (0, 0), (-1, -1), "Helvetica"),  # Normal font
-        ("FONTSIZE", (0, 0), (-1, -1), 10),  # Same size as Name, Age, Gender
-        ("TEXTCOLOR", (0, 0), (-1, -1), colors.black),
-        ("LEFTPADDING", (0, 0), (-1, -1), 0),  # Zero left padding for extreme left
-        ("RIGHTPADDING", (0, 0), (-1, -1), 0),  # Zero right padding too
-        ("TOPPADDING", (0, 0), (-1, -1), 0),   # Zero top padding for top shift
-        ("BOTTOMPADDING", (0, 0), (-1, -1), 0),
-    ]))
+    story = []
+    styles = getSampleStyleSheet()
+    
+    # Skip title and other Page 1 content - go directly to landscape ECG content
 
-   
+    # Skip all Page 1 content - go directly to landscape ECG graphs
+    # Patient details will be shown in the landscape page master drawing
+
+    # Patient details for landscape page (will be used in master drawing)
+    if patient is None:
+        patient = {}
+    first_name = patient.get("first_name", "")
+    last_name = patient.get("last_name", "")
+    full_name = f"{first_name} {last_name}".strip()
+    age = patient.get("age", "")
+    gender = patient.get("gender", "")
+    date_time_str = patient.get("date_time", "")
+
+    # REMOVED: Date/Time table from story - will be added in master drawing instead
+    # Patient info and vital parameters are now in master drawing above ECG graph
+    # No extra spacing needed as they're positioned in drawing coordinates
+
+    
+    # Vital Parameters Header (completely transparent)
+    vital_style = ParagraphStyle(
+        'VitalStyle',
+        fontSize=12,  # Increased from 11
+        fontName='Helvetica-Bold',
+        textColor=colors.black,
+        spaceAfter=15,
+        alignment=1,  # center
+        # Add white background 
+        # for better visibility on pink grid
+        backColor=colors.white,
+    )
+
+    # Vital Parameters Header (on top of background)
+    vital_style = ParagraphStyle(
+
+
+            
+        'VitalStyle',
+        fontSize=11,
+        fontName='Helvetica-Bold',
+        textColor=colors.black,
+        spaceAfter=15,
+        alignment=1,  # center
+        
+    )
+
+    # The vitals are read and drawn as plain labels on the master drawing (see STEP 4) -
+    # no platypus Table/TableStyle to lay out for eight fixed strings
 
     #  CREATE SINGLE MASSIVE DRAWING with ALL ECG content (NO individual drawings)
     print("Creating SINGLE drawing with all ECG content...")
@@ -1946,42 +1650,16 @@ def generate_6_2_ecg_report(filename="ecg_report.pdf", data=None, lead_images=No
     
     # Create ONE master drawing
     master_drawing = Drawing(total_width, total_height)
+    page_labels = Group()  # all black text labels - added to master_drawing after the strips
     
     # STEP 1: NO background rectangle - let page pink grid show through
     
-    # STEP 2: Define positions for all 12 leads in VERTICAL COLUMNS
+    # STEP 2: Positions for all 12 leads in VERTICAL COLUMNS (precomputed per sequence)
     # Column 1: vertical stack from top to bottom, Column 2: vertical stack from top to bottom
-    lead_positions = []
-    
-    # Define which leads go in which column
-    column1_leads = ["I", "II", "III", "aVR", "aVL", "aVF"]  # First 6 leads - vertical column
-    column2_leads = ["V1", "V2", "V3", "V4", "V5", "V6"]     # Last 6 leads - vertical column
-    
-    # QTc label is at Y=455, so start leads 60 points below that
-    qtc_y_position = 455
-    start_y = qtc_y_position - 60 + 17  # 412 (60 points below QTc + 17 points up shift)
-    
-    for i, lead in enumerate(lead_order):
-        # Determine X position based on which column this lead belongs to
-        if lead in column1_leads:
-            # Column 1: Vertical stack - all at same X, different Y
-            lead_index = column1_leads.index(lead)
-            # Shift ALL column1 leads 45 points to the left
-            x_pos = 20 - 45  # -25 (shifted left 45 points)
-            y_pos = start_y - (lead_index * 60)  # GO DOWNWARD: 395, 335, 275, 215, 155, 95
-        else:
-            # Column 2: Vertical stack - all at same X, different Y
-            lead_index = column2_leads.index(lead)
-            x_pos = 400  # ALL column2 leads at same X position (center/right side)
-            y_pos = start_y - (lead_index * 60)  # GO DOWNWARD: 395, 335, 275, 215, 155, 95
-        
-        lead_positions.append({
-            "lead": lead, 
-            "x": x_pos, 
-            "y": y_pos
-        })
+    lead_positions = _LEAD_POSITIONS[lead_sequence]
+    start_y = _LEADS_START_Y
     
-    print(f" Using lead positions in {lead_sequence} sequence: {[pos['lead'] for pos in lead_positions]}")
+    print(f" Using lead positions in {lead_sequence} sequence: {[lead for lead, _, _ in lead_positions]}")
     
     # STEP 3: Draw ALL ECG content directly in master drawing
     successful_graphs = 0
@@ -2002,9 +1680,7 @@ def generate_6_2_ecg_report(filename="ecg_report.pdf", data=None, lead_images=No
             else:
                 # Fallback: calculate from wave speed setting
                 try:
-                    from utils.settings_manager import SettingsManager
-                    sm = SettingsManager()
-                    wave_speed = float(sm.get_wave_speed())
+                    wave_speed = wave_speed_mm_s
                     # NEW LOGIC: Time window = 165mm / wave_speed (33 boxes × 5mm = 165mm)
                     ecg_graph_width_mm = 33 * 5  # 165mm
                     time_window_seconds = ecg_graph_width_mm / wave_speed
@@ -2045,131 +1721,116 @@ def generate_6_2_ecg_report(filename="ecg_report.pdf", data=None, lead_images=No
             expected_beats = int((calculated_time_window * hr_bpm_value) / 60)
             print(f"   Expected beats shown: ~{expected_beats} beats")
     
-    for pos_info in lead_positions:
-        lead = pos_info["lead"]
-        x_pos = pos_info["x"]
-        y_pos = pos_info["y"]
-        
-        print(f" DEBUG: Processing Lead {lead} at position ({x_pos}, {y_pos})")
-        print(f" DEBUG: Drawing dimensions: width={total_width}, height={total_height}")
+    # Derived leads (III, aVR, aVL, aVF, -aVR) only depend on Lead I and Lead II:
+    # centre I/II once per source and compute each derived lead once, before the loop
+    derived_leads_in_order = [lead for lead in lead_order if lead in _DERIVED_LEAD_FORMULAS]
+    baseline_adc = 2000.0
+    
+    saved_derived_leads = {}
+    if "I" in saved_leads and "II" in saved_leads:
+        lead_i_data = saved_leads["I"]
+        lead_ii_data = saved_leads["II"]
+        
+        # Ensure same length
+        min_len = min(len(lead_i_data), len(lead_ii_data))
+        
+        # IMPORTANT: Subtract baseline from Lead I and Lead II BEFORE calculating derived leads
+        # This ensures calculated leads are centered around 0, not around baseline
+        # (array slices are views - the subtraction is the only copy)
+        lead_i_centered = lead_i_data[:min_len] - baseline_adc
+        lead_ii_centered = lead_ii_data[:min_len] - baseline_adc
+        saved_derived_leads = calculate_derived_leads(lead_i_centered, lead_ii_centered, derived_leads_in_order)
+    
+    # Live dashboard buffers (one per lead, ecg_test_page.data order) - looked up once, not per lead
+    live_page_data = getattr(ecg_test_page, 'data', None) if ecg_test_page else None
+    
+    live_derived_leads = {}
+    if live_page_data is not None and len(live_page_data) > 1:  # Need at least I and II
+        lead_i_data = live_page_data[0]  # I
+        lead_ii_data = live_page_data[1]  # II
+        
+        if len(lead_i_data) > 0 and len(lead_ii_data) > 0:
+            # Ensure same length (most recent samples)
+            min_len = min(len(lead_i_data), len(lead_ii_data))
+            # Convert to float32 and subtract the baseline in one ufunc call - a single copy per lead
+            lead_i_centered = np.subtract(lead_i_data[-min_len:], baseline_adc, dtype=np.float32)
+            lead_ii_centered = np.subtract(lead_ii_data[-min_len:], baseline_adc, dtype=np.float32)
+            live_derived_leads = calculate_derived_leads(lead_i_centered, lead_ii_centered, derived_leads_in_order)
+    
+    # Scratch buffers reused by every lead for X/Y mapping
+    # (sized for 20s of data, grown in the loop if a lead carries more samples)
+    ypoints_scratch, xpoints_scratch, sample_ramp = _alloc_strip_scratch(int(20 * computed_sampling_rate))
+    
+    # ADC per box for each lead at this report's gain: multiplier / wave_gain, resolved once
+    # For 10mm/mV with multiplier 5500: 5500 / 10 = 550 ADC per box
+    inv_wave_gain = 1.0 / max(1e-6, wave_gain_mm_mv)  # Avoid division by zero
+    adc_per_box_by_lead = {lead: _ADC_PER_BOX_CONFIG.get(lead, 5500.0) * inv_wave_gain for lead in lead_order}
+    
+    # Add vertical dotted line to separate columns - positioned to prevent column 1 data overlap
+    # Drawn once, from V1 to V6, between the columns
+    if any(not _LEAD_META[lead]["is_col1"] for lead, _, _ in lead_positions):
+        # Position line 14.5 boxes (217.5 points) to the right
+        # Original X=180, now X=180 + 217.5 = 397.5
+        line_x = 397.5  # Shifted right 14.5 boxes from 180
+        # Reduce line length by 2 boxes (30 points) from bottom
+        line_y_start = 447  # 430 + 17 = 447 (shifted 17 points up)
+        line_y_end = 122     # 105 + 17 = 122 (shifted 17 points up)
+        
+        # Dotted effect from the dash pattern: 2pt dots, 3pt gaps - a single stroked line
+        # The pattern starts "on" at line_y_start, so dots fall where the old per-segment loop put them
+        # renderPDF emits it as one '[2 3] 0 d' dash setting and a single stroke; added before the
+        # strips (and the page_labels Group, added last) so it paints underneath them
+        dot_length = 2  # length of each dot
+        dotted_line_spacing = 3  # points between dots
+        dotted_line = Line(line_x, line_y_start, line_x, line_y_end,
+                           strokeColor=colors.black, strokeWidth=0.5,
+                           strokeDashArray=[dot_length, dotted_line_spacing])
+        master_drawing.add(dotted_line)
+    
+    # Strips are built serially on purpose: each lead is ~0.5 ms of GIL-bound
+    # tolist() / PolyLine construction and reuses the _alloc_strip_scratch buffers,
+    # so a thread pool would need per-thread scratch and still save nothing
+    for lead, x_pos, y_pos in lead_positions:
+        lead_meta = _LEAD_META[lead]
+        is_col1 = lead_meta["is_col1"]
+        is_calculated_lead = lead_meta["is_derived"]
+        
+        logger.debug("Processing Lead %s at position (%s, %s)", lead, x_pos, y_pos)
+        logger.debug("Drawing dimensions: width=%s, height=%s", total_width, total_height)
         
         try:
             # STEP 3A: Add lead labels 15 points above ECG graph strips
-            from reportlab.graphics.shapes import String
-            
             # Calculate label position - shift 45 points right for column 1 leads, then 10 points left
-            if lead in ["I", "II", "III", "aVR", "aVL", "aVF"]:
+            if is_col1:
                 label_x_pos = x_pos + 45.0 - 10.0  # Shift 45 points right, then 10 points left
             else:
                 label_x_pos = x_pos  # Keep original position for other leads
                 
-            lead_label = String(label_x_pos, y_pos + 52, f"{lead}",  # Y+52 (35+17) - labels 17 points higher
-                              fontSize=10, fontName="Helvetica-Bold", fillColor=colors.black)
-            master_drawing.add(lead_label)
-            
-            # Add vertical dotted line to separate columns - positioned to prevent column 1 data overlap
-            if lead in column2_leads:  # Draw for ALL V leads to debug
-                print(f" DEBUG: Drawing dotted line for {lead} at X=397.5, Y=430 to 105")
-                # Draw vertical dotted line from V1 to V6, positioned between columns
-                from reportlab.graphics.shapes import Line
-                from reportlab.lib.units import mm
-                
-                # Position line 14.5 boxes (217.5 points) to the right
-                # Original X=180, now X=180 + 217.5 = 397.5
-                line_x = 397.5  # Shifted right 14.5 boxes from 180
-                # Reduce line length by 2 boxes (30 points) from bottom
-                line_y_start = 447  # 430 + 17 = 447 (shifted 17 points up)
-                line_y_end = 122     # 105 + 17 = 122 (shifted 17 points up)
-                
-                # Create dotted line effect with multiple short lines
-                dotted_line_spacing = 3  # points between dots
-                dot_length = 2  # length of each dot
-                
-                current_y = line_y_start
-                dots_count = 0
-                while current_y > line_y_end:
-                    # Draw small line segments to create dotted effect
-                    segment_end = max(current_y - dot_length, line_y_end)
-                    dotted_line = Line(line_x, current_y, line_x, segment_end,
-                                    strokeColor=colors.black, strokeWidth=0.5)
-                    master_drawing.add(dotted_line)
-                    dots_count += 1
-                    current_y = segment_end - dotted_line_spacing
-                
-                print(f" DEBUG: Added {dots_count} dotted segments to vertical line (reduced by 2 boxes from bottom)")
+            page_labels.add(_page_label(label_x_pos, y_pos + 52, f"{lead}", fontName="Helvetica-Bold"))  # Y+52 (35+17) - labels 17 points higher
             
             # STEP 3B: Get REAL ECG data for this lead (ONLY from saved file - calculation-based)
             # IMPORTANT:  saved file  data use , live dashboard   (calculation-based beats  )
             real_data_available = False
             real_ecg_data = None
-            
-            # Helper function to calculate derived leads from I and II
-            def calculate_derived_lead(lead_name, lead_i_data, lead_ii_data):
-                """Calculate derived leads: III, aVR, aVL, aVF from I and II"""
-                lead_i = np.array(lead_i_data, dtype=float)
-                lead_ii = np.array(lead_ii_data, dtype=float)
-                
-                if lead_name == "III":
-                    return lead_ii - lead_i  # III = II - I
-                elif lead_name == "aVR":
-                    return -(lead_i + lead_ii) / 2.0  # aVR = -(I + II) / 2
-                elif lead_name == "aVL":
-                    # aVL = (Lead I - Lead III) / 2
-                    lead_iii = lead_ii - lead_i  # Calculate Lead III first
-                    return (lead_i - lead_iii) / 2.0  # aVL = (I - III) / 2
-                elif lead_name == "aVF":
-                    # aVF = (Lead II + Lead III) / 2
-                    lead_iii = lead_ii - lead_i  # Calculate Lead III first
-                    return (lead_ii + lead_iii) / 2.0  # aVF = (II + III) / 2
-                elif lead_name == "-aVR":
-                    return -(-(lead_i + lead_ii) / 2.0)  # -aVR = -aVR = (I + II) / 2
-                else:
-                    return None
+            data_is_centred = False  # True only for I/II-derived strips (already baseline-subtracted)
             
             # Priority 1: Use saved_ecg_data (REQUIRED for calculation-based beats)
             saved_data_samples = 0  # Initialize for comparison with live data
-            if saved_ecg_data and 'leads' in saved_ecg_data:
+            if saved_leads:
                 # For calculated leads, calculate from I and II
-                if lead in ["III", "aVR", "aVL", "aVF", "-aVR"]:
-                    if "I" in saved_ecg_data['leads'] and "II" in saved_ecg_data['leads']:
-                        lead_i_data = saved_ecg_data['leads']["I"]
-                        lead_ii_data = saved_ecg_data['leads']["II"]
-                        
-                        # Ensure same length
-                        min_len = min(len(lead_i_data), len(lead_ii_data))
-                        lead_i_data = lead_i_data[:min_len]
-                        lead_ii_data = lead_ii_data[:min_len]
-                        
-                        # IMPORTANT: Subtract baseline from Lead I and Lead II BEFORE calculating derived leads
-                        # This ensures calculated leads are centered around 0, not around baseline
-                        baseline_adc = 2000.0
-                        lead_i_centered = np.array(lead_i_data, dtype=float) - baseline_adc
-                        lead_ii_centered = np.array(lead_ii_data, dtype=float) - baseline_adc
-                        
-                        # Calculate derived lead from centered values
-                        calculated_data = calculate_derived_lead(lead, lead_i_centered, lead_ii_centered)
-                        if calculated_data is not None:
-                            raw_data = calculated_data.tolist() if isinstance(calculated_data, np.ndarray) else calculated_data
-                            print(f" Calculated {lead} from saved I and II data (baseline-subtracted): {len(raw_data)} points")
-                        else:
-                            # Fallback to saved data if calculation fails
-                            lead_name_for_saved = lead.replace("-aVR", "aVR")
-                            if lead_name_for_saved in saved_ecg_data['leads']:
-                                raw_data = saved_ecg_data['leads'][lead_name_for_saved]
-                                if lead == "-aVR":
-                                    raw_data = [-x for x in raw_data]  # Invert for -aVR
-                            else:
-                                raw_data = []
+                if is_calculated_lead:
+                    if lead in saved_derived_leads:
+                        # Precomputed from baseline-subtracted saved I and II (see above the loop)
+                        raw_data = saved_derived_leads[lead]
+                        logger.debug("Calculated %s from saved I and II data (baseline-subtracted): %d points", lead, len(raw_data))
                     else:
                         print(f" Cannot calculate {lead}: I or II data missing in saved file")
                         raw_data = []
                 else:
                     # For non-calculated leads, use saved data directly
-                    lead_name_for_saved = lead.replace("-aVR", "aVR")  # Handle -aVR case
-                    if lead_name_for_saved in saved_ecg_data['leads']:
-                        raw_data = saved_ecg_data['leads'][lead_name_for_saved]
-                        if lead == "-aVR":
-                            raw_data = [-x for x in raw_data]  # Invert for -aVR
+                    # (-aVR is a calculated lead - its sign comes from _DERIVED_LEAD_FORMULAS, no inversion here)
+                    if lead in saved_leads:
+                        raw_data = saved_leads[lead]
                     else:
                         raw_data = []
                 
@@ -2185,123 +1846,57 @@ def generate_6_2_ecg_report(filename="ecg_report.pdf", data=None, lead_images=No
                         # Apply time window filtering based on calculated window
                         raw_data_to_use = raw_data[-num_samples_to_capture:]
                     
-                    if len(raw_data_to_use) > 0 and np.std(raw_data_to_use) > 0.01:
-                        real_ecg_data = np.array(raw_data_to_use)
+                    # Convert once (no copy for float32 arrays) and test the typed array
+                    candidate = np.asarray(raw_data_to_use, dtype=np.float32)
+                    if len(candidate) > 0 and _has_variation(candidate):
+                        real_ecg_data = candidate
                         real_data_available = True
-                        time_window_str = f"{calculated_time_window:.2f}s" if calculated_time_window else "auto"
-                        actual_time_window = len(real_ecg_data) / computed_sampling_rate if computed_sampling_rate > 0 else 0
-                        print(f" Using SAVED FILE {lead} data: {len(real_ecg_data)} points (requested: {time_window_str}, actual: {actual_time_window:.2f}s, std: {np.std(real_ecg_data):.2f})")
+                        data_is_centred = is_calculated_lead  # from saved_derived_leads
+                        if logger.isEnabledFor(logging.DEBUG):
+                            time_window_str = f"{calculated_time_window:.2f}s" if calculated_time_window else "auto"
+                            actual_time_window = len(real_ecg_data) / computed_sampling_rate if computed_sampling_rate > 0 else 0
+                            logger.debug("Using SAVED FILE %s data: %d points (requested: %s, actual: %.2fs)",
+                                         lead, len(real_ecg_data), time_window_str, actual_time_window)
             
             # Priority 2: Fallback to live dashboard data (if saved data not available OR has insufficient samples)
-            # Check if live data has MORE samples than saved data
-            if ecg_test_page and hasattr(ecg_test_page, 'data'):
-                lead_to_index = {
-                    "I": 0, "II": 1, "III": 2, "aVR": 3, "aVL": 4, "aVF": 5,
-                    "V1": 6, "V2": 7, "V3": 8, "V4": 9, "V5": 10, "V6": 11
-                }
-                
-                live_data_available = False
-                live_data_samples = 0
-                
+            # Saved data that already covers the calculated window is final - skip the live buffers entirely
+            skip_live = real_data_available and saved_data_samples >= num_samples_to_capture
+            if not skip_live and live_page_data is not None:
                 # For calculated leads, calculate from live I and II
-                if lead in ["III", "aVR", "aVL", "aVF", "-aVR"]:
-                    if len(ecg_test_page.data) > 1:  # Need at least I and II
-                        lead_i_data = ecg_test_page.data[0]  # I
-                        lead_ii_data = ecg_test_page.data[1]  # II
-                        
-                        if len(lead_i_data) > 0 and len(lead_ii_data) > 0:
-                            # Ensure same length
-                            min_len = min(len(lead_i_data), len(lead_ii_data))
-                            lead_i_slice = lead_i_data[-min_len:] if len(lead_i_data) >= min_len else lead_i_data
-                            lead_ii_slice = lead_ii_data[-min_len:] if len(lead_ii_data) >= min_len else lead_ii_data
-                            
-                            # IMPORTANT: Subtract baseline from Lead I and Lead II BEFORE calculating derived leads
-                            # This ensures calculated leads are centered around 0, not around baseline
-                            baseline_adc = 2000.0
-                            lead_i_centered = np.array(lead_i_slice, dtype=float) - baseline_adc
-                            lead_ii_centered = np.array(lead_ii_slice, dtype=float) - baseline_adc
-                            
-                            # Calculate derived lead from centered values
-                            calculated_data = calculate_derived_lead(lead, lead_i_centered, lead_ii_centered)
-                            if calculated_data is not None:
-                                live_data_samples = len(calculated_data)
-                                use_live_data = False
-                                if not real_data_available:
-                                    use_live_data = True
-                                elif live_data_samples > saved_data_samples:
-                                    use_live_data = True
-                                
-                                if use_live_data:
-                                    raw_data = calculated_data
-                                    if len(raw_data) >= num_samples_to_capture:
-                                        raw_data = raw_data[-num_samples_to_capture:]
-                                    if len(raw_data) > 0 and np.std(raw_data) > 0.01:
-                                        real_ecg_data = np.array(raw_data)
-                                        real_data_available = True
-                                        actual_time_window = len(real_ecg_data) / computed_sampling_rate if computed_sampling_rate > 0 else 0
-                
-                # For non-calculated leads, use existing logic
-                if not real_data_available:
-                    if lead == "-aVR" and len(ecg_test_page.data) > 3:
-                        live_data_samples = len(ecg_test_page.data[3])
-                    elif lead in lead_to_index and len(ecg_test_page.data) > lead_to_index[lead]:
-                        live_data_samples = len(ecg_test_page.data[lead_to_index[lead]])
-                    
+                if is_calculated_lead:
+                    # Precomputed from baseline-subtracted live I and II (see above the loop)
+                    calculated_data = live_derived_leads.get(lead)
                     # Use live data if: (1) saved data not available OR (2) live data has MORE samples
-                    use_live_data = False
-                    if not real_data_available:
-                        use_live_data = True
-                    elif live_data_samples > saved_data_samples:
-                        use_live_data = True
-                    
-                    if use_live_data:
-                        if lead == "-aVR" and len(ecg_test_page.data) > 3:
-                            # For -aVR, use filtered inverted aVR data
-                            raw_data = ecg_test_page.data[3]
-                            # Check if we have enough samples, otherwise use all available
-                            if len(raw_data) >= num_samples_to_capture:
-                                raw_data = raw_data[-num_samples_to_capture:]
-                            # Check if data is not all zeros or flat
-                            if len(raw_data) > 0 and np.std(raw_data) > 0.01:
-                                # STEP 1: Capture ORIGINAL dashboard data (NO gain applied)
-                                real_ecg_data = np.array(raw_data)
-                                
-                                real_data_available = True
-                                actual_time_window = len(real_ecg_data) / computed_sampling_rate if computed_sampling_rate > 0 else 0
-                                if is_demo_mode and time_window_seconds is not None:
-                                    pass
-                                else:
-                                    time_window_str = f"{calculated_time_window:.2f}s" if calculated_time_window else "auto"
-                            else:
-                                pass
-                        elif lead in lead_to_index and len(ecg_test_page.data) > lead_to_index[lead]:
-                            # Get filtered real data for this lead
-                            lead_index = lead_to_index[lead]
-                            if len(ecg_test_page.data[lead_index]) > 0:
-                                raw_data = ecg_test_page.data[lead_index]
-                                # Check if we have enough samples, otherwise use all available
-                                if len(raw_data) >= num_samples_to_capture:
-                                    raw_data = raw_data[-num_samples_to_capture:]
-                                # Check if data has variation (not all zeros or flat line)
-                                if len(raw_data) > 0 and np.std(raw_data) > 0.01:
-                                    # STEP 1: Capture ORIGINAL dashboard data (NO gain applied)
-                                    real_ecg_data = np.array(raw_data)
-                                    
-                                    real_data_available = True
-                                    actual_time_window = len(real_ecg_data) / computed_sampling_rate if computed_sampling_rate > 0 else 0
-                                    if is_demo_mode and time_window_seconds is not None:
-                                        pass
-                                    else:
-                                        time_window_str = f"{calculated_time_window:.2f}s" if calculated_time_window else "auto"
-                                else:
-                                    pass
-                            else:
-                                pass
+                    if calculated_data is not None and (not real_data_available or len(calculated_data) > saved_data_samples):
+                        raw_data = calculated_data
+                        if len(raw_data) >= num_samples_to_capture:
+                            raw_data = raw_data[-num_samples_to_capture:]
+                        candidate = np.asarray(raw_data, dtype=np.float32)
+                        if len(candidate) > 0 and _has_variation(candidate):
+                            real_ecg_data = candidate
+                            real_data_available = True
+                            data_is_centred = True  # from live_derived_leads
+                
+                # For non-calculated leads, use existing logic (-aVR reads the aVR buffer)
+                if not real_data_available:
+                    live_index = lead_meta["live_index"]
+                    if len(live_page_data) > live_index:
+                        raw_data = live_page_data[live_index]
+                        # Check if we have enough samples, otherwise use all available
+                        if len(raw_data) >= num_samples_to_capture:
+                            raw_data = raw_data[-num_samples_to_capture:]
+                        # Check if data has variation (not all zeros or flat line)
+                        candidate = np.asarray(raw_data, dtype=np.float32)
+                        if len(candidate) > 0 and _has_variation(candidate):
+                            # STEP 1: Capture ORIGINAL dashboard data (NO gain applied)
+                            real_ecg_data = candidate
+                            real_data_available = True
+                            data_is_centred = False  # raw dashboard buffer
             
             if real_data_available and len(real_ecg_data) > 0:
                 # Draw ALL REAL ECG data - NO LIMITS
                 # Adjust ECG width based on column to ensure column 1 stops before dotted line
-                if lead in column1_leads:
+                if is_col1:
                     # Column 1: Graph should stop exactly at dotted line at X=397.5
                     # Lead starts at adjusted_x_pos (x_pos + 30), so calculate exact width
                     ecg_width = 397.5 - (x_pos + 30)  # Stop exactly at dotted line
@@ -2313,74 +1908,51 @@ def generate_6_2_ecg_report(filename="ecg_report.pdf", data=None, lead_images=No
                 
                 # Create time array for ALL data with adjusted width and position
                 # For column 1 leads, shift start position 2 boxes (30 points) to the right
-                if lead in column1_leads:
+                if is_col1:
                     # Shift column 1 leads 2 boxes (30 points) to the right
                     adjusted_x_pos = x_pos + 30  # Move 30 points right
                 else:
                     # Column 2 leads keep original position
                     adjusted_x_pos = x_pos
                 
-                t = np.linspace(adjusted_x_pos, adjusted_x_pos + ecg_width, len(real_ecg_data))
+                n_samples = len(real_ecg_data)
+                if n_samples > len(sample_ramp):
+                    ypoints_scratch, xpoints_scratch, sample_ramp = _alloc_strip_scratch(n_samples)
                 
+                t = _strip_x_points(adjusted_x_pos, ecg_width, sample_ramp, xpoints_scratch[:n_samples])
                 
-                # Step 1: Convert ADC data to numpy array
-                adc_data = np.array(real_ecg_data, dtype=float)
                 
-                # DEBUG: Check if data is already processed (baseline-subtracted)
-                data_mean = np.mean(adc_data)
-                data_std = np.std(adc_data)
-                is_calculated_lead = lead in ["III", "aVR", "aVL", "aVF", "-aVR"]
+                # Step 1: Convert ADC data to numpy array
+                adc_data = real_ecg_data  # already a float32 array (converted once when selected)
                 
                 # Step 2: Apply baseline 2000 (subtract baseline from ADC values)
                 # IMPORTANT: For calculated leads, data is already calculated from processed I and II
                 # So it's already centered (mean ~0), but we still need to scale it properly
                 baseline_adc = 2000.0
                 
-                if abs(data_mean - 2000.0) < 500:  # Data is close to baseline 2000 (raw ADC)
-                    centered_adc = adc_data - baseline_adc
-                elif is_calculated_lead:
-                    # For calculated leads, data is already centered from calculation (II - I, etc.)
-                    # The calculated value is already the difference, so it's centered around 0
+                # The subtraction itself is folded into the Y transform below (strip_baseline)
+                if data_is_centred:
+                    # Derived from baseline-subtracted I and II (II - I, etc.), so it's centered around 0
                     # We use it directly without baseline subtraction
-                    centered_adc = adc_data  # Use data as-is (already centered from calculation)
+                    strip_baseline = 0.0  # Use data as-is (already centered from calculation)
+                elif abs(float(adc_data.mean()) - 2000.0) < 500:
+                    # Data is close to baseline 2000 (raw ADC) - includes calculated leads that
+                    # fell back to the raw live buffer
+                    strip_baseline = baseline_adc
                 else:  # Data is already processed (baseline-subtracted or filtered)
-                    centered_adc = adc_data  # Use data as-is (already centered)
+                    strip_baseline = 0.0  # Use data as-is (already centered)
                 
-                # Step 3: Calculate ADC per box based on wave_gain and lead-specific multiplier
-                # LEAD-SPECIFIC ADC PER BOX CONFIGURATION
-                # Each lead can have different ADC per box multiplier (will be divided by wave_gain)
-                adc_per_box_config = {
-                    'I': 5500.0,
-                    'II': 4955.0, 
-                    'III': 5213.0, 
-                    'aVR': 5353.0,  
-                    'aVL': 5500.0,
-                    'aVF': 5353.0,  
-                    'V1': 5500.0,
-                    'V2': 5500.0,
-                    'V3': 5500.0,
-                    'V4': 7586.0,  
-                    'V5': 7586.0, 
-                    'V6': 8209.0,  
-                    '-aVR': 5500.0,  # For Cabrera sequence
-                }
-                # Get lead-specific ADC per box multiplier (default: 5500)
-                adc_per_box_multiplier = adc_per_box_config.get(lead, 5500.0)
-                # Formula: ADC_per_box = adc_per_box_multiplier / wave_gain_mm_mv
-                # IMPORTANT: Each lead can have different ADC per box multiplier
-                # For 10mm/mV with multiplier 5500: 5500 / 10 = 550 ADC per box
+                # Step 3: ADC per box from the lead-specific multiplier and wave_gain (resolved before the loop)
+                # IMPORTANT: Each lead can have different ADC per box multiplier (module-level _ADC_PER_BOX_CONFIG)
                 # For 10mm/mV with multiplier 8209: 8209 / 10 = 821 ADC per box
-                adc_per_box = adc_per_box_multiplier / max(1e-6, wave_gain_mm_mv)  # Avoid division by zero
+                adc_per_box = adc_per_box_by_lead[lead]
                 
-                # DEBUG: Log actual ADC values for troubleshooting
-                max_centered_adc_abs = np.max(np.abs(centered_adc))
-                expected_boxes = max_centered_adc_abs / adc_per_box
+                # DEBUG: Log the ADC span for troubleshooting (one pass, only when DEBUG is enabled)
+                if logger.isEnabledFor(logging.DEBUG):
+                    adc_span = float(np.ptp(adc_data))
+                    logger.debug("Lead %s: centred ADC span %.1f (%.2f boxes)", lead, adc_span, adc_span / adc_per_box)
                 
-                
-                
-                boxes_offset = centered_adc / adc_per_box
-                
-                # Step 5: Convert boxes to Y position (in mm, then to points)
+                # Step 4+5: Convert ADC offset to boxes, then boxes to Y position (in mm, then to points)
                 # Center of graph is at y_pos + (ecg_height / 2.0)
                 # IMPORTANT: User changed to height/3 = 45/3 = 15.0 points per box
                 # This matches the actual grid spacing the user wants
@@ -2389,90 +1961,52 @@ def generate_6_2_ecg_report(filename="ecg_report.pdf", data=None, lead_images=No
                 box_height_points = major_spacing_y  # Use actual grid spacing (height/3)
                 
                 # Convert boxes offset to Y position
-                ecg_normalized = center_y + (boxes_offset * box_height_points)
-                
-                
-                # Draw ALL REAL ECG data points
-                from reportlab.graphics.shapes import Path
-                ecg_path = Path(fillColor=None, 
-                               strokeColor=colors.HexColor("#000000"), 
-                               strokeWidth=0.4,
-                               strokeLineCap=1,
-                               strokeLineJoin=1)
-                
-                # DEBUG: Verify actual plotted values
-                actual_min_y = np.min(ecg_normalized)
-                actual_max_y = np.max(ecg_normalized)
-                actual_span_points = actual_max_y - actual_min_y
-                actual_span_boxes = actual_span_points / box_height_points
-                
-                # Start path
-                ecg_path.moveTo(t[0], ecg_normalized[0])
-                
-                # Add ALL points
-                for i in range(1, len(t)):
-                    ecg_path.lineTo(t[i], ecg_normalized[i])
+                ecg_normalized = _adc_to_ypoints(adc_data, adc_per_box, center_y, box_height_points,
+                                                 baseline=strip_baseline, out=ypoints_scratch[:n_samples])
+                
+                # Thin to min/max pairs per point of strip width (peaks kept), then one PolyLine
+                # (a single m/l.../S operator stream per strip)
+                t, ecg_normalized = _minmax_decimate(t, ecg_normalized, target_cols=int(ecg_width))
+                ecg_path = _build_waveform_path(t, ecg_normalized,
+                                                strokeColor=_ECG_BLACK,
+                                                strokeWidth=0.4,
+                                                strokeLineCap=1,
+                                                strokeLineJoin=1)
                 
                 # Add path to master drawing
                 master_drawing.add(ecg_path)
                 
                 # Calibration notch (only for I, II, III, aVR, aVL, aVF)
-                from reportlab.lib.units import mm
                 notch_path = None
-                print(f" DEBUG: Checking notch for Lead {lead} - is in column1: {lead in ['I', 'II', 'III', 'aVR', 'aVL', 'aVF']}")
-                if lead in ["I", "II", "III", "aVR", "aVL", "aVF"]:
-                    print(f" DEBUG: Creating calibration notch for Lead {lead}")
-                    notch_width_mm = 5.0   # width 5mm
-                    notch_height_mm = 10.0 # height 10mm
-                    notch_width = notch_width_mm * mm
-                    notch_height = notch_height_mm * mm
+                logger.debug("Checking notch for Lead %s - is in column1: %s", lead, is_col1)
+                if is_col1:
+                    logger.debug("Creating calibration notch for Lead %s", lead)
                     
                     # Place notch 10 points after where ECG strip starts, then shift 30 points left
                     # For 6:2 format, ECG data starts at adjusted_x_pos, so notch should be relative to that
                     notch_x = adjusted_x_pos + 10.0 - 30.0  # Same relative position as 4:3 format
                     notch_y_base = center_y
-                    print(f" DEBUG: Notch position - X: {notch_x}, Y: {notch_y_base}, Width: {notch_width}, Height: {notch_height}")
+                    logger.debug("Notch position - X: %s, Y: %s, Width: %s, Height: %s", notch_x, notch_y_base, _NOTCH_WIDTH, _NOTCH_HEIGHT)
                     
-                    notch_path = Path(
-                        fillColor=None,
-                        strokeColor=colors.HexColor("#000000"),
-                        strokeWidth=0.8,
-                        strokeLineCap=1,
-                        strokeLineJoin=0
-                    )
-                    notch_path.moveTo(notch_x, notch_y_base)
-                    notch_path.lineTo(notch_x, notch_y_base + notch_height)
-                    notch_path.lineTo(notch_x + notch_width, notch_y_base + notch_height)
-                    notch_path.lineTo(notch_x + notch_width, notch_y_base)
-                    # Small forward tick to the right (extra 2mm) for clearer notch end
-                    notch_path.lineTo(notch_x + notch_width + (2.0 * mm), notch_y_base)
+                    notch_path = _build_calibration_notch(notch_x, notch_y_base)
                     
                     # Add notch to master drawing
                     master_drawing.add(notch_path)
-                    print(f" DEBUG: Notch added to master drawing for Lead {lead}")
+                    logger.debug("Notch added to master drawing for Lead %s", lead)
                 else:
-                    print(f" DEBUG: Skipping notch for Lead {lead} (not in column1 leads)")
+                    logger.debug("Skipping notch for Lead %s (not in column1 leads)", lead)
                 
-                print(f" Drew {len(real_ecg_data)} ECG data points for Lead {lead}")
-                if lead in ["I", "II", "III", "aVR", "aVL", "aVF"] and notch_path:
-                    print(f" Added calibration notch for Lead {lead}")
+                logger.debug("Drew %d ECG data points for Lead %s", len(real_ecg_data), lead)
             else:
                 print(f" No real data for Lead {lead} - showing grid only")
-                print(f" DEBUG: real_data_available={real_data_available}, saved_ecg_data exists={saved_ecg_data is not None}")
-                if saved_ecg_data and 'leads' in saved_ecg_data:
-                    print(f" DEBUG: Available leads in saved data: {list(saved_ecg_data['leads'].keys())}")
+                logger.debug("real_data_available=%s, saved_ecg_data exists=%s", real_data_available, saved_ecg_data is not None)
+                if saved_leads:
+                    logger.debug("Available leads in saved data: %s", list(saved_leads))
                 
                 # ALWAYS create calibration notch for first 6 leads regardless of data availability
                 # This ensures notch appears in both conditions: with real data AND without real data
-                if lead in ["I", "II", "III", "aVR", "aVL", "aVF"]:
-                    print(f" DEBUG: Creating GUARANTEED calibration notch for Lead {lead} (no data case)")
-                    from reportlab.lib.units import mm
-                    from reportlab.graphics.shapes import Path
-                    
-                    notch_width_mm = 5.0   # width 5mm
-                    notch_height_mm = 10.0 # height 10mm
-                    notch_width = notch_width_mm * mm
-                    notch_height = notch_height_mm * mm
+                if is_col1:
+                    logger.debug("Creating GUARANTEED calibration notch for Lead %s (no data case)", lead)
                     
                     # Calculate center_y same as real data section
                     ecg_height = 45  # Same as real data section
@@ -2480,49 +2014,36 @@ def generate_6_2_ecg_report(filename="ecg_report.pdf", data=None, lead_images=No
                     
                     # Place notch 10 points after where ECG strip starts, then shift 30 points left
                     # For 6:2 format, ECG data would start at adjusted_x_pos, so notch should be relative to that
-                    if lead in ["I", "II", "III", "aVR", "aVL", "aVF"]:
+                    if is_col1:
                         adjusted_x_pos = x_pos + 30  # Column 1 leads are shifted 30 points right
                     else:
                         adjusted_x_pos = x_pos  # Column 2 leads keep original position
                     notch_x = adjusted_x_pos + 10.0 - 30.0  # Same relative position as real data
                     notch_y_base = center_y  # Use same center_y calculation as real data section
-                    print(f" DEBUG: GUARANTEED Notch position - X: {notch_x}, Y: {notch_y_base}, Width: {notch_width}, Height: {notch_height}")
+                    logger.debug("GUARANTEED Notch position - X: %s, Y: %s, Width: %s, Height: %s", notch_x, notch_y_base, _NOTCH_WIDTH, _NOTCH_HEIGHT)
                     
-                    guaranteed_notch_path = Path(
-                        fillColor=None,
-                        strokeColor=colors.HexColor("#000000"),
-                        strokeWidth=0.8,
-                        strokeLineCap=1,
-                        strokeLineJoin=0
-                    )
-                    guaranteed_notch_path.moveTo(notch_x, notch_y_base)
-                    guaranteed_notch_path.lineTo(notch_x, notch_y_base + notch_height)
-                    guaranteed_notch_path.lineTo(notch_x + notch_width, notch_y_base + notch_height)
-                    guaranteed_notch_path.lineTo(notch_x + notch_width, notch_y_base)
-                    # Small forward tick to the right (extra 2mm) for clearer notch end
-                    guaranteed_notch_path.lineTo(notch_x + notch_width + (2.0 * mm), notch_y_base)
+                    guaranteed_notch_path = _build_calibration_notch(notch_x, notch_y_base)
                     
                     # Add notch to master drawing
                     master_drawing.add(guaranteed_notch_path)
-                    print(f" DEBUG: GUARANTEED calibration notch added for Lead {lead} (no data case)")
-                    print(f" Added GUARANTEED calibration notch for Lead {lead} (no data case)")
+                    logger.debug("GUARANTEED calibration notch added for Lead %s (no data case)", lead)
                 else:
-                    print(f" DEBUG: Skipping notch for Lead {lead} (not in first 6 leads, no data case)")
+                    logger.debug("Skipping notch for Lead %s (not in first 6 leads, no data case)", lead)
             
             successful_graphs += 1
             
         except Exception as e:
             print(f" Error adding Lead {lead}: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.debug("Lead %s drawing failed", lead, exc_info=True)
+    
+    # One progress line for the whole loop - per-lead detail is logged at DEBUG
+    print(f" Drew {successful_graphs}/{len(lead_positions)} lead strips")
     
     # STEP 3.5: Add extra Lead II label below aVF (45 points below aVF position)
-    # aVF is at index 5 in column1_leads, position = start_y - (5 * 60) = 412 - 300 = 112
+    # aVF is at index 5 in column 1, position = start_y - (5 * 60) = 412 - 300 = 112
     # Extra Lead II label position = 112 - 45 = 67
-    from reportlab.graphics.shapes import String
-    
     # Calculate aVF position to place Lead II label 45 points below it
-    avf_lead_index = 5  # aVF is 6th lead (index 5) in column1_leads
+    avf_lead_index = _LEAD_META["aVF"]["col_idx"]  # aVF is 6th lead (index 5) in column 1
     avf_y_pos = start_y - (avf_lead_index * 60)  # 412 - (5 * 60) = 112
     extra_lead_ii_y_pos = avf_y_pos - 45 - 15  # 112 - 45 - 15 = 52 (shifted 15 points DOWN)
     
@@ -2531,9 +2052,7 @@ def generate_6_2_ecg_report(filename="ecg_report.pdf", data=None, lead_images=No
     
     # Add extra Lead II label (shifted 50 points up from strip: 60 - 10 = 50)
     extra_lead_ii_label_y = extra_lead_ii_y_pos + 50  # Label 50 points above ECG strip (60 - 10 = 50)
-    extra_lead_ii_label = String(extra_lead_ii_x_pos, extra_lead_ii_label_y, "II",  # 50 points above ECG strip
-                                fontSize=10, fontName="Helvetica-Bold", fillColor=colors.black)
-    master_drawing.add(extra_lead_ii_label)
+    page_labels.add(_page_label(extra_lead_ii_x_pos, extra_lead_ii_label_y, "II", fontName="Helvetica-Bold"))  # 50 points above ECG strip
     
     print(f" Added extra Lead II label at position ({extra_lead_ii_x_pos}, {extra_lead_ii_label_y}) - 50 points above ECG strip")
     
@@ -2543,24 +2062,14 @@ def generate_6_2_ecg_report(filename="ecg_report.pdf", data=None, lead_images=No
     extra_lead_ii_data = None  # Initialize to prevent undefined variable error
     
     # Try to get Lead II data from saved_ecg_data - EXACTLY LIKE ORIGINAL LEAD II
-    if saved_ecg_data and 'leads' in saved_ecg_data and "II" in saved_ecg_data['leads']:
-        extra_lead_ii_raw_data = saved_ecg_data['leads']["II"]  # Same as original: raw_data = saved_ecg_data['leads'][lead_name_for_saved]
+    if "II" in saved_leads:
+        extra_lead_ii_raw_data = saved_leads["II"]  # Same as original: raw_data = saved_leads[lead_name_for_saved]
         print(f" Found Lead II raw data from saved_ecg_data: {len(extra_lead_ii_raw_data)} points")
         
         # Apply same time window filtering as original leads
         if len(extra_lead_ii_raw_data) > 0:
-            # Calculate time window for filtering (same as original)
-            calculated_time_window = None
-            if is_demo_mode and time_window_seconds is not None:
-                calculated_time_window = time_window_seconds
-                num_samples_to_capture = int(time_window_seconds * samples_per_second)
-            else:
-                calculated_time_window, _ = calculate_time_window_from_bpm_and_wave_speed(
-                    data.get('HR_avg', 70),  # Use same HR as original
-                    wave_speed_mm_s,
-                    desired_beats=15
-                )
-                num_samples_to_capture = int(calculated_time_window * computed_sampling_rate)
+            # num_samples_to_capture was resolved once above the lead loop (demo window or
+            # 165mm / wave_speed) - the window only depends on wave speed, so reuse it as is
             
             # Apply same filtering logic as original Lead II
             saved_data_samples = len(extra_lead_ii_raw_data)
@@ -2591,51 +2100,35 @@ def generate_6_2_ecg_report(filename="ecg_report.pdf", data=None, lead_images=No
         extra_lead_ii_width = 780  # Full page width
         extra_lead_ii_height = 45  # Same height as other leads
         
-        # Get wave_gain for amplitude scaling
-        wave_gain_mm_mv = 10.0  # Default
-        if settings_manager:
-            try:
-                wave_gain_setting = settings_manager.get_setting("wave_gain", "10")
-                wave_gain_mm_mv = float(wave_gain_setting) if wave_gain_setting else 10.0
-            except Exception:
-                wave_gain_mm_mv = 10.0
+        # Amplitude scaling uses wave_gain_mm_mv parsed from the settings snapshot in STEP 2
         
         # Process Lead II data for drawing
-        adc_per_box_config = {
-            'II': 4955.0,  # Lead II specific ADC per box
-        }
-        adc_per_box_multiplier = adc_per_box_config.get("II", 4955.0)
+        adc_per_box_multiplier = _ADC_PER_BOX_CONFIG.get("II", 4955.0)  # Lead II specific ADC per box
         
         # Convert to numpy array and process
-        adc_data = np.array(extra_lead_ii_data, dtype=float)
+        adc_data = np.asarray(extra_lead_ii_data, dtype=np.float32)
         baseline_adc = 2000.0
-        centered_adc = adc_data - baseline_adc
-        adc_per_box = adc_per_box_multiplier / max(1e-6, wave_gain_mm_mv)
-        boxes_offset = centered_adc / adc_per_box
+        n_samples = len(adc_data)
+        if n_samples > len(sample_ramp):
+            ypoints_scratch, xpoints_scratch, sample_ramp = _alloc_strip_scratch(n_samples)
+        adc_per_box = adc_per_box_multiplier * inv_wave_gain
         
         # Convert to Y position
         center_y = extra_lead_ii_y + (extra_lead_ii_height / 2.0)
-        from reportlab.lib.units import mm
-        box_height_points = 5.0 * mm  # Standard ECG: 5mm = 14.17 points per box (same as original)
-        ecg_normalized = center_y + (boxes_offset * box_height_points)
+        box_height_points = _BOX_HEIGHT_POINTS  # Standard ECG: 5mm = 14.17 points per box (same as original)
+        ecg_normalized = _adc_to_ypoints(adc_data, adc_per_box, center_y, box_height_points,
+                                         baseline=baseline_adc, out=ypoints_scratch[:n_samples])
         
         # Create time array (full page width)
-        t = np.linspace(extra_lead_ii_adjusted_x_pos, extra_lead_ii_adjusted_x_pos + extra_lead_ii_width, len(extra_lead_ii_data))
+        t = _strip_x_points(extra_lead_ii_adjusted_x_pos, extra_lead_ii_width, sample_ramp, xpoints_scratch[:n_samples])
         
-        # Draw ECG strip
-        from reportlab.graphics.shapes import Path
-        extra_lead_ii_path = Path(fillColor=None, 
-                                 strokeColor=colors.HexColor("#000000"), 
-                                 strokeWidth=0.4,
-                                 strokeLineCap=1,
-                                 strokeLineJoin=1)
-        
-        # Move to first point
-        extra_lead_ii_path.moveTo(t[0], ecg_normalized[0])
-        
-        # Draw all points
-        for i in range(1, len(t)):
-            extra_lead_ii_path.lineTo(t[i], ecg_normalized[i])
+        # Draw ECG strip (min/max pairs per point of strip width, one Path)
+        t, ecg_normalized = _minmax_decimate(t, ecg_normalized, target_cols=int(extra_lead_ii_width))
+        extra_lead_ii_path = _build_waveform_path(t, ecg_normalized,
+                                                  strokeColor=_ECG_BLACK,
+                                                  strokeWidth=0.4,
+                                                  strokeLineCap=1,
+                                                  strokeLineJoin=1)
         
         # Add ECG strip to master drawing
         master_drawing.add(extra_lead_ii_path)
@@ -2643,33 +2136,15 @@ def generate_6_2_ecg_report(filename="ecg_report.pdf", data=None, lead_images=No
         print(f" Drew extra Lead II ECG strip with {len(extra_lead_ii_data)} points")
         
         # Add calibration notch for extra Lead II
-        from reportlab.lib.units import mm
-        notch_width_mm = 5.0   # width 5mm
-        notch_height_mm = 10.0 # height 10mm
-        notch_width = notch_width_mm * mm
-        notch_height = notch_height_mm * mm
-        
         # Calculate notch position (same as other column1 leads - at ECG strip start)
         # Place notch 10 points after where ECG strip starts, then shift 30 points left
         # For 6:2 format, ECG data starts at adjusted_x_pos, so notch should be relative to that
         notch_x = extra_lead_ii_adjusted_x_pos + 10.0 - 30.0  # Same relative position as other leads
         notch_y_base = center_y  # Use same center_y as ECG calculation
-        print(f" DEBUG: Extra Lead II Notch position - X: {notch_x}, Y: {notch_y_base}, Width: {notch_width}, Height: {notch_height}")
-        
-        # Create calibration notch (same styling as other leads)
-        extra_lead_ii_notch = Path(
-            fillColor=None,
-            strokeColor=colors.HexColor("#000000"),
-            strokeWidth=0.8,
-            strokeLineCap=1,
-            strokeLineJoin=1
-        )
-        extra_lead_ii_notch.moveTo(notch_x, notch_y_base)
-        extra_lead_ii_notch.lineTo(notch_x, notch_y_base + notch_height)
-        extra_lead_ii_notch.lineTo(notch_x + notch_width, notch_y_base + notch_height)
-        extra_lead_ii_notch.lineTo(notch_x + notch_width, notch_y_base)
-        # Small forward tick to the right (extra 2mm) for clearer notch end
-        extra_lead_ii_notch.lineTo(notch_x + notch_width + (2.0 * mm), notch_y_base)
+        logger.debug("Extra Lead II Notch position - X: %s, Y: %s, Width: %s, Height: %s", notch_x, notch_y_base, _NOTCH_WIDTH, _NOTCH_HEIGHT)
+        
+        # Create calibration notch (same outline as other leads, round joins like the strip)
+        extra_lead_ii_notch = _build_calibration_notch(notch_x, notch_y_base, stroke_line_join=1)
         
         # Add notch to master drawing
         master_drawing.add(extra_lead_ii_notch)
@@ -2681,20 +2156,13 @@ def generate_6_2_ecg_report(filename="ecg_report.pdf", data=None, lead_images=No
     
     # STEP 4: Add Patient Info, Date/Time and Vital Parameters to master drawing
     # POSITIONED ABOVE ECG GRAPH (not mixed inside graph)
-    from reportlab.graphics.shapes import String
 
     # LEFT SIDE: Patient Info (TOP LEFT CORNER - moved up by 10 points)
-    patient_name_label = String(-5, 550, f"Name: {full_name}",  # Moved up 10 points (550)
-                           fontSize=10, fontName="Helvetica", fillColor=colors.black)
-    master_drawing.add(patient_name_label)
+    page_labels.add(_page_label(-5, 550, f"Name: {full_name}"))  # Moved up 10 points (550)
 
-    patient_age_label = String(-5, 530, f"Age: {age}",  # Moved up 10 points (530)
-                          fontSize=10, fontName="Helvetica", fillColor=colors.black)
-    master_drawing.add(patient_age_label)
+    page_labels.add(_page_label(-5, 530, f"Age: {age}"))  # Moved up 10 points (530)
 
-    patient_gender_label = String(-5, 510, f"Gender: {gender}",  # Moved up 10 points (510)
-                             fontSize=10, fontName="Helvetica", fillColor=colors.black)
-    master_drawing.add(patient_gender_label)
+    page_labels.add(_page_label(-5, 510, f"Gender: {gender}"))  # Moved up 10 points (510)
 
     # RIGHT SIDE: Vital Parameters at SAME LEVEL as patient info (ABOVE ECG GRAPH)
     # Get real ECG data from dashboard
@@ -2706,37 +2174,25 @@ def generate_6_2_ecg_report(filename="ecg_report.pdf", data=None, lead_images=No
     ST = data.get('ST', 114)
     # DYNAMIC RR interval calculation from heart rate (instead of hard-coded 857)
     RR = int(60000 / HR) if HR and HR > 0 else 0  # RR interval in ms from heart rate
+    # Label text for the values the report rounds to whole ms, formatted once
+    qt_text, qtc_text, st_text = (f"{int(round(v))} ms" for v in (QT, QTc, ST))
    
     # Add vital parameters in TWO COLUMNS (ALIGNED with patient info - moved up by 10 points) - SHIFTED UP 5 more points
     # FIRST COLUMN (Left side - x=130) - ALIGNED and moved up
-    hr_label = String(130, 555, f"HR    : {HR} bpm",  # Moved up 5 points from 550 to 555
-                     fontSize=10, fontName="Helvetica", fillColor=colors.black)
-    master_drawing.add(hr_label)
+    page_labels.add(_page_label(130, 555, f"HR    : {HR} bpm"))  # Moved up 5 points from 550 to 555
 
-    pr_label = String(130, 541, f"PR    : {PR} ms",  # Moved up 5 points from 530 to 535
-                     fontSize=10, fontName="Helvetica", fillColor=colors.black)
-    master_drawing.add(pr_label)
+    page_labels.add(_page_label(130, 541, f"PR    : {PR} ms"))  # Moved up 5 points from 530 to 535
 
-    qrs_label = String(130, 527, f"QRS : {QRS} ms",  # Moved up 5 points from 510 to 515
-                      fontSize=10, fontName="Helvetica", fillColor=colors.black)
-    master_drawing.add(qrs_label)
+    page_labels.add(_page_label(130, 527, f"QRS : {QRS} ms"))  # Moved up 5 points from 510 to 515
     
-    rr_label = String(130, 510, f"RR    : {RR} ms",  # Moved up 5 points from 490 to 495
-                     fontSize=10, fontName="Helvetica", fillColor=colors.black)
-    master_drawing.add(rr_label)
+    page_labels.add(_page_label(130, 510, f"RR    : {RR} ms"))  # Moved up 5 points from 490 to 495
 
-    qt_label = String(130, 496, f"QT    : {int(round(QT))} ms",  # Moved up 5 points from 470 to 475
-                     fontSize=10, fontName="Helvetica", fillColor=colors.black)
-    master_drawing.add(qt_label)
+    page_labels.add(_page_label(130, 496, f"QT    : {qt_text}"))  # Moved up 5 points from 470 to 475
 
-    qtc_label = String(130, 482, f"QTc  : {int(round(QTc))} ms",  # Moved up 5 points from 450 to 455
-                      fontSize=10, fontName="Helvetica", fillColor=colors.black)
-    master_drawing.add(qtc_label)
+    page_labels.add(_page_label(130, 482, f"QTc  : {qtc_text}"))  # Moved up 5 points from 450 to 455
 
     # SECOND COLUMN (Right side - x=240) - ALIGNED and moved up
-    st_label = String(240, 496, f"ST            : {int(round(ST))} ms",  # Moved up 5 points from 430 to 435
-                     fontSize=10, fontName="Helvetica", fillColor=colors.black)
-    master_drawing.add(st_label)
+    page_labels.add(_page_label(240, 496, f"ST            : {st_text}"))  # Moved up 5 points from 430 to 435
 
     # CALCULATED wave amplitudes and lead-specific measurements
     # Prefer values passed in data; if missing/zero, compute from live ecg_test_page data (last 10s)
@@ -2750,48 +2206,45 @@ def generate_6_2_ecg_report(filename="ecg_report.pdf", data=None, lead_images=No
     
     # If not provided or zero, compute quickly from Lead II in ecg_test_page (robust fallback)
     def _compute_from_data_array(arr, fs):
-        from scipy.signal import butter, filtfilt, find_peaks
         if arr is None or len(arr) < int(2*fs) or np.std(arr) < 0.1:
             return 0.0, 0.0, 0.0
-        nyq = fs/2.0
-        b,a = butter(2, [max(0.5/nyq, 0.001), min(40.0/nyq,0.99)], btype='band')
-        x = filtfilt(b,a,arr)
+        x = _qrs_filter(arr, fs)
         # Simple R detection via Pan-Tompkins style envelope
-        squared = np.square(np.diff(x))
-        win = max(1, int(0.15*fs))
-        env = np.convolve(squared, np.ones(win)/win, mode='same')
-        thr = np.mean(env) + 0.5*np.std(env)
-        r_peaks, _ = find_peaks(env, height=thr, distance=int(0.6*fs))
+        r_peaks = _detect_r_peaks(x, fs)
         if len(r_peaks) < 3:
             return 0.0, 0.0, 0.0
+        # Interior beats only: R peaks are >= 600 ms apart, so every window below
+        # (200 ms before R to 300 ms after) lies inside x - one fixed-width block per wave
+        beats = r_peaks[1:-1]
+        def windows(start, stop):
+            return x[beats[:, None] + np.arange(start, stop)]
         p_vals, qrs_vals, t_vals = [], [], []
-        for r in r_peaks[1:-1]:
-            # P: 120-200ms before R
-            p_start = max(0, r-int(0.20*fs)); p_end = max(0, r-int(0.12*fs))
-            if p_end>p_start:
-                seg = x[p_start:p_end]
-                base = np.mean(x[max(0,p_start-int(0.05*fs)):p_start])
-                p_vals.append(max(seg)-base)
-            # QRS: +-80ms around R
-            qrs_start = max(0, r-int(0.08*fs)); qrs_end = min(len(x), r+int(0.08*fs))
-            if qrs_end>qrs_start:
-                seg = x[qrs_start:qrs_end]
-                qrs_vals.append(max(seg)-min(seg))
-            # T: 100-300ms after R
-            t_start = min(len(x), r+int(0.10*fs)); t_end = min(len(x), r+int(0.30*fs))
-            if t_end>t_start:
-                seg = x[t_start:t_end]
-                base = np.mean(x[r:t_start]) if t_start>r else 0.0
-                t_vals.append(max(seg)-base)
+        # P: 120-200ms before R, relative to the 50ms before the P window
+        p_lo, p_hi = int(0.20*fs), int(0.12*fs)
+        if p_lo > p_hi:
+            p_vals = windows(-p_lo, -p_hi).max(axis=1) - windows(-p_lo - int(0.05*fs), -p_lo).mean(axis=1)
+        # QRS: +-80ms around R
+        qrs_half = int(0.08*fs)
+        if qrs_half > 0:
+            qrs_seg = windows(-qrs_half, qrs_half)
+            qrs_vals = qrs_seg.max(axis=1) - qrs_seg.min(axis=1)
+        # T: 100-300ms after R, relative to the mean from R to the T window
+        t_lo, t_hi = int(0.10*fs), int(0.30*fs)
+        if t_hi > t_lo:
+            t_base = windows(0, t_lo).mean(axis=1) if t_lo > 0 else 0.0
+            t_vals = windows(t_lo, t_hi).max(axis=1) - t_base
         def med(v):
             return float(np.median(v)) if len(v)>0 else 0.0
         return med(p_vals), med(qrs_vals), med(t_vals)
 
+    # Live sampler rate for the measurement fallbacks below (amplitudes, axis, RV5/SV1) - resolved once
+    # Each fallback analyses a different lead (II; I + aVF; V5 + V1), so only the rate is shared
+    sampler_rate = getattr(getattr(ecg_test_page, 'sampler', None), 'sampling_rate', None)
+    analysis_fs = _safe_float(sampler_rate, 250.0) if sampler_rate else 250.0
+
     if (p_amp_mv<=0 or qrs_amp_mv<=0 or t_amp_mv<=0) and ecg_test_page is not None and hasattr(ecg_test_page,'data'):
         try:
-            fs = 250.0
-            if hasattr(ecg_test_page, 'sampler') and hasattr(ecg_test_page.sampler,'sampling_rate') and ecg_test_page.sampler.sampling_rate:
-                fs = float(ecg_test_page.sampler.sampling_rate)
+            fs = analysis_fs
             arr = None
             if len(ecg_test_page.data)>1:
                 lead_ii = ecg_test_page.data[1]
@@ -2813,16 +2266,12 @@ def generate_6_2_ecg_report(filename="ecg_report.pdf", data=None, lead_images=No
     
     if ecg_test_page is not None and hasattr(ecg_test_page, 'data') and len(ecg_test_page.data) > 5:
         try:
-            from scipy.signal import butter, filtfilt, find_peaks
-            
             # Get Lead I (index 0) and Lead aVF (index 5)
             lead_I = ecg_test_page.data[0] if len(ecg_test_page.data) > 0 else None
             lead_aVF = ecg_test_page.data[5] if len(ecg_test_page.data) > 5 else None
             
-            # Get sampling rate
-            fs = 250.0
-            if hasattr(ecg_test_page, 'sampler') and hasattr(ecg_test_page.sampler, 'sampling_rate') and ecg_test_page.sampler.sampling_rate:
-                fs = float(ecg_test_page.sampler.sampling_rate)
+            # Sampling rate resolved once above
+            fs = analysis_fs
             
             if lead_I is not None and lead_aVF is not None:
                 # Convert to numpy arrays
@@ -2839,18 +2288,12 @@ def generate_6_2_ecg_report(filename="ecg_report.pdf", data=None, lead_images=No
                 lead_aVF_data = _get_last(lead_aVF)
                 
                 if len(lead_I_data) > int(2*fs) and len(lead_aVF_data) > int(2*fs):
-                    # Filter signals
-                    nyq = fs/2.0
-                    b, a = butter(2, [max(0.5/nyq, 0.001), min(40.0/nyq, 0.99)], btype='band')
-                    lead_I_filt = filtfilt(b, a, lead_I_data)
-                    lead_aVF_filt = filtfilt(b, a, lead_aVF_data)
+                    # Filter signals (same 0.5-40 Hz band-pass as the amplitude fallback)
+                    lead_I_filt = _qrs_filter(lead_I_data, fs)
+                    lead_aVF_filt = _qrs_filter(lead_aVF_data, fs)
                     
                     # Detect R peaks using Pan-Tompkins style
-                    squared = np.square(np.diff(lead_aVF_filt))
-                    win = max(1, int(0.15*fs))
-                    env = np.convolve(squared, np.ones(win)/win, mode='same')
-                    thr = np.mean(env) + 0.5*np.std(env)
-                    r_peaks, _ = find_peaks(env, height=thr, distance=int(0.6*fs))
+                    r_peaks = _detect_r_peaks(lead_aVF_filt, fs)
                     
                     if len(r_peaks) >= 3:
                         # Calculate QRS Axis
@@ -2866,18 +2309,19 @@ def generate_6_2_ecg_report(filename="ecg_report.pdf", data=None, lead_images=No
                                 return "--"
                             window_before = int(window_before_ms * fs / 1000)
                             window_after = int(window_after_ms * fs / 1000)
-                            net_I = []
-                            net_aVF = []
-                            for peak in wave_peaks:
-                                start = max(0, peak - window_before)
-                                end = min(len(lead_I_sig), peak + window_after)
-                                if end > start:
-                                    net_I.append(np.sum(lead_I_sig[start:end]))
-                                    net_aVF.append(np.sum(lead_aVF_sig[start:end]))
-                            if len(net_I) == 0:
+                            peaks = np.asarray(wave_peaks, dtype=np.int64)
+                            starts = np.maximum(0, peaks - window_before)
+                            ends = np.minimum(len(lead_I_sig), peaks + window_after)
+                            valid = ends > starts
+                            if not valid.any():
                                 return "--"
-                            mean_I = np.mean(net_I)
-                            mean_aVF = np.mean(net_aVF)
+                            starts, ends = starts[valid], ends[valid]
+                            # Net area per wave window as prefix-sum differences: sum(sig[s:e]) = cs[e] - cs[s]
+                            cs_I = np.concatenate(([0.0], np.cumsum(lead_I_sig)))
+                            cs_aVF = np.concatenate(([0.0], np.cumsum(lead_aVF_sig)))
+                            n_aVF = len(lead_aVF_sig)  # aVF windows are clipped to its own length, like slicing
+                            mean_I = np.mean(cs_I[ends] - cs_I[starts])
+                            mean_aVF = np.mean(cs_aVF[np.minimum(ends, n_aVF)] - cs_aVF[np.minimum(starts, n_aVF)])
                             if abs(mean_I) < 1e-6 and abs(mean_aVF) < 1e-6:
                                 return "--"
                             axis_rad = np.arctan2(mean_aVF, mean_I)
@@ -3119,7 +2563,6 @@ def generate_6_2_ecg_report(filename="ecg_report.pdf", data=None, lead_images=No
                         print(f" Calculated P/QRS/T Axis: P={p_axis_deg}, QRS={qrs_axis_deg}, T={t_axis_deg}")
         except Exception as e:
             print(f" Axis calculation failed: {e}")
-            import traceback
             traceback.print_exc()
         
     # Format axis values for display (remove ° symbol for compact display)
@@ -3144,9 +2587,7 @@ def generate_6_2_ecg_report(filename="ecg_report.pdf", data=None, lead_images=No
     t_mm = extract_axis_value(t_axis_deg)
     
     # SECOND COLUMN - P/QRS/T Axis (ABOVE ECG GRAPH - same position)
-    p_qrs_label = String(240, 555, f"P/QRS/T  : {p_axis_display}/{qrs_axis_display}/{t_axis_display}°",  # Changed to axis values
-                         fontSize=10, fontName="Helvetica", fillColor=colors.black)
-    master_drawing.add(p_qrs_label)
+    page_labels.add(_page_label(240, 555, f"P/QRS/T  : {p_axis_display}/{qrs_axis_display}/{t_axis_display}°"))  # Changed to axis values
 
     # Get RV5 and SV1 amplitudes
     rv5_amp = data.get('rv5', 0.0)
@@ -3161,10 +2602,7 @@ def generate_6_2_ecg_report(filename="ecg_report.pdf", data=None, lead_images=No
     # NOTE: sv1_amp can be negative (SV1 is negative by definition), so check for == 0.0, not <= 0
     if (rv5_amp<=0 or sv1_amp==0.0) and ecg_test_page is not None and hasattr(ecg_test_page,'data'):
         try:
-            from scipy.signal import butter, filtfilt, find_peaks
-            fs = 250.0
-            if hasattr(ecg_test_page, 'sampler') and hasattr(ecg_test_page.sampler,'sampling_rate') and ecg_test_page.sampler.sampling_rate:
-                fs = float(ecg_test_page.sampler.sampling_rate)
+            fs = analysis_fs
             def _get_last(arr):
                 return arr[-int(10*fs):] if arr is not None and len(arr)>int(10*fs) else arr
             # V5 index 10, V1 index 6
@@ -3177,11 +2615,7 @@ def generate_6_2_ecg_report(filename="ecg_report.pdf", data=None, lead_images=No
             if v5_raw is not None and len(v5_raw)>int(2*fs):
                 # Apply filter ONLY for R-peak detection (0.5-40 Hz)
                 # Use RAW data for amplitude measurements
-                nyq = fs/2.0
-                b,a = butter(2, [max(0.5/nyq, 0.001), min(40.0/nyq,0.99)], btype='band')
-                v5f = filtfilt(b,a, np.asarray(v5_raw))
-                env = np.convolve(np.square(np.diff(v5f)), np.ones(int(0.15*fs))/(0.15*fs), mode='same')
-                r,_ = find_peaks(env, height=np.mean(env)+0.5*np.std(env), distance=int(0.6*fs))
+                r = _detect_r_peaks(_qrs_filter(v5_raw, fs), fs)
                 vals=[]
                 for rr in r[1:-1]:
                     # QRS window: ±80ms around R-peak
@@ -3213,11 +2647,7 @@ def generate_6_2_ecg_report(filename="ecg_report.pdf", data=None, lead_images=No
             if v1_raw is not None and len(v1_raw)>int(2*fs):
                 # Apply filter ONLY for R-peak detection (0.5-40 Hz)
                 # Use RAW data for amplitude measurements
-                nyq = fs/2.0
-                b,a = butter(2, [max(0.5/nyq, 0.001), min(40.0/nyq,0.99)], btype='band')
-                v1f = filtfilt(b,a, np.asarray(v1_raw))
-                env = np.convolve(np.square(np.diff(v1f)), np.ones(int(0.15*fs))/(0.15*fs), mode='same')
-                r,_ = find_peaks(env, height=np.mean(env)+0.5*np.std(env), distance=int(0.6*fs))
+                r = _detect_r_peaks(_qrs_filter(v1_raw, fs), fs)
                 vals=[]
                 for rr in r[1:-1]:
                     # QRS window: ±80ms around R-peak
@@ -3261,9 +2691,7 @@ def generate_6_2_ecg_report(filename="ecg_report.pdf", data=None, lead_images=No
     # SECOND COLUMN - RV5/SV1 (ALIGNED and moved up 5 points)
     # Display SV1 as negative mV (GE/Hospital standard)
     # Use 3 decimal places for precision (not rounded to integers)
-    rv5_sv_label = String(240, 541, f"RV5/SV1  : {rv5_mv:.3f} mV/{sv1_mv:.3f} mV",  # Moved up 5 points from 530 to 535
-                          fontSize=10, fontName="Helvetica", fillColor=colors.black)
-    master_drawing.add(rv5_sv_label)
+    page_labels.add(_page_label(240, 541, f"RV5/SV1  : {rv5_mv:.3f} mV/{sv1_mv:.3f} mV"))  # Moved up 5 points from 530 to 535
 
     # Calculate RV5+SV1 = RV5 + abs(SV1) (GE/Philips standard)
     # CRITICAL: Calculate from unrounded values to avoid rounding errors
@@ -3272,9 +2700,7 @@ def generate_6_2_ecg_report(filename="ecg_report.pdf", data=None, lead_images=No
     
     # SECOND COLUMN - RV5+SV1 (ALIGNED and moved up 5 points)
     # Use 3 decimal places for precision
-    rv5_sv1_sum_label = String(240, 527, f"RV5+SV1 : {rv5_sv1_sum:.3f} mV",  # Moved up 5 points from 510 to 515
-                               fontSize=10, fontName="Helvetica", fillColor=colors.black)
-    master_drawing.add(rv5_sv1_sum_label)
+    page_labels.add(_page_label(240, 527, f"RV5+SV1 : {rv5_sv1_sum:.3f} mV"))  # Moved up 5 points from 510 to 515
 
     # SECOND COLUMN - QTCF (ABOVE ECG GRAPH - shifted further up)
     # Calculate QTcF using Fridericia formula: QTcF = QT / RR^(1/3)
@@ -3284,27 +2710,21 @@ def generate_6_2_ecg_report(filename="ecg_report.pdf", data=None, lead_images=No
         qtcf_text = f"QTCF       : {qtcf_val:.0f} ms ({qtcf_sec:.3f} s)"
     else:
         qtcf_text = "QTCF       : --"
-    qtcf_label = String(240, 510, qtcf_text,  # Moved up from 642 to 652
-                        fontSize=10, fontName="Helvetica", fillColor=colors.black)
-    master_drawing.add(qtcf_label)
+    page_labels.add(_page_label(240, 510, qtcf_text))  # Moved up from 642 to 652
 
     # SECOND COLUMN - Speed/Gain (merged in one line) (ABOVE ECG GRAPH - shifted further up)
-    filter_band = settings_manager.get_setting("filter_band", "0.5~35Hz")
-    ac_frequency = settings_manager.get_setting("ac_frequency", "50")
-    master_drawing.add(String(
+    filter_band = report_settings["filter_band"]
+    ac_frequency = report_settings["ac_frequency"]
+    page_labels.add(_page_label(
         240,
         482,  # Moved up from 606 to 616
         f"{wave_speed_mm_s} mm/s   {filter_band}   AC : {ac_frequency}Hz   {wave_gain_mm_mv} mm/mV",
-        fontSize=10,
-        fontName="Helvetica",
-        fillColor=colors.black,
     ))
 
     
 
 
     
-    from reportlab.pdfbase.pdfmetrics import stringWidth
     label_text = "Doctor Name: "
     
     # Value from Save ECG -> passed in 'patient'
@@ -3316,20 +2736,14 @@ def generate_6_2_ecg_report(filename="ecg_report.pdf", data=None, lead_images=No
         doctor = ""
   
     # Doctor Name (below V6 lead) - SHIFTED 15 points right and 30 points up
-    doctor_name_label = String(-15, 20, "Doctor Name: ",  # X: -30→-15 (right 15), Y: -10→20 (up 30)
-                              fontSize=10, fontName="Helvetica-Bold", fillColor=colors.black)
-    master_drawing.add(doctor_name_label)
+    page_labels.add(_page_label(-15, 20, "Doctor Name: ", fontName="Helvetica-Bold"))  # X: -30→-15 (right 15), Y: -10→20 (up 30)
     
     if doctor:
         value_x = -15 + stringWidth("Doctor Name: ", "Helvetica-Bold", 10) + 5  # Updated X position
-        doctor_name_value = String(value_x, 20, doctor,  # Updated Y position
-                                fontSize=10, fontName="Helvetica", fillColor=colors.black)
-        master_drawing.add(doctor_name_value)
+        page_labels.add(_page_label(value_x, 20, doctor))  # Updated Y position
 
     # Doctor Signature (below Doctor Name) - SHIFTED 15 points right and 30 points up
-    doctor_sign_label = String(-15, 5, "Doctor Sign: ",  # X: -30→-15 (right 15), Y: -25→5 (up 30)
-                              fontSize=10, fontName="Helvetica-Bold", fillColor=colors.black)
-    master_drawing.add(doctor_sign_label)
+    page_labels.add(_page_label(-15, 5, "Doctor Sign: ", fontName="Helvetica-Bold"))  # X: -30→-15 (right 15), Y: -25→5 (up 30)
 
     # Add RIGHT-SIDE Conclusion Box (moved to the right) - NOW DYNAMIC FROM DASHBOARD (12 conclusions max) - MADE SMALLER
     # SHIFTED UP by 50 points (45 + 5) and RIGHT by 75 points
@@ -3347,7 +2761,7 @@ def generate_6_2_ecg_report(filename="ecg_report.pdf", data=None, lead_images=No
     # Box top is at conclusion_y_start - 55, so header should be very close to top line
     conclusion_header = String(627.5, conclusion_y_start + 8, "✦ CONCLUSION ✦",  # Centered in shifted box
                               fontSize=9, fontName="Helvetica-Bold",  # Reduced from 11 to 9
-                              fillColor=colors.HexColor("#2c3e50"),
+                              fillColor=_CONCLUSION_HEADER_COLOR,
                               textAnchor="middle")  # This centers the text
     master_drawing.add(conclusion_header)
     
@@ -3385,15 +2799,14 @@ def generate_6_2_ecg_report(filename="ecg_report.pdf", data=None, lead_images=No
             # Position horizontally across the box (2 conclusions per row) - shifted right 75 points
             x_pos = 460 + (col_idx * 160)  # Shifted right 75 points from 385 to 460
             
-            conc = String(x_pos, row_y, conc_text, 
-                         fontSize=9, fontName="Helvetica", fillColor=colors.black)
-            master_drawing.add(conc)
+            page_labels.add(_page_label(x_pos, row_y, conc_text, fontSize=9))
             
             conclusion_num += 1  # Increment for next conclusion
 
     print(f" Added Patient Info, Vital Parameters, {len(filtered_conclusions)} REAL Conclusions (no empty/---), and Doctor Name/Signature to ECG grid")
     
     # STEP 5: Add SINGLE master drawing to story (NO containers)
+    master_drawing.add(page_labels)
     story.append(master_drawing)
     
     print(f" Added SINGLE master drawing with {successful_graphs}/12 ECG leads (ZERO containers)!")
@@ -3417,7 +2830,7 @@ def generate_6_2_ecg_report(filename="ecg_report.pdf", data=None, lead_images=No
     measurement_style = ParagraphStyle(
         'MeasurementStyle',
         fontSize=8,
-        textColor=colors.HexColor("#000000"),
+        textColor=_ECG_BLACK,
         alignment=1  # center
         # backColor removed
     )
@@ -3427,157 +2840,15 @@ def generate_6_2_ecg_report(filename="ecg_report.pdf", data=None, lead_images=No
     summary_style = ParagraphStyle( 
         'SummaryStyle',
         fontSize=10,
-        textColor=colors.HexColor("#000000"),
+        textColor=_ECG_BLACK,
         alignment=1  # center
         # backColor removed
     )
     # summary_para = Paragraph(f"ECG Report: {successful_graphs}/12 leads displayed", summary_style)
     # story.append(summary_para)
 
-    # Helper: draw logo on every page AND ALIGNED pink grid background on Page 2
-    def _draw_logo_and_footer(canvas, doc):
-        import os
-        from reportlab.lib.units import mm
-        
-        # STEP 1: Draw FULL PAGE pink ECG grid background on Page 2 (ECG graphs page)
-        if canvas.getPageNumber() == 2:  # Changed from 3 to 2
-            page_width, page_height = canvas._pagesize
-            
-            # Fill entire page with pink background
-            canvas.setFillColor(colors.HexColor("#ffe6e6"))
-            canvas.rect(0, 0, page_width, page_height, fill=1, stroke=0)
-            
-            # ECG grid colors - darker for better visibility
-            light_grid_color = colors.HexColor("#ffd1d1")  
-            
-            major_grid_color = colors.HexColor("#ffb3b3")   
-            
-            # Draw minor grid lines (1mm spacing) - 59 boxes complete (0 to 295mm)
-            canvas.setStrokeColor(light_grid_color)
-            canvas.setLineWidth(0.6)
-            
-            minor_spacing = 1 * mm
-            
-            # Vertical minor lines - Draw up to 295mm (includes 295mm line)
-            max_x_limit = 59 * 5 * mm  # 295mm = right edge of 59th box
-            x = 0
-            while x <= max_x_limit:  # Draw lines 0 to 295mm (complete 59 boxes)
-                canvas.line(x, 0, x, page_height)
-                x += minor_spacing
-                if x > max_x_limit:  # Stop immediately after 295mm
-                    break
-            
-            # Horizontal minor lines - full page
-            y = 0
-            while y <= page_height:
-                canvas.line(0, y, page_width, y)
-                y += minor_spacing
-                
-            
-            # Draw major grid lines - FULL PAGE
-            # IMPORTANT: Match waveform calculation: height/3 = 15.0 points per box
-            # For individual lead graphs: ecg_height = 45 points, so 15 points = 1 box
-            canvas.setStrokeColor(major_grid_color)
-            canvas.setLineWidth(1.2)
-            
-            # Use standard ECG paper spacing: 5mm per box
-            # 5mm = 5 * 2.834645669 points = 14.17 points per box
-            from reportlab.lib.units import mm
-            major_spacing = 5 * mm  # Standard ECG: 5mm = 14.17 points per box
-            
-            # Vertical major lines - Draw 60 lines (0, 5, 10...295mm) for 59 complete boxes
-            max_x_limit = 59 * 5 * mm  # 295mm = right edge of 59th box
-            x = 0
-            while x <= max_x_limit:  # Include 295mm line (completes 59 boxes)
-                canvas.line(x, 0, x, page_height)
-                x += major_spacing
-                if x > max_x_limit:  # Stop after 295mm
-                    break
-            
-            # Horizontal major lines - STRICT: Only up to 295mm width (not full page_width)
-            y = 0
-            while y <= page_height:
-                canvas.line(0, y, max_x_limit, y)  # End at 295mm (not page_width) ✅
-                y += major_spacing
-            
-
-        
-        # STEP 1.5: Draw Org. and Phone No. labels on Page 1 (TOP LEFT)
-        if canvas.getPageNumber() == 1:
-            canvas.saveState()
-            
-            # Position in top-left corner (below margin)
-            x_pos = doc.leftMargin  # 30 points from left
-            y_pos = doc.height + doc.bottomMargin - 5  # 20 points from top
-            
-            # Always draw "Org." label with value
-            canvas.setFont("Helvetica-Bold", 10)
-            canvas.setFillColor(colors.black)
-            org_label = "Org:"
-            canvas.drawString(x_pos, y_pos, org_label)
-            
-            # Calculate width of label and add small gap
-            org_label_width = canvas.stringWidth(org_label, "Helvetica-Bold", 10)
-            canvas.setFont("Helvetica", 10)
-            canvas.drawString(x_pos + org_label_width + 5, y_pos, patient.get("Org.", "") if patient else "")
-            
-            y_pos -= 15  # Move down for next line
-            
-            # Always draw "Phone No." label with value
-            canvas.setFont("Helvetica-Bold", 10)
-            canvas.setFillColor(colors.black)
-            phone_label = "Phone No:"
-            canvas.drawString(x_pos, y_pos, phone_label)
-            
-            # Calculate width of label and add small gap
-            phone_label_width = canvas.stringWidth(phone_label, "Helvetica-Bold", 10)
-            canvas.setFont("Helvetica", 10)
-            canvas.drawString(x_pos + phone_label_width + 5, y_pos, patient.get("doctor_mobile", "") if patient else "")
-            
-            canvas.restoreState()
-        
-        # STEP 2: Draw logo on all pages (existing code)
-        # Prefer PNG (ReportLab-friendly); fallback to WebP if PNG missing
-        # Use resource_path helper for PyInstaller compatibility
-        png_path = _get_resource_path("assets/Deckmountimg.png")
-        webp_path = _get_resource_path("assets/Deckmount.webp")
-        logo_path = png_path if os.path.exists(png_path) else webp_path
-
-        if os.path.exists(logo_path):
-            canvas.saveState()
-            # Different positioning for different pages
-            if canvas.getPageNumber() == 2:
-                logo_w, logo_h = 120, 40  # bigger size for ECG page
-                # SHIFTED LEFT FROM RIGHT TOP CORNER
-                page_width, page_height = canvas._pagesize
-                x = page_width - logo_w - 35  # Shifted 50 pixels left from right edge
-                y = page_height - logo_h  # Top edge touch
-            else:
-                logo_w, logo_h = 120, 40  # normal size for other pages
-                x = doc.width + doc.leftMargin - logo_w
-                y = doc.height + doc.bottomMargin - logo_h  # top positioning
-            try:
-                canvas.drawImage(logo_path, x, y, width=logo_w, height=logo_h, preserveAspectRatio=True, mask='auto')
-            except Exception:
-                # If WebP unsupported, silently skip
-                pass
-            canvas.restoreState()
-        
-        # STEP 3: Add footer with company address on all pages
-        canvas.saveState()
-        canvas.setFont("Helvetica", 8)
-        canvas.setFillColor(colors.black)  # Ensure text is black on pink background
-        footer_text = "Deckmount Electronic , Plot No. 260, Phase IV, Udyog Vihar, Sector 18, Gurugram, Haryana 122015"
-        # Center the footer text at bottom of page
-        text_width = canvas.stringWidth(footer_text, "Helvetica", 8)
-        x = (doc.width + doc.leftMargin + doc.rightMargin - text_width) / 2
-        y = 5  # Shifted down 5 points from 10 to 5  # 20 points from bottom
-        canvas.drawString(x, y, footer_text)
-        canvas.restoreState()
-
     # Save parameters to a JSON index for later reuse
     try:
-        from datetime import datetime
         base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
         reports_dir = os.path.join(base_dir, 'reports')
         os.makedirs(reports_dir, exist_ok=True)
@@ -3668,7 +2939,6 @@ def generate_6_2_ecg_report(filename="ecg_report.pdf", data=None, lead_images=No
     
     # Upload to cloud if configured
     try:
-        import sys
         sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
         from utils.cloud_uploader import get_cloud_uploader
         